@@ -0,0 +1,151 @@
+import random
+
+# Synthetic sources for benchmarks, built from units that together cover
+# every lexical category: keywords, identifiers, every operator and
+# punctuator, signed and fractional numbers, char literals with escapes,
+# long strings with escapes, and // and /* */ comments.
+#
+# With parseable=True the sources parse and type check cleanly. Otherwise
+# each method also uses the operators the grammar has no rule for
+# ('++', '--', '::') or that the semantic checks reject ('!=', '&'), so
+# lexing sees every operator.
+
+# the lexer closes a string at '\\"' once whitespace is dropped, so an
+# escaped backslash is never placed right before a quote
+STRING_PIECES = [
+    "text",
+    "with",
+    "spaces",
+    '\\"quoted\\"',
+    "back\\\\slash",
+    "\\n",
+    "\\t",
+    "tab",
+]
+CHAR_LITERALS = ["'a'", "'Z'", "'\\n'", "'\\t'", "'\\\\'", "'0'"]
+
+
+def string_literal(rng: random.Random) -> str:
+    pieces = [rng.choice(STRING_PIECES) for _ in range(rng.randint(4, 24))]
+    return '"' + " ".join(pieces) + '"'
+
+
+def interface_unit(index: int) -> str:
+    return (
+        f"interface Shape{index} {{\n"
+        f"    int function area{index}(int side, float scale);\n"
+        f"}}\n\n"
+    )
+
+
+def class_unit(index: int, rng: random.Random, parseable: bool) -> str:
+    extras = (
+        ""
+        if parseable
+        else (
+            f"        total++;\n"
+            f"        total--;\n"
+            f"        done = total != 4;\n"
+            f"        declare int* where = &total;\n"
+            f"        *where = total;\n"
+            f"        Shape{index} :: area{index};\n"
+        )
+    )
+    return (
+        f"/* Box{index} keeps a few fields\n"
+        f"   of every data type */\n"
+        f"class Box{index} implements Shape{index} {{\n"
+        f"    public declare int count = {rng.randint(0, 999)};\n"
+        f"    private declare float ratio = +{rng.randint(0, 99)}.{rng.randint(0, 9)};\n"
+        f"    protected declare bool ready = true;\n"
+        f"    public declare string label = {string_literal(rng)};\n"
+        f"    public declare char mark = {rng.choice(CHAR_LITERALS)};\n"
+        f"    public declare int[] values = [1, 2, 3];\n"
+        f"    public static declare float scale = .{rng.randint(1, 99)};\n"
+        f"\n"
+        f"    constructor() {{\n"
+        f"        declare int start = 0;\n"
+        f"    }}\n"
+        f"\n"
+        f"    public int function area{index}(int side, float scale) {{\n"
+        f"        // locals of every type\n"
+        f"        declare int total = side * {rng.randint(1, 9)} + -{rng.randint(1, 9)} % 7 - side / 2;\n"
+        f"        declare float part = .45 + scale * +5.6 - {rng.randint(0, 9)}.25 / 2.0;\n"
+        f"        declare bool done = !(total < 10) && part >= 1.0 || !(total == 4);\n"
+        f"        declare string note = {string_literal(rng)};\n"
+        f"        declare char first = {rng.choice(CHAR_LITERALS)};\n"
+        f"        declare int[][] grid = [[1, 2], [3, 4]];\n"
+        f"        declare int[][][] cube = [[[1, 2], [3, 4]], [[5, 6], [7, 8]]];\n"
+        f"        total += grid[0][1];\n"
+        f"        total -= 1;\n"
+        f"        total *= 2;\n"
+        f"        total /= 3;\n"
+        f"        total %= 5;\n"
+        f"        note += {string_literal(rng)};\n"
+        f"{extras}"
+        f"        while (total > 0 && done == false) {{\n"
+        f"            total = total - 1;\n"
+        f"            if (total <= 3) {{\n"
+        f"                break;\n"
+        f"            }} else {{\n"
+        f"                continue;\n"
+        f"            }}\n"
+        f"        }}\n"
+        f"        for (declare int i = 0; i < {rng.randint(2, 9)}; i += 1) {{\n"
+        f"            part = part + i;\n"
+        f"        }}\n"
+        f"        return total + this->count + grid[1][0] + cube[1][0][1];\n"
+        f"    }}\n"
+        f"}}\n\n"
+    )
+
+
+def main_unit(count: int) -> str:
+    calls = "".join(
+        f"        declare Box{index} box{index} = makeObj Box{index}();\n"
+        f"        declare int result{index} = box{index}.area{index}(3, 1.5);\n"
+        for index in range(min(count, 16))
+    )
+    return f"class Program {{\n    mainEntry() {{\n{calls}    }}\n}}\n"
+
+
+def generate_source(size: int, seed: int = 0, parseable: bool = False) -> str:
+    # roughly `size` characters: as many units as fit, then the main class
+    rng = random.Random(seed)
+    units = []
+    length = 0
+    index = 0
+    while length < size or index == 0:
+        unit = interface_unit(index) + class_unit(index, rng, parseable)
+        units.append(unit)
+        length += len(unit)
+        index += 1
+    units.append(main_unit(index))
+    return "".join(units)
+
+
+def expression_source(size: int, seed: int = 0) -> str:
+    # roughly `size` characters of one method that is almost all arithmetic
+    # and boolean expressions; it parses and type checks cleanly
+    rng = random.Random(seed)
+    lines = [
+        "        declare int a = 7;\n",
+        "        declare int b = 3;\n",
+        "        declare bool done = false;\n",
+    ]
+    length = 0
+    index = 0
+    while length < size or index == 0:
+        x, y = rng.choice("ab"), rng.choice("ab")
+        line = (
+            f"        declare int v{index} = ({x} * {rng.randint(1, 9)} + {y} / 2"
+            f" - {x} % 5) * ({y} + {rng.randint(1, 99)}) - {x} * {y};\n"
+            f"        done = !({x} < {y}) && {x} >= {rng.randint(0, 9)}"
+            f" || {y} * 2 == {x} + 1 && !done;\n"
+        )
+        lines.append(line)
+        length += len(line)
+        index += 1
+    return (
+        "class Program {\n    mainEntry() {\n" + "".join(lines) + "    }\n}\n"
+    )
@@ -0,0 +1,63 @@
+from benchmarks.corpus import generate_source
+from lexer.lexer import Lexer
+from tabulate import tabulate
+import gc
+import os
+import sys
+import time
+
+# Compares Lexer.tokenize with tokenize_parallel, which makes Tokens, and
+# tokenize_parallel_stream, which keeps the workers' columns as they are, for
+# 1 worker and for one worker per CPU. Speedups need more than one CPU; with
+# one, the table shows the cost of the split and the merge.
+#
+#   python -m benchmarks.lexer_parallel [size_mb] [seed]
+
+REPEAT = 3
+
+
+def best_time(run) -> float:
+    best = None
+    for _ in range(REPEAT):
+        gc.collect()
+        start_time = time.perf_counter()
+        result = run()
+        elapsed = time.perf_counter() - start_time
+        best = elapsed if best is None else min(best, elapsed)
+        del result
+    return best
+
+
+def main():
+    size_mb = float(sys.argv[1]) if len(sys.argv) > 1 else 2
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+    source_code = generate_source(int(size_mb * 2**20), seed)
+
+    tokens = Lexer(source_code, engine="regex").tokenize()
+    if Lexer(source_code, engine="regex").tokenize_parallel() != tokens:
+        raise AssertionError("tokenize_parallel differs from tokenize")
+
+    sequential = best_time(lambda: Lexer(source_code, engine="regex").tokenize())
+    rows = [("tokenize", 1, round(sequential, 3), 1.0)]
+    for workers in sorted({1, os.cpu_count() or 1}):
+        for method in ["tokenize_parallel", "tokenize_parallel_stream"]:
+            elapsed = best_time(
+                lambda: getattr(Lexer(source_code, engine="regex"), method)(workers)
+            )
+            rows.append((method, workers, round(elapsed, 3), round(sequential / elapsed, 2)))
+
+    print(
+        f"corpus: {len(source_code)} chars, {len(tokens)} tokens, "
+        f"{os.cpu_count()} CPUs, best of {REPEAT}"
+    )
+    print(
+        tabulate(
+            rows,
+            headers=["Method", "Workers", "Seconds", "Speedup"],
+            tablefmt="orgtbl",
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
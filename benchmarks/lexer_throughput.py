@@ -0,0 +1,128 @@
+from benchmarks.corpus import generate_source
+from lexer.lexer import ENGINES, Lexer
+from lexer.numpy_scanner import HAS_NUMPY
+from tabulate import tabulate
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+# Times Lexer.tokenize for every engine on a synthetic corpus and saves the
+# results as JSON in benchmarks/results/, named after the current commit so
+# runs on different commits can be compared.
+#
+#   python -m benchmarks.lexer_throughput [size_mb] [output_json] [seed]
+
+REPEAT = 3
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+
+def current_commit() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def time_tokenize(source_code: str, engine: str):
+    # best of REPEAT runs, untraced, as tracemalloc slows allocation down
+    best = None
+    for _ in range(REPEAT):
+        gc.collect()
+        start_time = time.perf_counter()
+        tokens = Lexer(source_code, engine=engine).tokenize()
+        elapsed = time.perf_counter() - start_time
+        best = elapsed if best is None else min(best, elapsed)
+        token_count = len(tokens)
+        del tokens
+    return token_count, best
+
+
+def peak_memory(source_code: str, engine: str) -> int:
+    gc.collect()
+    tracemalloc.start()
+    tokens = Lexer(source_code, engine=engine).tokenize()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tokens
+    return peak
+
+
+def main():
+    size_mb = float(sys.argv[1]) if len(sys.argv) > 1 else 1
+    commit = current_commit()
+    output_file = (
+        sys.argv[2]
+        if len(sys.argv) > 2
+        else os.path.join(RESULTS_DIR, f"lexer_throughput-{commit or 'unknown'}.json")
+    )
+    seed = int(sys.argv[3]) if len(sys.argv) > 3 else 0
+
+    source_code = generate_source(int(size_mb * 2**20), seed)
+    source_mb = len(source_code.encode("utf-8")) / 2**20
+
+    results = []
+    for engine in ENGINES:
+        if engine == "numpy" and not HAS_NUMPY:
+            continue
+        token_count, elapsed = time_tokenize(source_code, engine)
+        results.append(
+            {
+                "engine": engine,
+                "tokens": token_count,
+                "seconds": elapsed,
+                "tokens_per_second": token_count / elapsed,
+                "mb_per_second": source_mb / elapsed,
+                "peak_mb": peak_memory(source_code, engine) / 2**20,
+            }
+        )
+
+    print(f"corpus: {len(source_code)} chars, {source_mb:.2f} MB, seed {seed}")
+    print(
+        tabulate(
+            [
+                (
+                    result["engine"],
+                    result["tokens"],
+                    round(result["seconds"], 3),
+                    round(result["tokens_per_second"]),
+                    round(result["mb_per_second"], 2),
+                    round(result["peak_mb"], 2),
+                )
+                for result in results
+            ],
+            headers=["Engine", "Tokens", "Seconds", "Tokens/s", "MB/s", "Peak MB"],
+            tablefmt="orgtbl",
+        )
+    )
+
+    os.makedirs(os.path.dirname(output_file) or ".", exist_ok=True)
+    with open(output_file, "w") as file:
+        json.dump(
+            {
+                "commit": commit,
+                "python": platform.python_version(),
+                "seed": seed,
+                "source_chars": len(source_code),
+                "source_mb": source_mb,
+                "repeat": REPEAT,
+                "results": results,
+            },
+            file,
+            indent=2,
+        )
+    print(f"saved to {output_file}")
+
+
+if __name__ == "__main__":
+    main()
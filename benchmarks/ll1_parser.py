@@ -0,0 +1,129 @@
+from benchmarks.corpus import generate_source
+from lexer.lexer import Lexer
+from parser.ll1 import DefinitionHooks, LL1Parser
+from parser.parser import Parser
+from tabulate import tabulate
+import contextlib
+import glob
+import io
+import os
+import random
+import sys
+import time
+
+# Checks that LL1Parser builds the same tree and prints the same output as
+# Parser on tests/*.txt, on generated sources and on token lists with a few
+# tokens dropped, repeated or replaced, which exercise the syntax errors, and
+# times both on the sources. LL1Parser only fills the definition table, so an
+# input Parser rejects with a semantic error is not compared. Raises an
+# AssertionError on any difference.
+#
+#   python -m benchmarks.ll1_parser [size_kb] [sources] [mutations]
+
+TESTS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "tests")
+
+
+def parse_tokens(parser_class, lexer: Lexer, tokens, **options):
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        parser = parser_class(tokens, lexer.interner, lexer.line_index, **options)
+        start_time = time.perf_counter()
+        tree = parser.parse()
+        elapsed = time.perf_counter() - start_time
+    return tree, output.getvalue(), elapsed
+
+
+def parse(parser_class, source_code: str, **options):
+    lexer = Lexer(source_code)
+    return parse_tokens(parser_class, lexer, lexer.tokenize(), **options)
+
+
+def same_parse(parsed, ll1_parsed) -> bool:
+    tree, output, _ = parsed
+    ll1_tree, ll1_output, _ = ll1_parsed
+    return output == ll1_output and (
+        tree.jsonify() == ll1_tree.jsonify()
+        if tree is not None and ll1_tree is not None
+        else tree is ll1_tree
+    )
+
+
+def mutate(tokens, rng: random.Random):
+    # drops, repeats or replaces a few tokens, keeping the EOF marker last
+    tokens = tokens[:-1]
+    for _ in range(rng.randint(1, 3)):
+        index = rng.randrange(len(tokens))
+        operation = rng.random()
+        if operation < 0.4:
+            del tokens[index]
+        elif operation < 0.7:
+            tokens.insert(index, tokens[rng.randrange(len(tokens))])
+        else:
+            tokens[index] = tokens[rng.randrange(len(tokens))]
+    return tokens + [Lexer("").tokenize()[-1]]
+
+
+def main():
+    size_kb = float(sys.argv[1]) if len(sys.argv) > 1 else 64
+    source_count = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    mutation_count = int(sys.argv[3]) if len(sys.argv) > 3 else 200
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 10000))
+
+    sources = {}
+    for path in sorted(glob.glob(os.path.join(TESTS_DIR, "*.txt"))):
+        with open(path) as file:
+            sources[os.path.basename(path)] = file.read()
+    for seed in range(source_count):
+        sources[f"generated, seed {seed}"] = generate_source(
+            int(size_kb * 1024), seed, parseable=True
+        )
+
+    rows = []
+    differences = []
+    for name, source_code in sources.items():
+        parsed = parse(Parser, source_code)
+        if parsed[1].startswith("Semantic error"):
+            rows.append((name, "not compared, semantic error", "", ""))
+            continue
+        ll1_parsed = parse(LL1Parser, source_code, hooks=DefinitionHooks())
+        same = same_parse(parsed, ll1_parsed)
+        if not same:
+            differences.append(name)
+        rows.append(
+            (
+                name,
+                "same" if same else "DIFFERENT",
+                round(parsed[2], 3),
+                round(ll1_parsed[2], 3),
+            )
+        )
+
+    rng = random.Random(0)
+    lexer = Lexer(generate_source(4096, 0, parseable=True))
+    tokens = lexer.tokenize()
+    compared = 0
+    for mutation in range(mutation_count):
+        mutated = mutate(tokens, rng)
+        parsed = parse_tokens(Parser, lexer, mutated)
+        if parsed[1].startswith("Semantic error"):
+            continue
+        compared += 1
+        ll1_parsed = parse_tokens(LL1Parser, lexer, mutated, hooks=DefinitionHooks())
+        if not same_parse(parsed, ll1_parsed):
+            differences.append(f"mutation {mutation}")
+    rows.append((f"{compared} of {mutation_count} mutations", "", "", ""))
+
+    print(
+        tabulate(
+            rows,
+            headers=["Source", "Tree and output", "Parser s", "LL1Parser s"],
+            tablefmt="orgtbl",
+        )
+    )
+    if differences:
+        raise AssertionError(
+            f"LL1Parser parsed differently from Parser: {', '.join(differences)}"
+        )
+
+if __name__ == "__main__":
+    main()
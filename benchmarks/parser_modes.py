@@ -0,0 +1,92 @@
+from benchmarks.corpus import generate_source
+from lexer.lexer import Lexer
+from parser.parser import PARSE_MODES, Parser
+from tabulate import tabulate
+import contextlib
+import gc
+import io
+import sys
+import time
+import tracemalloc
+
+# Parses one large source in each Parser mode and compares the time, the
+# allocations (memory still held once parse returns, and the peak) and the
+# garbage collections run during the parse. "check" runs the same checks as
+# "cst" without building the tree; "arena" builds the same tree in a
+# TreeArena, which is checked first.
+#
+#   python -m benchmarks.parser_modes [size_kb] [repeat]
+
+
+def parse(tokens, mode: str):
+    with contextlib.redirect_stdout(io.StringIO()):
+        parser = Parser(tokens, mode=mode)
+        tree = parser.parse()
+    return parser, tree
+
+
+def time_parse(tokens, mode: str, repeat: int):
+    best = collections = None
+    for _ in range(repeat):
+        gc.collect()
+        collected = sum(stats["collections"] for stats in gc.get_stats())
+        start_time = time.perf_counter()
+        result = parse(tokens, mode)
+        elapsed = time.perf_counter() - start_time
+        collected = sum(stats["collections"] for stats in gc.get_stats()) - collected
+        del result
+        if best is None or elapsed < best:
+            best, collections = elapsed, collected
+    return best, collections
+
+
+def measure_memory(tokens, mode: str):
+    gc.collect()
+    tracemalloc.start()
+    result = parse(tokens, mode)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current, peak
+
+
+def main():
+    size_kb = float(sys.argv[1]) if len(sys.argv) > 1 else 512
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 10000))
+
+    source_code = generate_source(int(size_kb * 1024), parseable=True)
+    tokens = Lexer(source_code).tokenize()
+    _, tree = parse(tokens, "cst")
+    _, arena_tree = parse(tokens, "arena")
+    if arena_tree.jsonify() != tree.jsonify():
+        raise AssertionError("arena mode built a different tree from cst mode")
+    del tree, arena_tree
+
+    rows = []
+    for mode in PARSE_MODES:
+        elapsed, collections = time_parse(tokens, mode, repeat)
+        current, peak = measure_memory(tokens, mode)
+        rows.append(
+            (
+                mode,
+                round(elapsed, 3),
+                round(len(tokens) / elapsed),
+                round(current / 2**20, 2),
+                round(peak / 2**20, 2),
+                collections,
+            )
+        )
+
+    print(f"source: {len(source_code)} chars, {len(tokens)} tokens, best of {repeat}")
+    print(
+        tabulate(
+            rows,
+            headers=["Mode", "Seconds", "Tokens/s", "Held MB", "Peak MB", "GC runs"],
+            tablefmt="orgtbl",
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+from benchmarks.corpus import expression_source
+from lexer.lexer import Lexer
+from lexer.token import Token
+from lexer.token_type import TokenType as tt
+from parser.parser import EXPRESSION_ENGINES, Parser
+from parser.token_sets import FIRST_EXPRESSION, token_types
+from tabulate import tabulate
+import contextlib
+import gc
+import io
+import sys
+import time
+import timeit
+
+# Times the prediction test parse_expression makes, FIRST(expression), as
+# the set literal the parser used to build on every call, as a frozenset and
+# as the kind-bit mask it uses now; then times Parser on a source that is
+# almost all expressions, where every token passes through several of these
+# tests.
+#
+#   python -m benchmarks.parser_predictions [size_kb] [repeat]
+
+TESTS = {
+    "set literal": (
+        "parser.curr_token.token_type in {tt.THIS, tt.SUPER, tt.IDENTIFIER, "
+        "tt.INTEGER_LITERAL, tt.FLOAT_LITERAL, tt.BOOL_LITERAL, "
+        "tt.CHAR_LITERAL, tt.STRING_LITERAL, tt.ROUND_BRACKET_OPEN, "
+        "tt.NOT_OPERATOR, tt.POINTER_MULTIPLY}"
+    ),
+    "frozenset": "parser.curr_token.token_type in first_expression",
+    "kind bit mask": "parser.curr_bit & FIRST_EXPRESSION",
+}
+TEST_NUMBER = 1_000_000
+
+
+def time_tests():
+    parser = Parser([Token(tt.SEMICOLON, ";", 1)])
+    names = {
+        "parser": parser,
+        "tt": tt,
+        "first_expression": frozenset(token_types(FIRST_EXPRESSION)),
+        "FIRST_EXPRESSION": FIRST_EXPRESSION,
+    }
+    return [
+        (name, timeit.timeit(test, globals=names, number=TEST_NUMBER) / TEST_NUMBER)
+        for name, test in TESTS.items()
+    ]
+
+
+def time_parse(tokens, engine: str, repeat: int) -> float:
+    best = None
+    for _ in range(repeat):
+        gc.collect()
+        with contextlib.redirect_stdout(io.StringIO()):
+            start_time = time.perf_counter()
+            Parser(tokens, expressions=engine).parse()
+            elapsed = time.perf_counter() - start_time
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    size_kb = float(sys.argv[1]) if len(sys.argv) > 1 else 256
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 10000))
+
+    print(
+        tabulate(
+            [(name, round(seconds * 1e9, 1)) for name, seconds in time_tests()],
+            headers=["FIRST(expression) test", "ns per test"],
+            tablefmt="orgtbl",
+        )
+    )
+    print()
+
+    source_code = expression_source(int(size_kb * 1024))
+    tokens = Lexer(source_code).tokenize()
+    rows = []
+    for engine in EXPRESSION_ENGINES:
+        elapsed = time_parse(tokens, engine, repeat)
+        rows.append(
+            (engine, len(tokens), round(elapsed, 3), round(len(tokens) / elapsed))
+        )
+    print(f"expression source: {len(source_code)} chars, best of {repeat}")
+    print(
+        tabulate(
+            rows,
+            headers=["Expressions", "Tokens", "Seconds", "Tokens/s"],
+            tablefmt="orgtbl",
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
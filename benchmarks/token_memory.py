@@ -0,0 +1,82 @@
+from lexer.lexer import Lexer
+from parser.parser import Parser
+from tabulate import tabulate
+import contextlib
+import gc
+import io
+import sys
+import time
+import tracemalloc
+
+# Compares the memory held by List[Token] from Lexer.tokenize against the
+# array-backed TokenStream from Lexer.tokenize_stream, after checking that
+# Parser, sharing the lexer's interner, parses both the same way.
+#
+#   python -m benchmarks.token_memory [repeat] [source_file]
+
+
+def measure(build):
+    gc.collect()
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    tokens = build()
+    elapsed = time.perf_counter() - start_time
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return tokens, current, peak, elapsed
+
+
+def parse(source_code: str, stream: bool):
+    lexer = Lexer(source_code)
+    tokens = lexer.tokenize_stream() if stream else lexer.tokenize()
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        parser = Parser(tokens, lexer.interner)
+        tree = parser.parse()
+    return (
+        output.getvalue(),
+        tree.jsonify() if tree is not None else None,
+        parser.get_all_symbol_tables(),
+    )
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    source_file = sys.argv[2] if len(sys.argv) > 2 else "./tests/test7.txt"
+
+    with open(source_file) as file:
+        source_code = file.read()
+    if parse(source_code, stream=True) != parse(source_code, stream=False):
+        raise AssertionError("Parser parsed the TokenStream differently")
+    source_code *= repeat
+
+    rows = []
+    for name, build in [
+        ("List[Token]", lambda: Lexer(source_code, engine="regex").tokenize()),
+        ("TokenStream", lambda: Lexer(source_code).tokenize_stream()),
+    ]:
+        tokens, current, peak, elapsed = measure(build)
+        rows.append(
+            (
+                name,
+                len(tokens),
+                round(current / 2**20, 2),
+                round(peak / 2**20, 2),
+                round(current / len(tokens), 1),
+                round(elapsed, 3),
+            )
+        )
+        del tokens
+
+    print(f"source: {source_file} x {repeat} ({len(source_code)} chars)")
+    print(
+        tabulate(
+            rows,
+            headers=["Container", "Tokens", "Held MB", "Peak MB", "Bytes/Token", "Seconds"],
+            tablefmt="orgtbl",
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
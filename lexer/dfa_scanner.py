@@ -0,0 +1,64 @@
+from lexer.dfa_tables import SKIP, DFATables, load_tables
+from lexer.lexer_rules import SIGNED_NUMBER_PREV_TYPES, cached_token_type
+from lexer.regex_scanner import LITERAL_WHITESPACE, Lexeme
+from lexer.token_type import TokenType as tt
+from typing import Dict, Iterator
+
+
+class DFAScanner:
+    def __init__(self, source_code: str, tables: DFATables | None = None) -> None:
+        self.source_code: str = source_code
+        self.tables: DFATables = tables if tables is not None else load_tables()
+        self.type_cache: Dict[str, tt] = {}
+
+    def token_type_of(self, word: str) -> tt:
+        return cached_token_type(word, self.type_cache)
+
+    def iter_lexemes(self) -> Iterator[Lexeme]:
+        tables = self.tables
+        transitions = tables.transitions
+        class_count = tables.class_count
+        class_map = tables.class_map
+        actions = tables.actions
+        types = tables.types
+        literals = tables.literals
+        retracts = tables.retracts
+        start, signed_start = tables.starts
+        source = self.source_code
+        length = len(source)
+
+        position = 0
+        line = 1
+        prev_token_type = None
+        while position < length:
+            state = signed_start if prev_token_type in SIGNED_NUMBER_PREV_TYPES else start
+            index = position
+            accepted = -1
+            accepted_end = position
+            while index < length:
+                char_class = class_map.get(source[index])
+                if char_class is None:
+                    char_class = tables.char_class(source[index])
+                state = transitions[state * class_count + char_class]
+                if state < 0:
+                    break
+                index += 1
+                if actions[state]:
+                    accepted = state
+                    accepted_end = index
+
+            end = accepted_end - retracts[accepted]
+            if actions[accepted] == SKIP:
+                line += source.count("\n", position, end)
+            else:
+                word = source[position:end]
+                if literals[accepted]:
+                    word = word.translate(LITERAL_WHITESPACE)
+                token_type = types[accepted]
+                if token_type is None:
+                    token_type = self.token_type_of(word)
+                prev_token_type = token_type
+                yield token_type, word, position, end, line
+            position = end
+
+        yield tt.EOF_MARKER, "", length, length, line
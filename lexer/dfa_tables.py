@@ -0,0 +1,307 @@
+from lexer.lexer_rules import (
+    ALL_RULES,
+    OPERATORS,
+    PUNCTUATORS,
+    rules_fingerprint,
+    special_characters,
+)
+from lexer.pickle_cache import load_pickled
+from lexer.regex_scanner import BREAK_CHARS
+from lexer.token_type import TokenType as tt
+from typing import Dict, List, Tuple
+import os
+
+# Bump when the generator below changes in a way rules_fingerprint() cannot
+# see.
+TABLE_VERSION = 1
+CACHE_DIR = os.path.join(os.path.dirname(__file__), "__pycache__")
+
+# accept actions
+REJECT = 0
+EMIT = 1
+SKIP = 2
+
+# Stand-ins for everything outside ASCII, which only matters to the lexer as
+# "a digit" (str.isdigit) or "some other word character".
+UNICODE_DIGIT = "٣"
+UNICODE_OTHER = "é"
+ALPHABET = [chr(code) for code in range(128)] + [UNICODE_DIGIT, UNICODE_OTHER]
+
+SYMBOLS = PUNCTUATORS | OPERATORS
+WORD_KEYWORDS = [word for word in ALL_RULES if word.isidentifier()] + ["true", "false"]
+KEYWORD_PREFIXES = {word[:i] for word in WORD_KEYWORDS for i in range(1, len(word) + 1)}
+SYMBOL_PREFIXES = {symbol[:i] for symbol in SYMBOLS for i in range(1, len(symbol) + 1)}
+
+State = Tuple
+
+
+class DFATables:
+    def __init__(
+        self,
+        class_map: Dict[str, int],
+        class_count: int,
+        transitions: List[int],
+        actions: List[int],
+        types: List[tt | None],
+        literals: List[bool],
+        retracts: List[int],
+        starts: Tuple[int, int],
+    ) -> None:
+        # transitions[state * class_count + char_class] is the next state, or
+        # -1 when the current lexeme cannot be extended
+        self.class_map = class_map
+        self.class_count = class_count
+        self.transitions = transitions
+        self.actions = actions
+        # None means the lexeme is classified by ALL_RULES/match_token_type
+        self.types = types
+        self.literals = literals
+        self.retracts = retracts
+        # start states for when a signed number can and cannot begin
+        self.starts = starts
+
+    def char_class(self, char: str) -> int:
+        char_class = self.class_map.get(char)
+        if char_class is None:
+            stand_in = UNICODE_DIGIT if char.isdigit() else UNICODE_OTHER
+            char_class = self.class_map[char] = self.class_map[stand_in]
+        return char_class
+
+
+def is_word_char(char: str) -> bool:
+    return char not in " \t\n'\"" and char not in BREAK_CHARS
+
+
+def word_kind(kind: str, char: str) -> str:
+    if kind == "ident" and (char.isascii() and (char.isalnum() or char == "_")):
+        return "ident"
+    if kind in ["digits", "udigits"] and char.isdigit():
+        return "digits" if kind == "digits" and char.isascii() else "udigits"
+    return "other"
+
+
+def first_word_kind(char: str) -> str:
+    if char.isascii() and (char.isalpha() or char == "_"):
+        return "ident"
+    if char.isdigit():
+        return "digits" if char.isascii() else "udigits"
+    return "other"
+
+
+def step(state: State, char: str) -> State | None:
+    name = state[0]
+
+    if name == "start":
+        signed = state[1]
+        if char in " \t\n":
+            return ("space",)
+        if char == '"':
+            return ("string", 0, False)
+        if char == "'":
+            return ("char", "open", False)
+        if char in SYMBOLS:
+            return ("symbol", char, signed)
+        if char in SYMBOL_PREFIXES:
+            # '|' and ':' only form '||' and '::' at the start of a lexeme
+            return ("symbol_word", char)
+        if is_word_char(char):
+            prefix = char if char in KEYWORD_PREFIXES else None
+            return ("word", first_word_kind(char), prefix)
+        return None
+
+    if name == "space":
+        return ("space",) if char in " \t\n" else None
+
+    if name == "line_comment":
+        return ("line_comment",) if char != "\n" else None
+
+    if name == "block_comment":
+        return ("block_comment_end",) if char == "/" else ("block_comment",)
+
+    if name == "string":
+        backslashes, has_dot = state[1], state[2]
+        if char == "\n":
+            return None
+        if char in " \t":
+            return state
+        if char == "\\":
+            return ("string", min(backslashes + 1, 2), has_dot)
+        if char == '"':
+            if backslashes == 1:
+                return ("string", 0, has_dot)
+            return ("string_closed", has_dot)
+        return ("string", 0, has_dot or char == ".")
+
+    if name == "string_closed":
+        # a '.' and a digit after a closed string reopen it
+        if not state[1] and char == ".":
+            return ("string_dot",)
+        return None
+
+    if name == "string_dot":
+        return ("string", 0, True) if char.isdigit() else None
+
+    if name == "char":
+        phase, has_dot = state[1], state[2]
+        if phase in ["closed", "dot", "dot_digit"]:
+            if phase == "closed" and not has_dot and char == ".":
+                return ("char", "dot", False)
+            if phase == "dot" and char.isdigit():
+                # keeps the '.', leaves the digit for the next lexeme
+                return ("char", "dot_digit", True)
+            return None
+        if char == "\n":
+            return None
+        if char in " \t":
+            return state
+        has_dot = has_dot or char == "."
+        if phase == "open":
+            if char == "'":
+                return ("char", "closed", has_dot)
+            return ("char", "escape" if char == "\\" else "one", has_dot)
+        if phase == "escape" and char in special_characters and char != "'":
+            return ("char", "escaped", has_dot)
+        return ("char", "closed", has_dot)
+
+    if name == "symbol":
+        symbol, signed = state[1], state[2]
+        if symbol == "/" and char == "/":
+            return ("line_comment",)
+        if symbol == "/" and char == "*":
+            return ("block_comment",)
+        if symbol + char in SYMBOL_PREFIXES:
+            return ("symbol", symbol + char, signed)
+        if symbol == "." and char.isdigit():
+            return ("tail",)
+        if char == "." and symbol != ".":
+            return ("word_dot",)
+        if signed and symbol in ["+", "-"] and char.isdigit():
+            return ("signed_word", first_word_kind(char))
+        return None
+
+    if name == "symbol_word":
+        if char == state[1]:
+            return ("symbol", char + char, False)
+        return step(("word", "other", None), char)
+
+    if name == "word":
+        kind, prefix = state[1], state[2]
+        if char == ".":
+            if kind in ["digits", "udigits"]:
+                return ("tail",)
+            if kind == "ident" and prefix not in ["true", "false"]:
+                return None
+            return ("word_dot",)
+        if not is_word_char(char):
+            return None
+        if prefix is not None and prefix + char in KEYWORD_PREFIXES:
+            return ("word", word_kind(kind, char), prefix + char)
+        return ("word", word_kind(kind, char), None)
+
+    if name == "signed_word":
+        kind = state[1]
+        if char == ".":
+            return ("tail",) if kind in ["digits", "udigits"] else ("word_dot",)
+        if not is_word_char(char):
+            return None
+        return ("signed_word", word_kind(kind, char))
+
+    if name == "word_dot":
+        return ("tail",) if char.isdigit() else None
+
+    if name == "tail":
+        return ("tail",) if is_word_char(char) else None
+
+    return None
+
+
+def accept(state: State) -> Tuple[int, tt | None, bool, int]:
+    # (action, token type, is literal, characters to give back)
+    name = state[0]
+    if name in ["space", "line_comment", "block_comment", "block_comment_end"]:
+        return SKIP, None, False, 0
+    if name in ["start", "string_dot", "word_dot"]:
+        return REJECT, None, False, 0
+    if name == "string":
+        return EMIT, None, True, 0
+    if name == "string_closed":
+        return EMIT, tt.STRING_LITERAL, True, 0
+    if name == "char":
+        if state[1] == "dot":
+            return REJECT, None, False, 0
+        return EMIT, None, True, 1 if state[1] == "dot_digit" else 0
+    if name == "symbol":
+        return EMIT, SYMBOLS[state[1]], False, 0
+    if name == "symbol_word":
+        return EMIT, tt.INVALID_LEXEME, False, 0
+    if name == "word":
+        kind, prefix = state[1], state[2]
+        if kind == "ident":
+            if prefix in ["true", "false"]:
+                return EMIT, tt.BOOL_LITERAL, False, 0
+            return EMIT, ALL_RULES.get(prefix, tt.IDENTIFIER), False, 0
+        if kind == "digits":
+            return EMIT, tt.INTEGER_LITERAL, False, 0
+        if kind == "other":
+            return EMIT, tt.INVALID_LEXEME, False, 0
+        return EMIT, None, False, 0
+    if name == "signed_word":
+        return EMIT, tt.INTEGER_LITERAL if state[1] == "digits" else None, False, 0
+    return EMIT, None, False, 0
+
+
+def build_tables() -> DFATables:
+    start_states = [("start", False), ("start", True)]
+    numbers: Dict[State, int] = {}
+    order: List[State] = []
+    for state in start_states:
+        numbers[state] = len(order)
+        order.append(state)
+
+    rows: List[List[int]] = []
+    index = 0
+    while index < len(order):
+        row = []
+        for char in ALPHABET:
+            target = step(order[index], char)
+            if target is None:
+                row.append(-1)
+                continue
+            if target not in numbers:
+                numbers[target] = len(order)
+                order.append(target)
+            row.append(numbers[target])
+        rows.append(row)
+        index += 1
+
+    # characters with identical columns share a class
+    columns: Dict[Tuple[int, ...], int] = {}
+    class_map: Dict[str, int] = {}
+    for position, char in enumerate(ALPHABET):
+        column = tuple(row[position] for row in rows)
+        class_map[char] = columns.setdefault(column, len(columns))
+
+    class_count = len(columns)
+    transitions = [-1] * (len(order) * class_count)
+    for column, char_class in columns.items():
+        for state, target in enumerate(column):
+            transitions[state * class_count + char_class] = target
+
+    accepts = [accept(state) for state in order]
+    return DFATables(
+        class_map,
+        class_count,
+        transitions,
+        [action for action, _, _, _ in accepts],
+        [token_type for _, token_type, _, _ in accepts],
+        [literal for _, _, literal, _ in accepts],
+        [retract for _, _, _, retract in accepts],
+        (numbers[start_states[0]], numbers[start_states[1]]),
+    )
+
+
+def load_tables(cache_dir: str = CACHE_DIR) -> DFATables:
+    path = os.path.join(
+        cache_dir, f"lexer_dfa-{rules_fingerprint()}-v{TABLE_VERSION}.pickle"
+    )
+    return load_pickled(path, build_tables)
@@ -0,0 +1,25 @@
+from typing import Dict, List
+
+
+class Interner:
+    # Maps each distinct identifier to a small int ID, and back. Tokens hold
+    # the interned string, so repeated names share one object.
+    def __init__(self) -> None:
+        self.ids: Dict[str, int] = {}
+        self.names: List[str] = []
+
+    def intern(self, name: str) -> int:
+        symbol_id = self.ids.get(name)
+        if symbol_id is None:
+            symbol_id = self.ids[name] = len(self.names)
+            self.names.append(name)
+        return symbol_id
+
+    def lookup(self, name: str) -> int | None:
+        return self.ids.get(name)
+
+    def name_of(self, symbol_id: int) -> str:
+        return self.names[symbol_id]
+
+    def __len__(self) -> int:
+        return len(self.names)
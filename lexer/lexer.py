@@ -5,18 +5,58 @@ from lexer.lexer_rules import (
     match_token_type,
     special_characters,
 )
+from lexer.dfa_scanner import DFAScanner
+from lexer.interner import Interner
+from lexer.line_index import LineIndex
+from lexer.line_memo import LineMemo
+from lexer.numpy_scanner import NumpyScanner
+from lexer.literals import LITERAL_TYPES, decode_literal
+from lexer.parallel import (
+    MIN_CHUNK_SIZE,
+    tokenize_parallel,
+    tokenize_parallel_stream,
+)
+from lexer.regex_scanner import (
+    CHUNK_SIZE,
+    LOOKAHEAD,
+    BytesScanner,
+    Lexeme,
+    RegexScanner,
+    StreamScanner,
+)
 from lexer.token import Token
+from lexer.token_cache import TokenCache
+from lexer.token_pieces import TokenPieces
+from lexer.token_stream import TOKEN_TYPES, TokenStream
 from lexer.token_type import TokenType as tt
-from typing import List
+from typing import Iterator, List, TextIO
+import mmap
+
+ENGINES = ["char", "regex", "dfa", "numpy"]
 
 
 class Lexer:
-    def __init__(self, source_code: str) -> None:
+    def __init__(
+        self,
+        source_code: str = "",
+        engine: str = "char",
+        interner: Interner | None = None,
+        decode_literals: bool = False,
+    ) -> None:
+        if engine not in ENGINES:
+            raise ValueError(f"unknown lexer engine '{engine}', expected one of {ENGINES}")
         self.source_code: str = source_code
+        self.engine: str = engine
+        self.path: str | None = None
         self.position: int = 0
         self.current_line: int = 1
         self.temp_word: str = ""
+        self.word_start: int = 0
         self.token_list: List[Token] = []
+        self.interner: Interner = interner if interner is not None else Interner()
+        self.decode_literals: bool = decode_literals
+        self.source_lines: LineIndex | None = None
+        self.line_memo: LineMemo | None = None
 
     @property
     def current_char(self) -> str:
@@ -157,9 +197,287 @@ class Lexer:
         token_type = ALL_RULES.get(self.temp_word)
         if token_type is None:
             token_type = match_token_type(self.temp_word)
-        return Token(token_type, self.temp_word, self.current_line)
+        return self.make_token(
+            token_type,
+            self.temp_word,
+            self.current_line,
+            self.word_start,
+            self.position,
+        )
+
+    def make_token(
+        self,
+        token_type: tt,
+        value: str,
+        line_number: int,
+        start: int | None = None,
+        end: int | None = None,
+    ) -> Token:
+        token = Token(token_type, value, line_number, start=start, end=end)
+        if token_type == tt.IDENTIFIER:
+            token.symbol_id = self.interner.intern(value)
+            token.value = self.interner.names[token.symbol_id]
+        elif self.decode_literals and token_type in LITERAL_TYPES:
+            token.literal_value = decode_literal(token_type, value)
+        return token
+
+    @property
+    def line_index(self) -> LineIndex:
+        # built on first use, so lexing itself never pays for columns
+        if self.source_lines is None:
+            source = self.map_source() if self.path is not None else self.source_code
+            self.source_lines = LineIndex(source)
+        return self.source_lines
+
+    @classmethod
+    def from_path(
+        cls,
+        path: str,
+        interner: Interner | None = None,
+        decode_literals: bool = False,
+    ) -> "Lexer":
+        # Lexes the file's UTF-8 bytes in place through mmap instead of
+        # reading it into a str first. Token offsets are byte offsets.
+        lexer = cls(engine="regex", interner=interner, decode_literals=decode_literals)
+        lexer.path = path
+        return lexer
+
+    def map_source(self) -> bytes | mmap.mmap:
+        with open(self.path, "rb") as file:
+            try:
+                return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # empty files cannot be mapped
+                return b""
+
+    def iter_path_lexemes(self) -> Iterator[Lexeme]:
+        source = self.map_source()
+        try:
+            yield from BytesScanner(source).iter_lexemes()
+        finally:
+            if isinstance(source, mmap.mmap):
+                source.close()
+
+    def iter_tokens(
+        self, file: TextIO | None = None, chunk_size: int = CHUNK_SIZE
+    ) -> Iterator[Token]:
+        # Yields the same tokens as tokenize() without building token_list,
+        # reading `file` chunk by chunk when one is given.
+        if file is not None:
+            lexemes = StreamScanner(file, chunk_size).iter_lexemes()
+        elif self.path is not None:
+            lexemes = self.iter_path_lexemes()
+        else:
+            lexemes = RegexScanner(self.source_code).iter_lexemes()
+        return (
+            self.make_token(token_type, value, line_number, start, end)
+            for token_type, value, start, end, line_number in lexemes
+        )
+
+    def tokenize_stream(self) -> TokenStream:
+        if self.path is not None:
+            # the stream keeps the mapping open to slice values out of it
+            source = self.map_source()
+            scanner = BytesScanner(source)
+        else:
+            source = self.source_code
+            scanner = RegexScanner(source)
+        stream = TokenStream(source)
+        for token_type, _, start, end, line_number in scanner.iter_lexemes():
+            stream.append(token_type, start, end, line_number)
+        return stream
+
+    def collect_lexemes(self, lexemes: Iterator[Lexeme]) -> List[Token]:
+        self.token_list = [
+            self.make_token(token_type, value, line_number, start, end)
+            for token_type, value, start, end, line_number in lexemes
+        ]
+        return self.token_list
+
+    def relex(
+        self,
+        previous_tokens: List[Token] | TokenPieces,
+        edit_start: int,
+        edit_end: int,
+        new_text: str,
+    ) -> TokenPieces:
+        # previous_tokens must be the tokens of self.source_code; the edit
+        # replaces source_code[edit_start:edit_end] with new_text. A list is
+        # wrapped in TokenPieces once; pass the returned TokenPieces to the
+        # next relex, which edits it in place without touching the tokens
+        # after the edit until they are read. The Token objects are shared,
+        # not copied: kept tokens after the edit get their start, end and
+        # line_number shifted in place, so a list passed in no longer
+        # describes the old source once its tokens have been read back.
+        if self.path is not None:
+            raise ValueError("relex needs the source in memory, not a path")
+        source = self.source_code
+        if not 0 <= edit_start <= edit_end <= len(source):
+            raise ValueError(
+                f"edit range {edit_start}:{edit_end} is outside the source "
+                f"of length {len(source)}"
+            )
+
+        if not isinstance(previous_tokens, TokenPieces):
+            previous_tokens = TokenPieces(previous_tokens)
+        tokens = previous_tokens
+
+        new_source = source[:edit_start] + new_text + source[edit_end:]
+        shift = len(new_text) - (edit_end - edit_start)
+
+        # Tokens whose lookahead ends before the edit are kept. Scanning
+        # restarts right after the last of them, which is never inside a
+        # comment or a literal.
+        kept = tokens.index_of_end(edit_start - LOOKAHEAD, after=True)
+        scanner = RegexScanner(new_source)
+        if kept:
+            last_kept = tokens[kept - 1]
+            scanner.position = last_kept.end
+            scanner.current_line = last_kept.line_number
+            scanner.prev_token_type = last_kept.token_type
+
+        # Once a lexeme past the edit ends where an old token of the same
+        # type and value ended, the scanner is back in the old state and
+        # every token after it is unchanged.
+        unedited = edit_start + len(new_text)
+        new_tokens = []
+        for token_type, value, start, end, line_number in scanner.iter_lexemes():
+            if start >= unedited:
+                # EOF_MARKER is the only empty token and can share its end
+                # with the last real one
+                if token_type == tt.EOF_MARKER:
+                    index = len(tokens) - 1
+                else:
+                    index = max(tokens.index_of_end(end - shift), kept)
+                if index < len(tokens):
+                    token = tokens[index]
+                    if (
+                        token.end == end - shift
+                        and token.token_type == token_type
+                        and token.value == value
+                    ):
+                        break
+            new_tokens.append(
+                self.make_token(token_type, value, line_number, start, end)
+            )
+
+        tokens.replace(kept, index, new_tokens, shift, line_number - token.line_number)
+        self.source_code = new_source
+        self.source_lines = None
+        return tokens
+
+    def tokenize_parallel(
+        self, workers: int | None = None, min_chunk_size: int = MIN_CHUNK_SIZE
+    ) -> List[Token]:
+        # Same tokens as tokenize(), with chunks of lines lexed on a process
+        # pool. The char engine's chunks are lexed by the regex engine, which
+        # gives the same tokens.
+        if self.path is not None:
+            raise ValueError("tokenize_parallel needs the source in memory, not a path")
+        self.token_list = tokenize_parallel(
+            self.source_code, self.engine, workers, min_chunk_size, self.make_token
+        )
+        return self.token_list
+
+    def tokenize_parallel_stream(
+        self, workers: int | None = None, min_chunk_size: int = MIN_CHUNK_SIZE
+    ) -> TokenStream:
+        # tokenize_parallel without making a Token per lexeme
+        if self.path is not None:
+            raise ValueError(
+                "tokenize_parallel_stream needs the source in memory, not a path"
+            )
+        return tokenize_parallel_stream(
+            self.source_code, self.engine, workers, min_chunk_size
+        )
+
+    def tokenize_memoized(self, memo: LineMemo | None = None) -> List[Token]:
+        # Same tokens as tokenize(), reusing the lexemes of lines seen before
+        # in this source or, when `memo` is shared, in earlier ones. A line
+        # that starts inside a comment is looked up from where it closes.
+        if self.path is not None:
+            raise ValueError("tokenize_memoized needs the source in memory, not a path")
+        self.line_memo = memo if memo is not None else LineMemo()
+        self.token_list = []
+        prev_token_type = None
+        in_comment = False
+        offset = 0
+        for line_number, text in enumerate(self.source_code.split("\n"), 1):
+            start = 0
+            if in_comment:
+                close = text.find("/")
+                if close == -1:
+                    offset += len(text) + 1
+                    continue
+                start = close + 1
+            lexemes, in_comment = self.line_memo.lexemes(text[start:], prev_token_type)
+            start += offset
+            for token_type, value, token_start, token_end in lexemes:
+                self.token_list.append(
+                    self.make_token(
+                        token_type,
+                        value,
+                        line_number,
+                        start + token_start,
+                        start + token_end,
+                    )
+                )
+            if lexemes:
+                prev_token_type = lexemes[-1][0]
+            offset += len(text) + 1
+
+        end = len(self.source_code)
+        self.token_list.append(
+            Token(tt.EOF_MARKER, "", line_number, start=end, end=end)
+        )
+        return self.token_list
+
+    def tokenize_cached(self, cache: TokenCache) -> List[Token]:
+        # Same tokens as tokenize(), loaded from `cache` when this source
+        # was lexed before with the same lexer_rules.
+        source = self.map_source() if self.path is not None else self.source_code
+        try:
+            stream = cache.load(source)
+            if stream is None:
+                tokens = self.tokenize()
+                stream = TokenStream(source)
+                for token in tokens:
+                    stream.append(
+                        token.token_type, token.start, token.end, token.line_number
+                    )
+                cache.store(stream)
+                return tokens
+
+            self.token_list = [
+                self.make_token(
+                    TOKEN_TYPES[stream.kinds[index]],
+                    stream.value_at(index),
+                    stream.lines[index],
+                    stream.starts[index],
+                    stream.ends[index],
+                )
+                for index in range(len(stream))
+            ]
+            return self.token_list
+        finally:
+            # the tokens hold their values, so the mapping is not needed
+            if isinstance(source, mmap.mmap):
+                source.close()
 
     def tokenize(self) -> List[Token]:
+        if self.path is not None:
+            self.token_list = list(self.iter_tokens())
+            return self.token_list
+
+        if self.engine == "regex":
+            return self.collect_lexemes(RegexScanner(self.source_code).iter_lexemes())
+
+        if self.engine == "dfa":
+            return self.collect_lexemes(DFAScanner(self.source_code).iter_lexemes())
+
+        if self.engine == "numpy":
+            return self.collect_lexemes(NumpyScanner(self.source_code).iter_lexemes())
+
         while not self.is_finished:
             if not self.should_ignore and self.should_break():
                 self.token_list.append(self.generate_token())
@@ -173,6 +491,8 @@ class Lexer:
                 "\n",
                 "\t",
             ]:
+                if not self.temp_word:
+                    self.word_start = self.position
                 self.temp_word += self.current_char
 
             self.advance()
@@ -186,6 +506,14 @@ class Lexer:
         if self.temp_word:
             self.token_list.append(self.generate_token())
 
-        self.token_list.append(Token(tt.EOF_MARKER, "", self.current_line))
+        self.token_list.append(
+            Token(
+                tt.EOF_MARKER,
+                "",
+                self.current_line,
+                start=self.position,
+                end=self.position,
+            )
+        )
 
         return self.token_list
@@ -1,4 +1,6 @@
 from lexer.token_type import TokenType as tt
+from typing import Dict
+import hashlib
 import re
 
 KEYWORDS = {
@@ -83,27 +85,54 @@ PUNCTUATORS = {
 
 ALL_RULES = KEYWORDS | DATATYPES | OOP_KEYWORDS | OPERATORS | PUNCTUATORS
 
+# a '+' or '-' after one of these starts a signed number literal
+SIGNED_NUMBER_PREV_TYPES = {
+    tt.ASSIGNMENT_OPERATOR,
+    tt.COMP_ASSIGNMENT_OPERATOR,
+    *OPERATORS.values(),
+}
+
+
+BOOL_LITERAL_PATTERN = re.compile(r"^(true|false)$")
+IDENTIFIER_PATTERN = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
+INTEGER_LITERAL_PATTERN = re.compile(r"^[-+]?[0-9]+$")
+FLOAT_LITERAL_PATTERN = re.compile(r"^[+-]?(?:\d+\.\d*|\.\d+)(?:[eE][+-]?\d+)?$")
+STRING_LITERAL_PATTERN = re.compile(r'^".*"$')
+CHAR_LITERAL_PATTERN = re.compile(r"^'.{0,2}'")
+
 
 def match_token_type(token_str: str):
-    if re.match(r"^(true|false)$", token_str):
+    if BOOL_LITERAL_PATTERN.match(token_str):
         return tt.BOOL_LITERAL
-    elif re.match(r"^[a-zA-Z_][a-zA-Z0-9_]*$", token_str):
+    elif IDENTIFIER_PATTERN.match(token_str):
         return tt.IDENTIFIER
-    elif re.match(r"^[-+]?[0-9]+$", token_str):
+    elif INTEGER_LITERAL_PATTERN.match(token_str):
         return tt.INTEGER_LITERAL
-    elif re.match(r"^[+-]?(?:\d+\.\d*|\.\d+)(?:[eE][+-]?\d+)?$", token_str):
+    elif FLOAT_LITERAL_PATTERN.match(token_str):
         return tt.FLOAT_LITERAL
-    elif re.match(r'^".*"$', token_str):
+    elif STRING_LITERAL_PATTERN.match(token_str):
         if not token_str.endswith(r"\""):
             return tt.STRING_LITERAL
         elif token_str.endswith(r'\\"'):
             return tt.STRING_LITERAL
 
-    elif re.match(r"^'.{0,2}'", token_str):
+    elif CHAR_LITERAL_PATTERN.match(token_str):
         return tt.CHAR_LITERAL
     return tt.INVALID_LEXEME
 
 
+def cached_token_type(word: str, type_cache: Dict[str, tt]) -> tt:
+    # the scanners' word lookup: ALL_RULES, then match_token_type, with each
+    # word's type kept in the scanner's type_cache
+    token_type = type_cache.get(word)
+    if token_type is None:
+        token_type = ALL_RULES.get(word)
+        if token_type is None:
+            token_type = match_token_type(word)
+        type_cache[word] = token_type
+    return token_type
+
+
 special_characters = [
     "n",  # Newline
     "r",  # Carriage Return
@@ -111,3 +140,25 @@ special_characters = [
     "\\",  # Backslash
     "'",  # Single Quote
 ]
+
+
+def rules_fingerprint() -> str:
+    # changes whenever anything that decides how source text is tokenized
+    # does, for caches of lexer output
+    rules = [
+        sorted((word, token_type.name) for word, token_type in ALL_RULES.items()),
+        [(token_type.name, token_type.value) for token_type in tt],
+        [
+            pattern.pattern
+            for pattern in [
+                BOOL_LITERAL_PATTERN,
+                IDENTIFIER_PATTERN,
+                INTEGER_LITERAL_PATTERN,
+                FLOAT_LITERAL_PATTERN,
+                STRING_LITERAL_PATTERN,
+                CHAR_LITERAL_PATTERN,
+            ]
+        ],
+        special_characters,
+    ]
+    return hashlib.sha256(repr(rules).encode()).hexdigest()[:16]
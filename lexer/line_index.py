@@ -0,0 +1,39 @@
+from bisect import bisect_right
+from typing import List, Tuple
+import mmap
+import re
+
+NEWLINE_PATTERN = re.compile("\n")
+# bytes come straight from the file, so they follow open()'s universal newlines
+BYTES_NEWLINE_PATTERN = re.compile(rb"\r\n?|\n")
+
+
+class LineIndex:
+    # Maps source offsets to 1-based (line, column) pairs. The line starts
+    # are only collected the first time a position is asked for.
+    def __init__(self, source_code: str | bytes | mmap.mmap) -> None:
+        self.source_code: str | bytes | mmap.mmap = source_code
+        self.line_starts: List[int] | None = None
+
+    def build(self) -> List[int]:
+        pattern = (
+            NEWLINE_PATTERN if isinstance(self.source_code, str) else BYTES_NEWLINE_PATTERN
+        )
+        self.line_starts = [0]
+        self.line_starts.extend(
+            match.end() for match in pattern.finditer(self.source_code)
+        )
+        return self.line_starts
+
+    def position(self, offset: int) -> Tuple[int, int]:
+        line_starts = self.line_starts
+        if line_starts is None:
+            line_starts = self.build()
+        line = bisect_right(line_starts, offset)
+        return line, offset - line_starts[line - 1] + 1
+
+    def line_start(self, line_number: int) -> int:
+        line_starts = self.line_starts
+        if line_starts is None:
+            line_starts = self.build()
+        return line_starts[line_number - 1]
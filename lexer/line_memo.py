@@ -0,0 +1,63 @@
+from lexer.regex_scanner import RegexScanner, ends_in_comment
+from lexer.token_type import TokenType as tt
+from typing import Dict, List, Tuple
+
+# (token type, value, start, end) with offsets relative to the line
+LineLexeme = Tuple[tt, str, int, int]
+
+
+class LineMemo:
+    # Caches the lexemes of lines that start outside a comment, keyed by
+    # their text. Such a line lexes the same wherever it appears, unless its
+    # first lexeme starts with a sign, which may form a signed number
+    # depending on the previous line's last token; those lines are always
+    # scanned.
+    def __init__(self) -> None:
+        self.lines: Dict[str, Tuple[List[LineLexeme], bool]] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+        self.uncacheable: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def scan(
+        self, text: str, prev_token_type: tt | None
+    ) -> Tuple[List[LineLexeme], bool]:
+        # the lexemes of `text`, which has no '\n', and whether it ends
+        # inside a /* comment
+        scanner = RegexScanner(text)
+        scanner.prev_token_type = prev_token_type
+        lexemes = [
+            (token_type, value, start, end)
+            for token_type, value, start, end, _ in scanner.iter_lexemes()
+        ][:-1]
+        return lexemes, "/*" in text and ends_in_comment(text)
+
+    def lexemes(
+        self, text: str, prev_token_type: tt | None
+    ) -> Tuple[List[LineLexeme], bool]:
+        entry = self.lines.get(text)
+        if entry is not None:
+            self.hits += 1
+            return entry
+
+        entry = self.scan(text, prev_token_type)
+        lexemes = entry[0]
+        if lexemes and lexemes[0][1][0] in "+-":
+            self.uncacheable += 1
+        else:
+            self.misses += 1
+            self.lines[text] = entry
+        return entry
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "uncacheable": self.uncacheable,
+            "hit_rate": self.hit_rate,
+            "cached_lines": len(self.lines),
+        }
@@ -0,0 +1,39 @@
+from lexer.lexer_rules import special_characters
+from lexer.token_type import TokenType as tt
+import re
+
+CONTROL_CHARACTERS = {"n": "\n", "r": "\r", "t": "\t"}
+# escape letter -> character, for the escapes special_characters allows; a
+# string literal can also hold an escaped '"'
+CHAR_ESCAPES = {char: CONTROL_CHARACTERS.get(char, char) for char in special_characters}
+STRING_ESCAPES = CHAR_ESCAPES | {'"': '"'}
+ESCAPE_PATTERN = re.compile(r"\\(.)")
+
+LITERAL_TYPES = {
+    tt.INTEGER_LITERAL,
+    tt.FLOAT_LITERAL,
+    tt.CHAR_LITERAL,
+    tt.STRING_LITERAL,
+}
+
+
+def unescape(text: str, escapes: dict) -> str:
+    if "\\" not in text:
+        return text
+    # unknown escapes are kept as written
+    return ESCAPE_PATTERN.sub(
+        lambda match: escapes.get(match.group(1), match.group()), text
+    )
+
+
+def decode_literal(token_type: tt, value: str) -> int | float | str:
+    if token_type == tt.INTEGER_LITERAL:
+        return int(value)
+    if token_type == tt.FLOAT_LITERAL:
+        return float(value)
+    if token_type == tt.CHAR_LITERAL:
+        # a char literal may be followed by a '.', e.g. `'a'.`
+        return unescape(value[1 : value.rindex("'")], CHAR_ESCAPES)
+    if token_type == tt.STRING_LITERAL:
+        return unescape(value[1:-1], STRING_ESCAPES)
+    raise ValueError(f"{token_type.name} is not a literal token type")
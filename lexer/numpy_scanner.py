@@ -0,0 +1,159 @@
+from lexer.lexer_rules import OPERATORS, PUNCTUATORS
+from lexer.regex_scanner import BREAK_CHARS, Lexeme, RegexScanner
+from lexer.token_type import TokenType as tt
+from typing import Iterator, List, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+HAS_NUMPY = np is not None
+
+# character classes, with every non-ASCII character counted as WORD
+SPACE = 0
+WORD = 1
+SYMBOL = 2
+QUOTE = 3
+CLASS_TABLE = [WORD] * 129
+for char in " \t\n":
+    CLASS_TABLE[ord(char)] = SPACE
+for char in BREAK_CHARS:
+    CLASS_TABLE[ord(char)] = SYMBOL
+for char in "\"'":
+    CLASS_TABLE[ord(char)] = QUOTE
+
+# '||' and '::' start with WORD characters and are left to the slow path
+SYMBOL_PAIRS = [
+    symbol
+    for symbol in PUNCTUATORS | OPERATORS
+    if len(symbol) == 2 and all(char in BREAK_CHARS for char in symbol)
+]
+PAIR_SHIFT = 21
+PAIR_CODES = [(ord(first) << PAIR_SHIFT) | ord(second) for first, second in SYMBOL_PAIRS]
+
+# segment actions
+SKIP = 0
+EMIT = 1
+SLOW = 2
+
+
+class NumpyScanner(RegexScanner):
+    # Classifies every character of the source in one vectorized pass and
+    # cuts it into segments: whitespace runs, word runs and operators. The
+    # Python loop then emits a segment that starts where the previous lexeme
+    # ended directly, and only scans the ambiguous ones (strings, chars,
+    # comments, '.' joins, signs before digits, '||', '::') with the regex
+    # scanner's rules. Line numbers are looked up from a cumulative newline
+    # count at the end.
+    def __init__(self, source_code: str) -> None:
+        if np is None:
+            raise ImportError("the numpy lexer engine requires NumPy")
+        super().__init__(source_code)
+
+    def codes(self):
+        source = self.source_code
+        if source.isascii():
+            return np.frombuffer(source.encode("ascii"), dtype=np.uint8)
+        return np.frombuffer(source.encode("utf-32-le"), dtype=np.uint32)
+
+    def segments(self, codes) -> Tuple[List[int], List[int], List[int]]:
+        length = len(codes)
+        classes = np.array(CLASS_TABLE, dtype=np.uint8)[np.minimum(codes, 128)]
+        # two zeros past the end stand in for the characters after the source
+        padded = np.concatenate([codes, np.zeros(2, dtype=codes.dtype)])
+
+        pairs = np.isin(
+            (codes[:-1].astype(np.int64) << PAIR_SHIFT) | codes[1:], PAIR_CODES
+        )
+        boundary = np.ones(length, dtype=bool)
+        boundary[1:] = (classes[1:] != classes[:-1]) | (classes[1:] >= SYMBOL)
+        # the second character of an operator pair stays in its segment
+        boundary[1:] &= ~pairs
+
+        starts = np.flatnonzero(boundary)
+        ends = np.append(starts[1:], length)
+        kinds = classes[starts]
+        first = padded[starts]
+        second = padded[starts + 1]
+        after = padded[ends]
+        after_is_digit = ((after >= ord("0")) & (after <= ord("9"))) | (after > 127)
+
+        slow = (
+            (kinds == QUOTE)
+            | ((kinds != SPACE) & (after == ord(".")))
+            | ((kinds == WORD) & np.isin(first, [ord("|"), ord(":")]))
+            | ((kinds == SYMBOL) & (ends - starts > 2))
+            | ((first == ord("/")) & np.isin(second, [ord("/"), ord("*")]))
+            | (
+                (ends - starts == 1)
+                & np.isin(first, [ord("+"), ord("-"), ord(".")])
+                & after_is_digit
+            )
+        )
+        actions = np.where(slow, SLOW, np.where(kinds == SPACE, SKIP, EMIT))
+        return starts.tolist(), ends.tolist(), actions.tolist()
+
+    def scan_lexeme(self, position: int) -> Tuple[str | None, int]:
+        # the regex scanner's rules for the lexeme at `position`, or None
+        # for whitespace and comments
+        lexeme = self.master_pattern.match(self.source_code, position)
+        kind = lexeme.lastgroup
+        end = lexeme.end()
+        if kind == "whitespace" or kind == "comment":
+            return None, end
+        if kind == "string":
+            word, end, _ = self.scan_string('"', position + 1)
+            return word, end
+        if kind == "char":
+            return self.scan_char(position)
+        if kind == "operator":
+            return self.scan_operator(lexeme.group(), end)
+        return self.scan_word_tail(lexeme.group(), end)
+
+    def iter_lexemes(self) -> Iterator[Lexeme]:
+        source = self.source_code
+        length = len(source)
+        codes = self.codes()
+        starts, ends, actions = self.segments(codes)
+        starts.append(length)
+        type_cache = self.type_cache
+
+        token_types: List[tt] = []
+        values: List[str] = []
+        token_starts: List[int] = []
+        token_ends: List[int] = []
+        position = 0
+        index = 0
+        while position < length:
+            while starts[index] < position:
+                index += 1
+            if starts[index] == position and actions[index] != SLOW:
+                end = ends[index]
+                if actions[index] == SKIP:
+                    position = end
+                    continue
+                word = source[position:end]
+            else:
+                word, end = self.scan_lexeme(position)
+                if word is None:
+                    position = end
+                    continue
+
+            token_type = type_cache.get(word)
+            if token_type is None:
+                token_type = self.token_type_of(word)
+            self.prev_token_type = token_type
+            token_types.append(token_type)
+            values.append(word)
+            token_starts.append(position)
+            token_ends.append(end)
+            position = end
+
+        newlines = np.cumsum(codes == ord("\n"))
+        # a lexeme never starts on a newline, so the count up to its start
+        # is the count before it
+        lines = (newlines[np.array(token_starts, dtype=np.intp)] + 1).tolist()
+        yield from zip(token_types, values, token_starts, token_ends, lines)
+        line = int(newlines[-1]) + 1 if length else 1
+        yield tt.EOF_MARKER, "", length, length, line
@@ -0,0 +1,165 @@
+from concurrent.futures import ProcessPoolExecutor
+from lexer.dfa_scanner import DFAScanner
+from lexer.regex_scanner import RegexScanner, ends_in_comment
+from lexer.token import Token
+from lexer.token_stream import TOKEN_TYPES, TokenStream
+from lexer.token_type import TokenType as tt
+from array import array
+from typing import Callable, Iterable, List, Tuple
+import os
+import re
+
+MIN_CHUNK_SIZE = 256 * 1024
+CHUNKS_PER_WORKER = 2
+
+# A chunk may start on a line whose first character cannot be a sign, so
+# its first token does not depend on the previous chunk's last token type,
+# and cannot be a comment, which could hide one.
+SAFE_LINE_START = re.compile(r"[ \t]*[^ \t\n+\-/]")
+
+# kinds, starts, ends and lines of a chunk's tokens
+ChunkColumns = Tuple[array, array, array, array]
+
+
+class CommentPrescan:
+    # Tracks whether line starts fall inside a /* */ comment, lexing only the
+    # lines that contain '/*'. String and char literals end at a newline, so
+    # a comment is the only state that can carry over to the next line.
+    def __init__(self, source_code: str) -> None:
+        self.source_code: str = source_code
+        self.position: int = 0
+        self.in_comment: bool = False
+
+    def in_comment_at(self, line_start: int) -> bool:
+        source = self.source_code
+        while self.position < line_start:
+            if self.in_comment:
+                close = source.find("/", self.position, line_start)
+                if close == -1:
+                    self.position = line_start
+                    break
+                self.position = close + 1
+                self.in_comment = False
+                continue
+
+            opening = source.find("/*", self.position, line_start)
+            if opening == -1:
+                self.position = line_start
+                break
+            line_end = source.find("\n", opening)
+            self.in_comment = ends_in_comment(source[self.position : line_end])
+            self.position = line_end + 1
+        return self.in_comment
+
+
+def split_points(source_code: str, chunk_count: int) -> List[int]:
+    points = [0]
+    prescan = CommentPrescan(source_code)
+    for chunk in range(1, chunk_count):
+        target = max(len(source_code) * chunk // chunk_count, points[-1])
+        while True:
+            newline = source_code.find("\n", target)
+            if newline == -1:
+                return points
+            target = newline + 1
+            if SAFE_LINE_START.match(source_code, target) and not prescan.in_comment_at(
+                target
+            ):
+                points.append(target)
+                break
+    return points
+
+
+def lex_chunk(
+    chunk: str, engine: str, offset: int = 0, line_offset: int = 0
+) -> ChunkColumns:
+    # Lexes one chunk into the columns of a TokenStream, with offsets and
+    # lines already made absolute, so the parent only concatenates them.
+    # Values are sliced back out of the source, so they are not sent back.
+    scanner = DFAScanner(chunk) if engine == "dfa" else RegexScanner(chunk)
+    kinds = array("B")
+    starts = array("I")
+    ends = array("I")
+    lines = array("I")
+    add_kind, add_start, add_end, add_line = (
+        kinds.append,
+        starts.append,
+        ends.append,
+        lines.append,
+    )
+    for token_type, _, start, end, line_number in scanner.iter_lexemes():
+        add_kind(token_type.value)
+        add_start(start + offset)
+        add_end(end + offset)
+        add_line(line_number + line_offset)
+    # every chunk ends in an EOF_MARKER, only the source's last one is kept
+    for column in [kinds, starts, ends, lines]:
+        column.pop()
+    return kinds, starts, ends, lines
+
+
+def tokenize_parallel_stream(
+    source_code: str,
+    engine: str = "regex",
+    workers: int | None = None,
+    min_chunk_size: int = MIN_CHUNK_SIZE,
+) -> TokenStream:
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+
+    chunk_count = min(workers * CHUNKS_PER_WORKER, len(source_code) // min_chunk_size)
+    points = split_points(source_code, max(chunk_count, 1))
+    ends = points[1:] + [len(source_code)]
+    chunks = [source_code[start:end] for start, end in zip(points, ends)]
+    line_offsets = []
+    line_offset = 0
+    for start, end in zip(points, ends):
+        line_offsets.append(line_offset)
+        line_offset += source_code.count("\n", start, end)
+
+    stream = TokenStream(source_code)
+    columns = [stream.kinds, stream.starts, stream.ends, stream.lines]
+
+    def add_chunks(results: Iterable[ChunkColumns]):
+        for chunk_columns in results:
+            for column, chunk_column in zip(columns, chunk_columns):
+                column.extend(chunk_column)
+
+    engines = [engine] * len(chunks)
+    if len(chunks) == 1 or workers == 1:
+        add_chunks(map(lex_chunk, chunks, engines, points, line_offsets))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            add_chunks(executor.map(lex_chunk, chunks, engines, points, line_offsets))
+
+    end = len(source_code)
+    stream.append(tt.EOF_MARKER, end, end, line_offset + 1)
+    return stream
+
+
+def tokenize_parallel(
+    source_code: str,
+    engine: str = "regex",
+    workers: int | None = None,
+    min_chunk_size: int = MIN_CHUNK_SIZE,
+    make_token: Callable[..., Token] = Token,
+) -> List[Token]:
+    stream = tokenize_parallel_stream(source_code, engine, workers, min_chunk_size)
+    kinds, starts, ends, lines = stream.kinds, stream.starts, stream.ends, stream.lines
+    # tokens are made here, in source order, so identifiers are interned
+    # in the same order as by tokenize()
+    tokens = [
+        make_token(
+            TOKEN_TYPES[kinds[index]],
+            stream.value_at(index),
+            lines[index],
+            starts[index],
+            ends[index],
+        )
+        for index in range(len(stream) - 1)
+    ]
+    end = len(source_code)
+    tokens.append(Token(tt.EOF_MARKER, "", lines[-1], start=end, end=end))
+    return tokens
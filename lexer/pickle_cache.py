@@ -0,0 +1,35 @@
+from typing import Callable, Dict, TypeVar
+import os
+import pickle
+
+T = TypeVar("T")
+
+# tables loaded in this process, by path
+loaded: Dict[str, object] = {}
+
+
+def load_pickled(path: str, build: Callable[[], T]) -> T:
+    # Loads the object pickled at path, or builds it with build() and
+    # pickles it there for the next run. Paths should name everything the
+    # object depends on, as a stale file is never rebuilt.
+    cached = loaded.get(path)
+    if cached is not None:
+        return cached
+
+    try:
+        with open(path, "rb") as file:
+            cached = pickle.load(file)
+    except Exception:
+        # a missing, truncated or incompatible file: unpickling can raise
+        # nearly anything, and rebuilding is always safe
+        cached = build()
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as file:
+                pickle.dump(cached, file)
+        except OSError:
+            # a read-only install still works, it just rebuilds every run
+            pass
+
+    loaded[path] = cached
+    return cached
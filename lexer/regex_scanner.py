@@ -0,0 +1,374 @@
+from lexer.lexer_rules import (
+    PUNCTUATORS,
+    OPERATORS,
+    SIGNED_NUMBER_PREV_TYPES,
+    cached_token_type,
+    match_token_type,
+    special_characters,
+)
+from lexer.token_type import TokenType as tt
+from typing import Dict, Iterator, TextIO, Tuple
+import re
+
+# Single characters that always end a word, the same set Lexer.should_break
+# checks with `PUNCTUATORS | OPERATORS`.
+BREAK_CHARS = "".join(
+    sorted(symbol for symbol in PUNCTUATORS | OPERATORS if len(symbol) == 1)
+)
+
+
+def build_word_class(newlines: str) -> str:
+    return rf"""[^ \t{newlines}'"{re.escape(BREAK_CHARS)}]"""
+
+
+def build_master_pattern(newlines: str) -> str:
+    return (
+        rf"(?P<whitespace>[ \t{newlines}]+)"
+        rf"|(?P<comment>//[^{newlines}]*|/\*[^/]*/?)"
+        r'|(?P<string>")'
+        r"|(?P<char>')"
+        r"|(?P<operator>"
+        + "|".join(
+            re.escape(symbol)
+            for symbol in sorted(PUNCTUATORS | OPERATORS, key=len, reverse=True)
+        )
+        + r")"
+        rf"|(?P<word>{build_word_class(newlines)}+)"
+    )
+
+
+MASTER_PATTERN = re.compile(build_master_pattern(r"\n"))
+WORD_PATTERN = re.compile(build_word_class(r"\n") + "*")
+STRING_STOP_PATTERN = re.compile(r'["\n]')
+LITERAL_WHITESPACE = str.maketrans("", "", " \t")
+
+# characters a lexeme decision may look past its own end ('//', '/*', '.5')
+LOOKAHEAD = 3
+CHUNK_SIZE = 64 * 1024
+
+Lexeme = Tuple[tt, str, int, int, int]
+
+def char_literal_open(word: str) -> bool:
+    if len(word) >= 3:
+        if word[1] == "\\" and word[2] not in special_characters:
+            return False
+        if word[1] != "\\":
+            return False
+    if len(word) >= 4 and word[1] == "\\":
+        return False
+    return word.count("'") % 2 == 1
+
+
+class RegexScanner:
+    master_pattern = MASTER_PATTERN
+    word_pattern = WORD_PATTERN
+    string_stop_pattern = STRING_STOP_PATTERN
+
+    def __init__(self, source_code: str) -> None:
+        self.source_code: str = source_code
+        self.position: int = 0
+        self.current_line: int = 1
+        self.prev_token_type: tt | None = None
+        self.type_cache: Dict[str, tt] = {}
+        # state carried across buffer refills by StreamScanner
+        self.at_eof: bool = True
+        self.comment_stop: str | None = None
+        self.pending_string: str | None = None
+        self.string_start: int = 0
+        # offset of source_code[0] in the whole input
+        self.buffer_offset: int = 0
+
+    def fill(self) -> bool:
+        return False
+
+    def token_type_of(self, word: str) -> tt:
+        return cached_token_type(word, self.type_cache)
+
+    def char_at(self, position: int) -> str:
+        return self.source_code[position : position + 1]
+
+    def match_text(self, match: re.Match) -> str:
+        return match.group()
+
+    def literal_text(self, start: int, end: int | None = None) -> str:
+        return self.source_code[start:end].translate(LITERAL_WHITESPACE)
+
+    def count_newlines(self, start: int, end: int) -> int:
+        return self.source_code.count("\n", start, end)
+
+    def next_is_digit(self, position: int) -> bool:
+        return self.char_at(position).isdigit()
+
+    def scan_word_tail(self, word: str, end: int) -> Tuple[str, int]:
+        # A '.' joins a word that is not an identifier when the word is
+        # numeric or a digit follows the '.', e.g. `5.`, `+5.6`, `(.5`.
+        if (
+            "." not in word
+            and self.char_at(end) == "."
+            and match_token_type(word) != tt.IDENTIFIER
+            and (word.lstrip("+-").isdigit() or self.next_is_digit(end + 1))
+        ):
+            tail = self.word_pattern.match(self.source_code, end + 1)
+            return word + "." + self.match_text(tail), tail.end()
+        return word, end
+
+    def scan_operator(self, operator: str, end: int) -> Tuple[str, int]:
+        if operator != "." and self.char_at(end) == ".":
+            return self.scan_word_tail(operator, end)
+
+        if operator == "." and self.next_is_digit(end):
+            tail = self.word_pattern.match(self.source_code, end)
+            return operator + self.match_text(tail), tail.end()
+
+        if (
+            operator in ["+", "-"]
+            and self.next_is_digit(end)
+            and self.prev_token_type in SIGNED_NUMBER_PREV_TYPES
+        ):
+            tail = self.word_pattern.match(self.source_code, end)
+            return self.scan_word_tail(operator + self.match_text(tail), tail.end())
+
+        return operator, end
+
+    def scan_string(self, word: str, position: int) -> Tuple[str, int, bool]:
+        source = self.source_code
+        while True:
+            stop = self.string_stop_pattern.search(source, position)
+            if stop is None:
+                word += self.literal_text(position)
+                return word, len(source), self.at_eof
+
+            word += self.literal_text(position, stop.start())
+            if self.char_at(stop.start()) == "\n":
+                return word, stop.start(), True
+
+            if not self.at_eof and stop.end() + 2 > len(source):
+                return word, stop.start(), False
+
+            word += '"'
+            position = stop.end()
+            if not word.endswith(r"\"") or word.endswith(r'\\"'):
+                # a closed string swallows a following '.' if a digit comes
+                # next, which reopens it, the same as in_string_literal
+                if (
+                    "." not in word
+                    and self.char_at(position) == "."
+                    and self.next_is_digit(position + 1)
+                ):
+                    word += "."
+                    position += 1
+                    continue
+                return word, position, True
+
+    def scan_char(self, start: int) -> Tuple[str, int]:
+        source = self.source_code
+        word = "'"
+        position = start + 1
+        while position < len(source):
+            char = source[position]
+            if char == "\n" or not char_literal_open(word):
+                break
+            if char not in [" ", "\t"]:
+                word += char
+            position += 1
+
+        if (
+            "." not in word
+            and self.char_at(position) == "."
+            and self.next_is_digit(position + 1)
+        ):
+            return word + ".", position + 1
+        return word, position
+
+    def skip_comment(self) -> None:
+        source = self.source_code
+        stop = source.find(self.comment_stop, self.position)
+        if stop == -1:
+            self.current_line += source.count("\n", self.position)
+            self.position = len(source)
+            if self.at_eof:
+                self.comment_stop = None
+            return
+
+        self.current_line += source.count("\n", self.position, stop)
+        # a line comment leaves its '\n' to be counted as whitespace
+        self.position = stop + 1 if self.comment_stop == "/" else stop
+        self.comment_stop = None
+
+    def make_lexeme(self, word: str, start: int, end: int) -> Lexeme:
+        token_type = cached_token_type(word, self.type_cache)
+        self.prev_token_type = token_type
+        return token_type, word, start, end, self.current_line
+
+    def iter_lexemes(self) -> Iterator[Lexeme]:
+        # yields (token_type, value, start, end, line_number), with start and
+        # end as offsets into the whole input
+        match = self.master_pattern.match
+
+        while True:
+            source = self.source_code
+            if not self.at_eof and len(source) - self.position < LOOKAHEAD:
+                self.fill()
+                continue
+
+            if self.comment_stop is not None:
+                self.skip_comment()
+                continue
+
+            if self.pending_string is not None:
+                word, end, complete = self.scan_string(
+                    self.pending_string, self.position
+                )
+                self.position = end
+                if complete:
+                    self.pending_string = None
+                    yield self.make_lexeme(
+                        word, self.string_start, self.buffer_offset + end
+                    )
+                else:
+                    self.pending_string = word
+                    self.fill()
+                continue
+
+            if self.position >= len(source):
+                break
+
+            lexeme = match(source, self.position)
+            kind = lexeme.lastgroup
+            end = lexeme.end()
+
+            if kind == "whitespace" or kind == "comment":
+                if kind == "comment" and not self.at_eof and end == len(source):
+                    if self.char_at(self.position + 1) == "/":
+                        self.comment_stop = "\n"
+                    elif end - self.position == 2 or self.char_at(end - 1) != "/":
+                        self.comment_stop = "/"
+                self.current_line += self.count_newlines(self.position, end)
+                self.position = end
+                continue
+
+            if kind == "string":
+                self.pending_string = '"'
+                self.string_start = self.buffer_offset + self.position
+                self.position += 1
+                continue
+
+            if kind == "char":
+                word, end = self.scan_char(self.position)
+            elif kind == "operator":
+                word, end = self.scan_operator(self.match_text(lexeme), end)
+            else:
+                word, end = self.scan_word_tail(self.match_text(lexeme), end)
+
+            if not self.at_eof and end + 2 > len(source):
+                # the lexeme or its lookahead runs into the end of the buffer
+                self.fill()
+                continue
+
+            start = self.buffer_offset + self.position
+            self.position = end
+            yield self.make_lexeme(word, start, self.buffer_offset + end)
+
+        end = self.buffer_offset + len(self.source_code)
+        yield tt.EOF_MARKER, "", end, end, self.current_line
+
+
+class StreamScanner(RegexScanner):
+    def __init__(self, file: TextIO, chunk_size: int = CHUNK_SIZE) -> None:
+        if chunk_size < LOOKAHEAD:
+            raise ValueError(f"chunk_size must be at least {LOOKAHEAD}")
+        super().__init__("")
+        self.file: TextIO = file
+        self.chunk_size: int = chunk_size
+        self.at_eof = False
+
+    def fill(self) -> bool:
+        chunk = self.file.read(self.chunk_size)
+        if not chunk:
+            self.at_eof = True
+            return False
+        # keep only the unfinished lexeme, if any, in front of the new chunk
+        self.buffer_offset += self.position
+        self.source_code = self.source_code[self.position :] + chunk
+        self.position = 0
+        return True
+
+
+def utf8_width(lead: int) -> int:
+    if lead >> 5 == 0b110:
+        return 2
+    if lead >> 4 == 0b1110:
+        return 3
+    if lead >> 3 == 0b11110:
+        return 4
+    return 1
+
+
+class BytesScanner(RegexScanner):
+    # Scans UTF-8 encoded bytes, e.g. an mmap, without decoding the whole
+    # input. Offsets are byte offsets. Newlines follow open()'s universal
+    # newlines mode, so '\r\n' and '\r' count as '\n' the same as in the
+    # text run.py reads.
+    master_pattern = re.compile(build_master_pattern(r"\r\n").encode())
+    word_pattern = re.compile((build_word_class(r"\r\n") + "*").encode())
+    string_stop_pattern = re.compile(rb'["\r\n]')
+
+    def char_at(self, position: int) -> str:
+        lead = self.source_code[position : position + 1]
+        if not lead:
+            return ""
+        if lead[0] < 0x80:
+            return "\n" if lead == b"\r" else chr(lead[0])
+        width = utf8_width(lead[0])
+        return self.source_code[position : position + width].decode("utf-8")
+
+    def match_text(self, match: re.Match) -> str:
+        return match.group().decode("utf-8")
+
+    def literal_text(self, start: int, end: int | None = None) -> str:
+        return self.source_code[start:end].translate(None, b" \t").decode("utf-8")
+
+    def count_newlines(self, start: int, end: int) -> int:
+        text = self.source_code[start:end]
+        return text.count(b"\n") + text.count(b"\r") - text.count(b"\r\n")
+
+    def scan_char(self, start: int) -> Tuple[str, int]:
+        source = self.source_code
+        word = "'"
+        position = start + 1
+        while position < len(source):
+            lead = source[position]
+            if lead < 0x80:
+                # ASCII fast path
+                char, width = chr(lead), 1
+                if char == "\r":
+                    break
+            else:
+                width = utf8_width(lead)
+                char = source[position : position + width].decode("utf-8")
+            if char == "\n" or not char_literal_open(word):
+                break
+            if char not in [" ", "\t"]:
+                word += char
+            position += width
+
+        if (
+            "." not in word
+            and self.char_at(position) == "."
+            and self.next_is_digit(position + 1)
+        ):
+            return word + ".", position + 1
+        return word, position
+
+
+def ends_in_comment(line: str) -> bool:
+    # whether `line`, which has no '\n', ends inside an unclosed /* comment
+    lexemes = list(RegexScanner(line).iter_lexemes())
+    position = lexemes[-2][3] if len(lexemes) > 1 else 0
+    # only whitespace and comments follow the last token
+    text = ""
+    while position < len(line):
+        match = MASTER_PATTERN.match(line, position)
+        text = match.group()
+        position = match.end()
+    return text.startswith("/*") and (len(text) == 2 or not text.endswith("/"))
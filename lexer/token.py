@@ -1,5 +1,5 @@
 from lexer.token_type import TokenType
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -7,5 +7,11 @@ class Token:
     token_type: TokenType
     value: str
     line_number: int
-
-
+    # Interner ID of an IDENTIFIER's name
+    symbol_id: int | None = field(default=None, compare=False)
+    # Native value of a literal, when the lexer decodes literals
+    literal_value: int | float | str | None = field(default=None, compare=False)
+    # Source offsets of the lexeme (byte offsets for Lexer.from_path); use
+    # Lexer.line_index to turn them into a line and column
+    start: int | None = field(default=None, compare=False)
+    end: int | None = field(default=None, compare=False)
@@ -0,0 +1,53 @@
+from lexer.token_stream import TokenStream
+from typing import Dict
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# one record per token, in the .npy files written by save_npy
+TOKEN_FIELDS = [("kind", "B"), ("line", "I"), ("start", "I"), ("end", "I")]
+
+
+def require_numpy() -> None:
+    if np is None:
+        raise ImportError("token array export requires NumPy")
+
+
+def column_views(stream: TokenStream) -> Dict[str, "np.ndarray"]:
+    # Zero-copy views of the stream's own columns. While a view is alive
+    # the stream cannot grow, as array.array refuses to resize an exported
+    # buffer and raises BufferError instead.
+    require_numpy()
+    columns = {
+        "kind": stream.kinds,
+        "line": stream.lines,
+        "start": stream.starts,
+        "end": stream.ends,
+    }
+    return {
+        name: np.frombuffer(column, dtype=np.dtype(column.typecode))
+        for name, column in columns.items()
+    }
+
+
+def to_structured_array(stream: TokenStream) -> "np.ndarray":
+    # The stream keeps its columns apart, so records need one vectorized
+    # copy per field; use column_views to query without copying.
+    require_numpy()
+    tokens = np.empty(len(stream), dtype=np.dtype(TOKEN_FIELDS))
+    for name, view in column_views(stream).items():
+        tokens[name] = view
+    return tokens
+
+
+def save_npy(stream: TokenStream, path: str) -> None:
+    require_numpy()
+    np.save(path, to_structured_array(stream), allow_pickle=False)
+
+
+def load_npy(path: str) -> "np.ndarray":
+    # memory-mapped, so only the pages a query touches are read
+    require_numpy()
+    return np.load(path, mmap_mode="r", allow_pickle=False)
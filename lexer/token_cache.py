@@ -0,0 +1,73 @@
+from lexer.lexer_rules import rules_fingerprint
+from lexer.token_stream import TokenStream
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+
+FORMAT_VERSION = 1
+MAGIC = b"TKC"
+# magic, format version, token count
+HEADER = struct.Struct("<3sBI")
+
+
+class TokenCache:
+    # Stores token streams on disk as their raw columns: the token kinds,
+    # then the lines, starts and ends. Values are sliced back out of the
+    # source on load, so they are not stored. The columns use the machine's
+    # byte order, as the cache is local to a machine.
+    def __init__(self, cache_dir: str) -> None:
+        self.cache_dir: str = cache_dir
+        self.rules_fingerprint: str = rules_fingerprint()
+
+    def key(self, source_code: str | bytes | mmap.mmap) -> str:
+        source_hash = hashlib.sha256(
+            source_code.encode("utf-8") if isinstance(source_code, str) else source_code
+        )
+        source_hash.update(self.rules_fingerprint.encode())
+        # streams of a str hold character offsets and streams of bytes (a
+        # mapped file) byte offsets, so the same text has a key for each
+        source_hash.update(b"str" if isinstance(source_code, str) else b"bytes")
+        return source_hash.hexdigest()
+
+    def path_for(self, source_code: str | bytes | mmap.mmap) -> str:
+        return os.path.join(self.cache_dir, self.key(source_code) + ".tokens")
+
+    def load(self, source_code: str | bytes | mmap.mmap) -> TokenStream | None:
+        try:
+            with open(self.path_for(source_code), "rb") as file:
+                data = file.read()
+        except OSError:
+            return None
+
+        if len(data) < HEADER.size:
+            return None
+        magic, version, count = HEADER.unpack_from(data)
+        stream = TokenStream(source_code)
+        columns = [stream.kinds, stream.lines, stream.starts, stream.ends]
+        size = HEADER.size + sum(column.itemsize * count for column in columns)
+        if magic != MAGIC or version != FORMAT_VERSION or len(data) != size:
+            return None
+
+        position = HEADER.size
+        for column in columns:
+            end = position + column.itemsize * count
+            column.frombytes(data[position:end])
+            position = end
+        return stream
+
+    def store(self, stream: TokenStream) -> None:
+        os.makedirs(self.cache_dir, exist_ok=True)
+        columns = [stream.kinds, stream.lines, stream.starts, stream.ends]
+        # write to a temporary file first so readers never see a partial one
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(stream)))
+                for column in columns:
+                    column.tofile(file)
+            os.replace(temp_path, self.path_for(stream.source_code))
+        except BaseException:
+            os.unlink(temp_path)
+            raise
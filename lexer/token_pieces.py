@@ -0,0 +1,123 @@
+from lexer.token import Token
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from typing import Iterator, List
+
+# tokens per piece; a piece that grows past twice this is split again
+PIECE_SIZE = 512
+
+
+class TokenPieces:
+    # The tokens of an edited source, as returned by Lexer.relex, split into
+    # pieces of about PIECE_SIZE tokens. An edit shifts the offsets and lines
+    # of the tokens after it by adding to the pending shifts of their
+    # pieces, and a piece's tokens are only updated when it is next read, so
+    # an edit costs O(PIECE_SIZE + pieces) rather than O(tokens).
+    def __init__(self, tokens: List[Token]) -> None:
+        self.pieces: List[List[Token]] = [
+            tokens[start : start + PIECE_SIZE]
+            for start in range(0, len(tokens), PIECE_SIZE)
+        ]
+        self.offset_shifts: List[int] = [0] * len(self.pieces)
+        self.line_shifts: List[int] = [0] * len(self.pieces)
+        # index of each piece's first token
+        self.piece_starts: List[int] = []
+        self.count_pieces()
+
+    def count_pieces(self):
+        self.piece_starts = [0]
+        self.piece_starts.extend(accumulate(map(len, self.pieces[:-1])))
+
+    def settle(self, piece: int) -> List[Token]:
+        # applies the piece's pending shifts to its tokens
+        offset_shift = self.offset_shifts[piece]
+        line_shift = self.line_shifts[piece]
+        tokens = self.pieces[piece]
+        if offset_shift or line_shift:
+            shift_tokens(tokens, offset_shift, line_shift)
+            self.offset_shifts[piece] = 0
+            self.line_shifts[piece] = 0
+        return tokens
+
+    def piece_of(self, index: int) -> int:
+        return bisect_right(self.piece_starts, index) - 1
+
+    def last_end(self, piece: int) -> int:
+        return self.pieces[piece][-1].end + self.offset_shifts[piece]
+
+    def index_of_end(self, end: int, after: bool = False) -> int:
+        # Index of the first token that ends at or after `end`, or strictly
+        # after it when `after` is set: bisect_left or bisect_right over the
+        # token ends, which only settles the piece it lands in.
+        find = bisect_right if after else bisect_left
+        piece = find(range(len(self.pieces)), end, key=self.last_end)
+        if piece == len(self.pieces):
+            return len(self)
+        tokens = self.settle(piece)
+        return self.piece_starts[piece] + find(tokens, end, key=token_end)
+
+    def replace(
+        self,
+        start: int,
+        stop: int,
+        tokens: List[Token],
+        offset_shift: int,
+        line_shift: int,
+    ):
+        # Replaces the tokens in [start, stop) with `tokens` and shifts the
+        # ones from `stop` on by offset_shift and line_shift.
+        first = self.piece_of(start)
+        last = self.piece_of(stop) if stop < len(self) else len(self.pieces) - 1
+        head = self.settle(first)[: start - self.piece_starts[first]]
+        tail = self.settle(last)[stop - self.piece_starts[last] :]
+        shift_tokens(tail, offset_shift, line_shift)
+
+        merged = head + tokens + tail
+        if len(merged) > 2 * PIECE_SIZE:
+            pieces = [
+                merged[piece_start : piece_start + PIECE_SIZE]
+                for piece_start in range(0, len(merged), PIECE_SIZE)
+            ]
+        else:
+            pieces = [merged] if merged else []
+        self.pieces[first : last + 1] = pieces
+        self.offset_shifts[first : last + 1] = [0] * len(pieces)
+        self.line_shifts[first : last + 1] = [0] * len(pieces)
+        for piece in range(first + len(pieces), len(self.pieces)):
+            self.offset_shifts[piece] += offset_shift
+            self.line_shifts[piece] += line_shift
+        self.count_pieces()
+
+    def __len__(self) -> int:
+        return self.piece_starts[-1] + len(self.pieces[-1])
+
+    def __getitem__(self, index: int) -> Token:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("token index out of range")
+        piece = self.piece_of(index)
+        return self.settle(piece)[index - self.piece_starts[piece]]
+
+    def __iter__(self) -> Iterator[Token]:
+        for piece in range(len(self.pieces)):
+            yield from self.settle(piece)
+
+
+def token_end(token: Token) -> int:
+    return token.end
+
+
+def shift_tokens(tokens: List[Token], offset_shift: int, line_shift: int):
+    if offset_shift and line_shift:
+        for token in tokens:
+            token.start += offset_shift
+            token.end += offset_shift
+            token.line_number += line_shift
+    elif offset_shift:
+        for token in tokens:
+            token.start += offset_shift
+            token.end += offset_shift
+    elif line_shift:
+        for token in tokens:
+            token.line_number += line_shift
@@ -0,0 +1,105 @@
+from lexer.token_type import TokenType
+from array import array
+from typing import Iterator, List
+import mmap
+
+# kind codes are the TokenType values, which all fit in one byte
+TOKEN_TYPES: List[TokenType | None] = [None] * (max(t.value for t in TokenType) + 1)
+for token_type in TokenType:
+    TOKEN_TYPES[token_type.value] = token_type
+
+LITERAL_WHITESPACE = str.maketrans("", "", " \t")
+
+
+class TokenView:
+    __slots__ = ("stream", "index")
+
+    def __init__(self, stream: "TokenStream", index: int) -> None:
+        self.stream = stream
+        self.index = index
+
+    @property
+    def token_type(self) -> TokenType:
+        return TOKEN_TYPES[self.stream.kinds[self.index]]
+
+    @property
+    def value(self) -> str:
+        return self.stream.value_at(self.index)
+
+    @property
+    def line_number(self) -> int:
+        return self.stream.lines[self.index]
+
+    @property
+    def start(self) -> int:
+        return self.stream.starts[self.index]
+
+    @property
+    def end(self) -> int:
+        return self.stream.ends[self.index]
+
+    @property
+    def symbol_id(self) -> None:
+        # streams do not intern identifiers; Parser interns their values
+        return None
+
+    def __eq__(self, other):
+        return (
+            self.token_type == other.token_type
+            and self.value == other.value
+            and self.line_number == other.line_number
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"TokenView(token_type={self.token_type}, value={self.value!r}, "
+            f"line_number={self.line_number})"
+        )
+
+
+class TokenStream:
+    def __init__(self, source_code: str | bytes | mmap.mmap) -> None:
+        # a bytes source (Lexer.from_path) holds UTF-8 with byte offsets
+        self.source_code: str | bytes | mmap.mmap = source_code
+        self.kinds = array("B")
+        self.starts = array("I")
+        self.ends = array("I")
+        self.lines = array("I")
+
+    def append(
+        self, token_type: TokenType, start: int, end: int, line_number: int
+    ) -> None:
+        self.kinds.append(token_type.value)
+        self.starts.append(start)
+        self.ends.append(end)
+        self.lines.append(line_number)
+
+    def value_at(self, index: int) -> str:
+        value = self.source_code[self.starts[index] : self.ends[index]]
+        if not isinstance(value, str):
+            value = value.decode("utf-8")
+        # literals are the only lexemes that can span whitespace, which the
+        # lexer drops from their value
+        if value[:1] in ["'", '"']:
+            return value.translate(LITERAL_WHITESPACE)
+        return value
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def __getitem__(self, index: int) -> TokenView:
+        if index < 0:
+            index += len(self.kinds)
+        if not 0 <= index < len(self.kinds):
+            raise IndexError("token index out of range")
+        return TokenView(self, index)
+
+    def __iter__(self) -> Iterator[TokenView]:
+        for index in range(len(self.kinds)):
+            yield TokenView(self, index)
+
+    def nbytes(self) -> int:
+        return sum(
+            column.itemsize * len(column)
+            for column in [self.kinds, self.starts, self.ends, self.lines]
+        )
@@ -0,0 +1,573 @@
+from dataclasses import dataclass, field, fields
+from parser.tree import TreeNode
+from semantics.utils import TypeInfo
+from typing import Dict, List, Set
+
+# Typed nodes for Parser(mode="ast"). They keep only what the program says:
+# no punctuation, no empty productions and no grammar helper levels.
+# Expressions carry the TypeInfo the semantic checks resolved for them; the
+# inner links of a member chain (the `a` and `a.b` of `a.b.c()`) carry none.
+
+
+class AstNode:
+    __slots__ = ()
+
+    def jsonify(self):
+        node_dict = {"node_type": type(self).__name__}
+        for node_field in fields(self):
+            value = getattr(self, node_field.name)
+            if value is None or value == []:
+                continue
+            node_dict[node_field.name] = jsonify_value(value)
+        return node_dict
+
+
+def jsonify_value(value):
+    if isinstance(value, AstNode):
+        return value.jsonify()
+    if isinstance(value, list):
+        return [jsonify_value(item) for item in value]
+    if isinstance(value, TypeInfo):
+        return str(value)
+    return value
+
+
+@dataclass(slots=True)
+class Program(AstNode):
+    definitions: List[AstNode] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class ClassDef(AstNode):
+    # kind is "class" or "struct"
+    kind: str
+    name: str
+    access_modifier: str
+    parent: str | None = None
+    interfaces: List[str] = field(default_factory=list)
+    members: List[AstNode] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class InterfaceDef(AstNode):
+    name: str
+    access_modifier: str
+    parent: str | None = None
+    methods: List[AstNode] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class MethodDef(AstNode):
+    # constructors are named "constructor" and the main method "mainEntry";
+    # interface methods have no body
+    name: str
+    return_type: TypeInfo | None = None
+    params: List["Param"] = field(default_factory=list)
+    body: List[AstNode] | None = None
+    access_modifier: str | None = None
+    is_static: bool = False
+
+
+@dataclass(slots=True)
+class Param(AstNode):
+    name: str
+    type: TypeInfo | None = None
+
+
+@dataclass(slots=True)
+class VarDecl(AstNode):
+    # fields have an access modifier, locals do not
+    name: str
+    type: TypeInfo | None = None
+    value: AstNode | None = None
+    access_modifier: str | None = None
+    is_static: bool = False
+
+
+@dataclass(slots=True)
+class Assign(AstNode):
+    target: AstNode
+    operator: str
+    value: AstNode
+
+
+@dataclass(slots=True)
+class ExprStatement(AstNode):
+    expression: AstNode
+
+
+@dataclass(slots=True)
+class If(AstNode):
+    condition: AstNode
+    body: List[AstNode] = field(default_factory=list)
+    else_body: List[AstNode] | None = None
+
+
+@dataclass(slots=True)
+class While(AstNode):
+    condition: AstNode
+    body: List[AstNode] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class For(AstNode):
+    init: List[AstNode]
+    condition: AstNode
+    update: AstNode
+    body: List[AstNode] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class Return(AstNode):
+    value: AstNode | None = None
+
+
+@dataclass(slots=True)
+class Jump(AstNode):
+    # "break" or "continue"
+    keyword: str
+
+
+@dataclass(slots=True)
+class BinaryOp(AstNode):
+    operator: str
+    left: AstNode
+    right: AstNode
+    type: TypeInfo | None = None
+
+
+@dataclass(slots=True)
+class UnaryOp(AstNode):
+    # '!', '*' (dereference) or '&' (address of)
+    operator: str
+    operand: AstNode
+    type: TypeInfo | None = None
+
+
+@dataclass(slots=True)
+class Literal(AstNode):
+    value: str
+    type: TypeInfo | None = None
+
+
+@dataclass(slots=True)
+class Name(AstNode):
+    # also "this" and "super", as the object of a Member
+    name: str
+    type: TypeInfo | None = None
+
+
+@dataclass(slots=True)
+class Member(AstNode):
+    object: AstNode
+    name: str
+    # '.' or '->'
+    operator: str
+    type: TypeInfo | None = None
+
+
+@dataclass(slots=True)
+class Call(AstNode):
+    function: AstNode
+    args: List[AstNode] = field(default_factory=list)
+    type: TypeInfo | None = None
+
+
+@dataclass(slots=True)
+class Index(AstNode):
+    target: AstNode
+    indices: List[AstNode] = field(default_factory=list)
+    type: TypeInfo | None = None
+
+
+@dataclass(slots=True)
+class ObjCreate(AstNode):
+    class_name: str
+    args: List[AstNode] = field(default_factory=list)
+    type: TypeInfo | None = None
+
+
+@dataclass(slots=True)
+class ArrayLiteral(AstNode):
+    elements: List[AstNode] = field(default_factory=list)
+    type: TypeInfo | None = None
+
+
+@dataclass(slots=True)
+class Error(AstNode):
+    # a definition, member or statement that Parser(recover_errors=True)
+    # skipped
+    pass
+
+
+INDEXING = {"array_indexing_2d", "parse_array_indexing_3d"}
+ARRAY_ELEMENTS = {"1d_array_element", "2d_array_element"}
+ARRAY_TAILS = {"1d_array_elements_2", "2d_array_elements_2", "3d_array_elements_2"}
+
+
+def flatten(node: TreeNode, tails: Set[str]) -> List[TreeNode]:
+    # the children of a list node, with the chain of tails below it spliced
+    # in and the empty productions dropped; flattened lists have no tails
+    items = []
+    while node is not None:
+        tail = None
+        for child in node.children:
+            if child.node_type in tails:
+                tail = child
+            elif child.node_type != "null":
+                items.append(child)
+        node = tail
+    return items
+
+
+class AstBuilder:
+    # Turns a finished parse tree into ast_nodes, after parsing rather than
+    # during it. `types` maps parse tree nodes to the types
+    # Parser.record_type saw for them.
+    def __init__(self, types: Dict[TreeNode, TypeInfo] | None = None) -> None:
+        self.types = types if types is not None else {}
+
+    def program(self, node: TreeNode) -> Program:
+        return Program(
+            [
+                self.definition(child)
+                for child in flatten(node.children[0], {"class_int_struct_def_list"})
+            ]
+        )
+
+    def access_modifier(self, node: TreeNode, default: str) -> str:
+        child = node.children[0]
+        return default if child.node_type == "null" else child.value
+
+    def definition(self, node: TreeNode):
+        if node.node_type == "error":
+            return Error()
+        access_modifier = self.access_modifier(node.children[0], "public")
+        definition = node.children[1].children[0]
+        keyword, name, inherits, body = definition.children
+
+        if definition.node_type == "interface_def":
+            return InterfaceDef(
+                name.value,
+                access_modifier,
+                self.parent(inherits),
+                [
+                    Error()
+                    if member.node_type == "error"
+                    else self.method(member.children[0])
+                    for member in flatten(body.children[1], {"interface_members"})
+                ],
+            )
+
+        inherit, implement = inherits.children
+        interfaces = [
+            child.value
+            for child in flatten(implement, {"implement"})
+            if child.node_type == "IDENTIFIER"
+        ]
+        members = []
+        for member in flatten(body.children[1], {"class_struct_members"}):
+            if member.node_type == "error":
+                members.append(Error())
+            else:
+                members.extend(self.member(member.children[0]))
+        return ClassDef(
+            keyword.value,
+            name.value,
+            access_modifier,
+            self.parent(inherit),
+            interfaces,
+            members,
+        )
+
+    def parent(self, inherit: TreeNode) -> str | None:
+        children = inherit.children
+        return children[1].value if len(children) == 2 else None
+
+    def member(self, node: TreeNode) -> List[AstNode]:
+        if node.node_type == "field_declaration_method_def":
+            access_mod, static, declaration = node.children
+            access_modifier = self.access_modifier(access_mod, "private")
+            is_static = static.children[0].node_type == "STATIC"
+            declaration = declaration.children[0]
+            if declaration.node_type == "variable_declaration":
+                declarations = self.variable_declaration(declaration)
+                for variable in declarations:
+                    variable.access_modifier = access_modifier
+                    variable.is_static = is_static
+                return declarations
+
+            method = self.method(declaration.children[0])
+            method.body = self.statements(declaration.children[2])
+            method.access_modifier = access_modifier
+            method.is_static = is_static
+            return [method]
+
+        # constructor_def, which is also the node of the main method
+        children = node.children
+        if children[0].node_type == "MAIN":
+            return [
+                MethodDef(
+                    children[0].value,
+                    body=self.statements(children[4]),
+                    access_modifier="public",
+                )
+            ]
+        return [
+            MethodDef(
+                children[0].value,
+                params=self.params(children[2]),
+                body=self.statements(children[5]),
+                access_modifier="public",
+            )
+        ]
+
+    def method(self, declaration: TreeNode) -> MethodDef:
+        return_type, _, name, _, params, _ = declaration.children
+        return MethodDef(
+            name.value, self.types.get(return_type), self.params(params)
+        )
+
+    def params(self, node: TreeNode) -> List[Param]:
+        return [
+            Param(child.children[1].value, self.types.get(child.children[0]))
+            for child in flatten(node, {"parameter_list_2"})
+            if child.node_type == "parameter"
+        ]
+
+    def statements(self, node: TreeNode) -> List[AstNode]:
+        statements = []
+        for child in flatten(node, {"multiple_statements"}):
+            statements.extend(self.statement(child))
+        return statements
+
+    def body(self, node: TreeNode) -> List[AstNode]:
+        child = node.children[0]
+        if child.node_type == "statement":
+            return self.statement(child)
+        return self.statements(node.children[1])
+
+    def statement(self, node: TreeNode) -> List[AstNode]:
+        if node.node_type == "error":
+            return [Error()]
+        child = node.children[0]
+        kind = child.node_type
+        if kind == "BR_CONT":
+            return [Jump(child.value)]
+        if kind == "return_statement":
+            value = child.children[1].children[0]
+            return [Return(None if value.node_type == "null" else self.value(value))]
+        if kind == "if_else_statement":
+            children = child.children
+            else_node = children[5]
+            return [
+                If(
+                    self.expression(children[2]),
+                    self.body(children[4]),
+                    (
+                        None
+                        if else_node.children[0].node_type == "null"
+                        else self.body(else_node.children[1])
+                    ),
+                )
+            ]
+        if kind == "while_statement":
+            children = child.children
+            return [While(self.expression(children[2]), self.body(children[4]))]
+        if kind == "for_loop_statement":
+            children = child.children
+            init = children[2].children[0]
+            return [
+                For(
+                    (
+                        self.variable_declaration(init)
+                        if init.node_type == "variable_declaration"
+                        else [self.assignment(init)]
+                    ),
+                    self.expression(children[4].children[0]),
+                    self.assignment(children[6].children[0]),
+                    self.body(children[8]),
+                )
+            ]
+        if kind == "variable_declaration":
+            return self.variable_declaration(child)
+        return [self.assignment(child)]
+
+    def variable_declaration(self, node: TreeNode) -> List[VarDecl]:
+        _, type_node, name, init, names = node.children
+        type = self.types.get(type_node)
+        declarations = [VarDecl(name.value, type, self.init(init))]
+        items = flatten(names, {"list"})
+        for index, child in enumerate(items):
+            if child.node_type == "IDENTIFIER":
+                declarations.append(
+                    VarDecl(child.value, type, self.init(items[index + 1]))
+                )
+        return declarations
+
+    def init(self, node: TreeNode) -> AstNode | None:
+        children = node.children
+        return None if children[0].node_type == "null" else self.value(children[1])
+
+    def assignment(self, node: TreeNode) -> AstNode:
+        children = node.children
+        is_pointer = children[0].node_type == "POINTER_MULTIPLY"
+        if is_pointer:
+            children = children[1:]
+        target = self.reference(children[0], children[1])
+
+        node = children[2]
+        while True:
+            link = [child for child in node.children if child.node_type != "null"]
+            if not link:
+                return ExprStatement(target)
+            if link[0].node_type == "assignment":
+                operator, value = link[0].children
+                if is_pointer:
+                    target = UnaryOp("*", target)
+                return Assign(target, operator.value, self.value(value))
+            target, node = self.link(target, link)
+
+    def reference(self, this_super: TreeNode, name: TreeNode) -> AstNode:
+        owner = this_super.children[0]
+        if owner.node_type == "null":
+            return Name(name.value)
+        return Member(Name(owner.value), name.value, "->")
+
+    def link(self, target: AstNode, link: List[TreeNode]):
+        # one link of a member chain: the node it makes and the rest of the
+        # chain
+        first = link[0]
+        kind = first.node_type
+        if kind == "dot_arrow":
+            return Member(target, link[1].value, first.children[0].value), link[2]
+        if kind == "DOT":
+            return Member(target, link[1].value, "."), link[2]
+        if kind == "array_indexing_1d":
+            return Index(target, self.indices(first)), link[1]
+        return Call(target, self.args(first), self.types.get(first)), link[1]
+
+    def function_call(self, node: TreeNode, type: TypeInfo | None) -> AstNode:
+        this_super, name, node = node.children
+        target = self.reference(this_super, name)
+        while True:
+            link = [child for child in node.children if child.node_type != "null"]
+            if not link:
+                break
+            target, node = self.link(target, link)
+        if type is not None:
+            target.type = type
+        return target
+
+    def indices(self, node: TreeNode) -> List[AstNode]:
+        indices = []
+        while node is not None:
+            tail = None
+            for child in node.children:
+                if child.node_type == "expression":
+                    indices.append(self.expression(child))
+                elif child.node_type in INDEXING:
+                    tail = child
+            node = tail
+        return indices
+
+    def args(self, node: TreeNode) -> List[AstNode]:
+        return [
+            self.value(child)
+            for child in flatten(node.children[1], {"arguments_list"})
+            if child.node_type == "value"
+        ]
+
+    def value(self, node: TreeNode) -> AstNode:
+        child = node.children[0]
+        kind = child.node_type
+        type = self.types.get(node)
+        if kind == "expression":
+            return self.expression(child)
+        if kind == "pointer_initialization":
+            return UnaryOp("&", self.function_call(child.children[1], None), type)
+        if kind == "array_initialization":
+            return self.array_literal(child.children[1], type)
+        return self.object_creation(child)
+
+    def object_creation(self, node: TreeNode) -> ObjCreate:
+        _, name, args = node.children
+        return ObjCreate(name.value, self.args(args), TypeInfo(name.value))
+
+    def array_literal(self, node: TreeNode, type: TypeInfo | None) -> ArrayLiteral:
+        # node is a list of 1d, 2d or 3d array elements
+        elements = []
+        for child in flatten(node, ARRAY_TAILS):
+            if child.node_type not in ARRAY_ELEMENTS:
+                continue
+            element = child.children[0]
+            if element.node_type == "SQUARE_BRACKET_OPEN":
+                elements.append(
+                    self.array_literal(child.children[1], self.types.get(child))
+                )
+                continue
+            element = element.children[0]
+            if element.node_type == "expression":
+                elements.append(self.expression(element))
+            else:
+                elements.append(self.object_creation(element))
+        return ArrayLiteral(elements, type)
+
+    def expression(self, node: TreeNode) -> AstNode:
+        return self.operand(node.children[0])
+
+    def operand(self, node: TreeNode) -> AstNode:
+        kind = node.node_type
+        if kind == "factor":
+            return self.factor(node)
+        if kind == "binary_expression":
+            # left-associative chains nest down the left, so walk that spine
+            # with a loop and only recurse into the right operands
+            spine = []
+            while node.node_type == "binary_expression":
+                spine.append(node)
+                node = node.children[0]
+            left = self.operand(node)
+            for node in reversed(spine):
+                left = BinaryOp(
+                    node.value,
+                    left,
+                    self.operand(node.children[1]),
+                    self.types.get(node),
+                )
+            return left
+
+        # a grammar level: an operand, then a tail of operator and operand
+        # pairs, which associate to the left
+        first, tail = node.children
+        left = self.operand(first)
+        items = flatten(tail, {tail.node_type})
+        for index in range(0, len(items), 2):
+            operator = items[index]
+            left = BinaryOp(
+                operator.value,
+                left,
+                self.operand(items[index + 1]),
+                self.types.get(operator),
+            )
+        return left
+
+    def factor(self, node: TreeNode) -> AstNode:
+        type = self.types.get(node)
+        child = node.children[0]
+        kind = child.node_type
+        if kind == "function_call":
+            return self.function_call(child, type)
+        if kind == "ROUND_BRACKET_OPEN":
+            return self.expression(node.children[1])
+        if kind == "NOT_OPERATOR":
+            return UnaryOp("!", self.factor(node.children[1]), type)
+        if kind == "pointer_dereferencing":
+            return UnaryOp("*", self.function_call(child.children[1], None), type)
+        return Literal(child.value, type)
+
+
+def build_ast(
+    parse_tree: TreeNode, types: Dict[TreeNode, TypeInfo] | None = None
+) -> Program:
+    return AstBuilder(types).program(parse_tree)
@@ -0,0 +1,625 @@
+from lexer.lexer_rules import ALL_RULES
+from lexer.pickle_cache import load_pickled
+from lexer.token_type import TokenType as tt
+from typing import Dict, List, Set, Tuple
+import hashlib
+import os
+
+# The grammar Parser implements, as data. Nonterminals are lower case and
+# terminals are TokenType names. An empty alternative derives nothing and
+# adds a "null" node, like the parser's epsilon branches. List productions
+# are right recursive, which gives the parser's default chain of list nodes.
+#
+# Where the grammar is not LL(1) the earlier alternative wins. The only such
+# place is the dangling else, which binds to the nearest if, as in Parser.
+START = "program"
+
+# the alternatives of a factor that are a single literal
+LITERALS = [
+    "INTEGER_LITERAL",
+    "FLOAT_LITERAL",
+    "CHAR_LITERAL",
+    "STRING_LITERAL",
+    "BOOL_LITERAL",
+]
+
+GRAMMAR: Dict[str, List[List[str]]] = {
+    "program": [["class_int_struct_def_list"]],
+    "class_int_struct_def_list": [
+        ["class_int_struct_def", "class_int_struct_def_list"],
+        [],
+    ],
+    "class_int_struct_def": [["access_mod_optional", "class_int_struct_def_2"]],
+    "access_mod_optional": [["ACCESS_MODIFIER"], []],
+    "class_int_struct_def_2": [["class_def"], ["struct_def"], ["interface_def"]],
+    "class_def": [["CLASS", "IDENTIFIER", "inherit_implement", "class_struct_body"]],
+    "struct_def": [
+        ["STRUCT", "IDENTIFIER", "inherit_implement", "class_struct_body"]
+    ],
+    "interface_def": [["INTERFACE", "IDENTIFIER", "inherit", "interface_body"]],
+    "inherit_implement": [["inherit", "implement"]],
+    "inherit": [["INHERITS", "IDENTIFIER"], []],
+    "implement": [["IMPLEMENTS", "IDENTIFIER", "implement_list"], []],
+    "implement_list": [["COMMA", "IDENTIFIER", "implement_list"], []],
+    "class_struct_body": [
+        ["CURLY_BRACKET_OPEN", "class_struct_members", "CURLY_BRACKET_CLOSE"]
+    ],
+    "class_struct_members": [["class_struct_member", "class_struct_members"], []],
+    "class_struct_member": [
+        ["field_declaration_method_def"],
+        ["constructor_def"],
+        ["main_method"],
+    ],
+    "field_declaration_method_def": [
+        ["access_mod_optional", "static_optional", "field_declaration_method_def_2"]
+    ],
+    "field_declaration_method_def_2": [
+        ["variable_declaration", "SEMICOLON"],
+        ["function_def"],
+    ],
+    "static_optional": [["STATIC"], []],
+    "constructor_def": [
+        [
+            "CONSTRUCTOR",
+            "ROUND_BRACKET_OPEN",
+            "parameter_list",
+            "ROUND_BRACKET_CLOSE",
+            "CURLY_BRACKET_OPEN",
+            "multiple_statements",
+            "CURLY_BRACKET_CLOSE",
+        ]
+    ],
+    "main_method": [
+        [
+            "MAIN",
+            "ROUND_BRACKET_OPEN",
+            "ROUND_BRACKET_CLOSE",
+            "CURLY_BRACKET_OPEN",
+            "multiple_statements",
+            "CURLY_BRACKET_CLOSE",
+        ]
+    ],
+    "function_def": [
+        [
+            "function_declaration",
+            "CURLY_BRACKET_OPEN",
+            "multiple_statements",
+            "CURLY_BRACKET_CLOSE",
+        ]
+    ],
+    "function_declaration": [
+        [
+            "return_type",
+            "FUNCTION",
+            "IDENTIFIER",
+            "ROUND_BRACKET_OPEN",
+            "parameter_list",
+            "ROUND_BRACKET_CLOSE",
+        ]
+    ],
+    "parameter_list": [["parameter", "parameter_list_2"], []],
+    "parameter": [["type", "IDENTIFIER"]],
+    "parameter_list_2": [["COMMA", "parameter", "parameter_list_2"], []],
+    "interface_body": [
+        ["CURLY_BRACKET_OPEN", "interface_members", "CURLY_BRACKET_CLOSE"]
+    ],
+    "interface_members": [["interface_member", "interface_members"], []],
+    "interface_member": [["function_declaration", "SEMICOLON"]],
+    "multiple_statements": [["statement", "multiple_statements"], []],
+    "statement": [
+        ["BR_CONT", "SEMICOLON"],
+        ["return_statement", "SEMICOLON"],
+        ["if_else_statement"],
+        ["while_statement"],
+        ["for_loop_statement"],
+        ["variable_declaration", "SEMICOLON"],
+        ["assignment_statement", "SEMICOLON"],
+    ],
+    "return_statement": [["RETURN", "return_statement_2"]],
+    "return_statement_2": [["value"], []],
+    "value": [
+        ["pointer_initialization"],
+        ["expression"],
+        ["array_initialization"],
+        ["object_creation"],
+    ],
+    "variable_declaration": [["DECLARE", "type", "IDENTIFIER", "init", "list"]],
+    "init": [["ASSIGNMENT_OPERATOR", "value"], []],
+    "list": [["COMMA", "IDENTIFIER", "init", "list"], []],
+    "pointer_initialization": [["REF_OPERATOR", "function_call"]],
+    "if_else_statement": [
+        [
+            "IF",
+            "ROUND_BRACKET_OPEN",
+            "expression",
+            "ROUND_BRACKET_CLOSE",
+            "body",
+            "else",
+        ]
+    ],
+    "else": [["ELSE", "body"], []],
+    "body": [
+        ["statement"],
+        ["CURLY_BRACKET_OPEN", "multiple_statements", "CURLY_BRACKET_CLOSE"],
+    ],
+    "for_loop_statement": [
+        [
+            "FOR",
+            "ROUND_BRACKET_OPEN",
+            "c1",
+            "SEMICOLON",
+            "c2",
+            "SEMICOLON",
+            "c3",
+            "ROUND_BRACKET_CLOSE",
+            "body",
+        ]
+    ],
+    "c1": [["variable_declaration"], ["assignment_statement"]],
+    "c2": [["expression"]],
+    "c3": [["assignment_statement"]],
+    "while_statement": [
+        ["WHILE", "ROUND_BRACKET_OPEN", "expression", "ROUND_BRACKET_CLOSE", "body"]
+    ],
+    "assignment_statement": [
+        [
+            "POINTER_MULTIPLY",
+            "this_super_optional",
+            "IDENTIFIER",
+            "assignment_statement_2",
+        ],
+        ["this_super_optional", "IDENTIFIER", "assignment_statement_2"],
+    ],
+    "assignment_statement_2": [
+        ["dot_arrow", "IDENTIFIER", "assignment_statement_2"],
+        ["array_indexing_1d", "assignment_statement_4"],
+        ["func_args", "assignment_statement_3"],
+        ["assignment"],
+    ],
+    "assignment_statement_3": [
+        ["dot_arrow", "IDENTIFIER", "assignment_statement_2"],
+        ["array_indexing_1d", "assignment_statement_4"],
+        [],
+    ],
+    "assignment_statement_4": [
+        ["DOT", "IDENTIFIER", "assignment_statement_2"],
+        ["null", "assignment"],
+    ],
+    "assignment": [
+        ["ASSIGNMENT_OPERATOR", "value"],
+        ["COMP_ASSIGNMENT_OPERATOR", "value"],
+    ],
+    "this_super_optional": [["THIS", "ARROW"], ["SUPER", "ARROW"], []],
+    "dot_arrow": [["DOT"], ["ARROW"]],
+    "func_args": [["ROUND_BRACKET_OPEN", "arguments", "ROUND_BRACKET_CLOSE"]],
+    "arguments": [["value", "argument_list"], []],
+    "argument_list": [["COMMA", "value", "argument_list"], []],
+    "expression": [["or_expression"]],
+    "or_expression": [["and_expression", "or_expression_2"]],
+    "or_expression_2": [["LOGICAL_OR", "and_expression", "or_expression_2"], []],
+    "and_expression": [["relational_expression", "and_expression_2"]],
+    "and_expression_2": [
+        ["LOGICAL_AND", "relational_expression", "and_expression_2"],
+        [],
+    ],
+    "relational_expression": [["plus_minus_exp", "relational_expression_2"]],
+    "relational_expression_2": [
+        ["RELATIONAL_OPERATOR", "plus_minus_exp", "relational_expression_2"],
+        [],
+    ],
+    "plus_minus_exp": [["mul_div_mod_exp", "plus_minus_exp_2"]],
+    "plus_minus_exp_2": [["PLUS_MINUS", "mul_div_mod_exp", "plus_minus_exp_2"], []],
+    "mul_div_mod_exp": [["factor", "mul_div_mod_exp_2"]],
+    "mul_div_mod_exp_2": [
+        ["POINTER_MULTIPLY", "factor", "mul_div_mod_exp_2"],
+        ["DIVIDE_MODULUS", "factor", "mul_div_mod_exp_2"],
+        [],
+    ],
+    "factor": [
+        ["function_call"],
+        *[[literal] for literal in LITERALS],
+        ["ROUND_BRACKET_OPEN", "expression", "ROUND_BRACKET_CLOSE"],
+        ["NOT_OPERATOR", "factor"],
+        ["pointer_dereferencing"],
+    ],
+    "function_call": [["this_super_optional", "IDENTIFIER", "chaining"]],
+    "chaining": [
+        ["dot_arrow", "IDENTIFIER", "chaining"],
+        ["array_indexing_1d", "chaining_3"],
+        ["func_args", "chaining_2"],
+        [],
+    ],
+    "chaining_2": [
+        ["dot_arrow", "IDENTIFIER", "chaining"],
+        ["array_indexing_1d", "chaining_3"],
+        [],
+    ],
+    "chaining_3": [["DOT", "IDENTIFIER", "chaining"], []],
+    "array_indexing_1d": [
+        [
+            "SQUARE_BRACKET_OPEN",
+            "expression",
+            "SQUARE_BRACKET_CLOSE",
+            "array_indexing_2d",
+        ]
+    ],
+    "array_indexing_2d": [
+        [
+            "SQUARE_BRACKET_OPEN",
+            "expression",
+            "SQUARE_BRACKET_CLOSE",
+            "array_indexing_3d",
+        ],
+        [],
+    ],
+    "array_indexing_3d": [
+        ["SQUARE_BRACKET_OPEN", "expression", "SQUARE_BRACKET_CLOSE"],
+        [],
+    ],
+    "pointer_dereferencing": [["POINTER_MULTIPLY", "function_call"]],
+    "object_creation": [["OBJ_CREATOR", "IDENTIFIER", "func_args"]],
+    "expression_or_object_creation": [["expression"], ["object_creation"]],
+    "array_initialization": [
+        ["SQUARE_BRACKET_OPEN", "1d_array_elements", "SQUARE_BRACKET_CLOSE"]
+    ],
+    "1d_array_elements": [["1d_array_element", "1d_array_elements_2"], []],
+    "1d_array_element": [
+        ["expression_or_object_creation"],
+        ["SQUARE_BRACKET_OPEN", "2d_array_elements", "SQUARE_BRACKET_CLOSE"],
+    ],
+    "1d_array_elements_2": [
+        ["COMMA", "1d_array_element", "1d_array_elements_2"],
+        [],
+    ],
+    "2d_array_elements": [["2d_array_element", "2d_array_elements_2"], []],
+    "2d_array_element": [
+        ["expression_or_object_creation"],
+        ["SQUARE_BRACKET_OPEN", "3d_array_elements", "SQUARE_BRACKET_CLOSE"],
+    ],
+    "2d_array_elements_2": [
+        ["COMMA", "2d_array_element", "2d_array_elements_2"],
+        [],
+    ],
+    "3d_array_elements": [["3d_array_element", "3d_array_elements_2"], []],
+    "3d_array_element": [["expression_or_object_creation"]],
+    "3d_array_elements_2": [
+        ["COMMA", "3d_array_element", "3d_array_elements_2"],
+        [],
+    ],
+    "return_type": [["type"], ["VOID_TYPE"]],
+    "type": [["DATA_TYPE", "type_2"], ["IDENTIFIER", "type_2"]],
+    "type_2": [["POINTER_MULTIPLY"], ["array_type"], []],
+    "array_type": [
+        [
+            "SQUARE_BRACKET_OPEN",
+            "expression_optional",
+            "SQUARE_BRACKET_CLOSE",
+            "array_dimension_list",
+        ]
+    ],
+    "array_dimension_list": [
+        [
+            "SQUARE_BRACKET_OPEN",
+            "expression_optional",
+            "SQUARE_BRACKET_CLOSE",
+            "array_dimension_list_2",
+        ],
+        [],
+    ],
+    "array_dimension_list_2": [
+        ["SQUARE_BRACKET_OPEN", "expression_optional", "SQUARE_BRACKET_CLOSE"],
+        [],
+    ],
+    "expression_optional": [["expression"], []],
+    # adds a "null" node to the enclosing node without consuming anything
+    "null": [[]],
+}
+
+# nonterminals whose symbols are added to the enclosing node, with no node of
+# their own
+INLINE = {"null"}
+
+# tree node names that differ from the nonterminal's name
+NODE_NAMES = {
+    "main_method": "constructor_def",
+    "implement_list": "implement",
+    "argument_list": "arguments_list",
+    "or_expression": "or-expression",
+    "array_indexing_3d": "parse_array_indexing_3d",
+    "3d_array_element": "2d_array_element",
+}
+
+# the message reported when no alternative of a nonterminal fits, as in Parser
+ERRORS = {
+    "program": "expected a class, struct or interface declaration",
+    "class_int_struct_def_list": "expected a class, struct or interface declaration",
+    "class_int_struct_def": "expected a class, struct or interface declaration",
+    "access_mod_optional": (
+        "expected a class, struct or interface declaration or member declaration"
+    ),
+    "class_int_struct_def_2": "expected 'class' , 'struct' or 'interface' keyword",
+    "class_def": "expected a 'class' keyword",
+    "struct_def": "expected a 'struct' or keyword",
+    "interface_def": "expected 'interface' keyword",
+    "inherit_implement": "expected 'inherits' or 'implements' or '{'",
+    "inherit": "expected 'inherits' or 'implements' or '{'",
+    "implement": "expected 'implements' or '{'",
+    "implement_list": "expected ',' or '{'",
+    "class_struct_body": "expected '{'",
+    "class_struct_members": "expected a class and struct member or '}'",
+    "class_struct_member": "expected a class and struct member",
+    "field_declaration_method_def": "expected a field declaration or method definition",
+    "field_declaration_method_def_2": (
+        "expected a field declaration or method definition"
+    ),
+    "static_optional": "expected a type or 'static' keyword",
+    "constructor_def": "expected a 'constructor' function",
+    "main_method": "expected main method",
+    "function_def": "expected method return type",
+    "function_declaration": "expected method return type",
+    "parameter_list": "expected a variable type or ')'",
+    "parameter": "expected a variable type or ')'",
+    "parameter_list_2": "expected ',' or ')'",
+    "interface_body": "expected '{'",
+    "interface_members": "expected a type or '}'",
+    "interface_member": "expected a type",
+    "multiple_statements": "expected a valid statement",
+    "statement": "expected a valid statement",
+    "return_statement": "expected 'return' keyword",
+    "return_statement_2": "expected a valid value to return",
+    "value": "expected a valid value (an expression or pointer init or object)",
+    "variable_declaration": "expected 'declare' keyword for variable declaration",
+    "init": "expected '=' , ',' or ';'",
+    "list": "expected ',' or ';'",
+    "pointer_initialization": "expected reference operator '&'",
+    "if_else_statement": "expected 'if' keyword",
+    "else": "expected 'else' keyword or a statement",
+    "body": "expected a statement or '{'",
+    "for_loop_statement": "expected 'for' keyword",
+    "c1": "expected a variable declaration or assignment",
+    "c2": "expected an expression",
+    "c3": "expected an assignment statement",
+    "while_statement": "expected 'while' keyword",
+    "assignment_statement": "expected 'this', 'super' or an identifier",
+    "assignment_statement_2": (
+        "expected '->', '.', '[', '(', '=' or a compound assignment "
+    ),
+    "assignment_statement_3": "expected '->', '.' , '[' or ';'",
+    "assignment_statement_4": "expected '.', '=' or a compound assignment ",
+    "assignment": "expected '=' or a compound assignment operator",
+    "this_super_optional": "expected 'this', 'super' or an identifier",
+    "dot_arrow": "expected '->' or '.'",
+    "func_args": "expected '('",
+    "arguments": "expected a value or expression or ')'",
+    "argument_list": "expected ',' or ')'",
+    "expression": "expected an expression",
+    "or_expression": "expected an expression",
+    "or_expression_2": "expected '||' or expected OR expression to end",
+    "and_expression": "expected a factor term",
+    "and_expression_2": "expected '&&' or expected AND expression to end",
+    "relational_expression": "expected a factor term",
+    "relational_expression_2": (
+        "expected a rel. operator or expected relational expression to end"
+    ),
+    "plus_minus_exp": "expected a factor term",
+    "plus_minus_exp_2": "expected '+', '-' or expected plus minus expression to end",
+    "mul_div_mod_exp": "expected a factor term",
+    "mul_div_mod_exp_2": (
+        "expected '*', '/', '%' or expected mul div mod expression to end"
+    ),
+    "factor": "expected a factor term",
+    "function_call": "expected 'this', 'super' or an identifier",
+    "chaining": "expected '->', '.', '[', '(' or expected expression to end",
+    "chaining_2": "expected '->', '.', '[', '(' or expected expression to end",
+    "chaining_3": "expected '->', '.', '[', '(' or expected expression to end",
+    "array_indexing_1d": "expected '['",
+    "array_indexing_2d": (
+        "expected '[' , '.' , an operator or an expression termination"
+    ),
+    "array_indexing_3d": (
+        "expected '[' , '.' , an operator or an expression termination"
+    ),
+    "pointer_dereferencing": "expected dereferencing operator '*'",
+    "object_creation": "expected keyword 'makeObj'",
+    "expression_or_object_creation": "expected expression or object creation",
+    "array_initialization": "expected '['",
+    "1d_array_elements": "expected an expression or '[' or ']'",
+    "1d_array_element": "expected expression or '['",
+    "1d_array_elements_2": "expected expression or '[' or ']'",
+    "2d_array_elements": "expected an expression or '[' or ']'",
+    "2d_array_element": "expected expression or '['",
+    "2d_array_elements_2": "expected expression or '[' or ']'",
+    "3d_array_elements": "expected an expression or '[' or ']'",
+    "3d_array_element": "expected expression ",
+    "3d_array_elements_2": "expected expression or '[' or ']'",
+    "return_type": "expected a return type",
+    "type": "expected a type",
+    "type_2": "expected pointer type or array type or 'function' or identifier",
+    "array_type": "expected '['",
+    "array_dimension_list": "expected '[' or 'function' or an identifier",
+    "array_dimension_list_2": "expected '[' or 'function' or an identifier",
+    "expression_optional": "expected an expression or ']'",
+}
+
+# Bump when the table construction below changes in a way
+# grammar_fingerprint() cannot see.
+TABLE_VERSION = 1
+CACHE_DIR = os.path.join(os.path.dirname(__file__), "__pycache__")
+
+# the end of input, in FOLLOW sets
+END = "EOF_MARKER"
+
+
+def is_terminal(symbol: str) -> bool:
+    return symbol not in GRAMMAR
+
+
+def expected_terminal(symbol: str) -> str:
+    # the message for a missing terminal, in the parser's words
+    if symbol == "IDENTIFIER":
+        return "expected an identifier"
+    words = [word for word, token_type in ALL_RULES.items() if token_type.name == symbol]
+    if len(words) == 1 and words[0].isidentifier():
+        return f"expected '{words[0]}' keyword"
+    if words:
+        return "expected " + " or ".join(f"'{word}'" for word in words)
+    return f"expected {symbol.lower().replace('_', ' ')}"
+
+
+def grammar_fingerprint() -> str:
+    # changes whenever anything the prediction table is built from does
+    grammar = [
+        START,
+        sorted(GRAMMAR.items()),
+        sorted(INLINE),
+        sorted(NODE_NAMES.items()),
+        sorted(ERRORS.items()),
+        [(token_type.name, token_type.value) for token_type in tt],
+    ]
+    return hashlib.sha256(repr(grammar).encode("utf-8")).hexdigest()[:16]
+
+
+def check_grammar() -> None:
+    for nonterminal, alternatives in GRAMMAR.items():
+        for alternative in alternatives:
+            for symbol in alternative:
+                if is_terminal(symbol) and symbol not in tt.__members__:
+                    raise ValueError(
+                        f"unknown symbol '{symbol}' in a production of '{nonterminal}'"
+                    )
+
+
+def first_of(symbols: List[str], first: Dict[str, Set[str]]) -> Tuple[Set[str], bool]:
+    # FIRST of a symbol sequence, and whether the sequence derives nothing
+    result: Set[str] = set()
+    for symbol in symbols:
+        if is_terminal(symbol):
+            result.add(symbol)
+            return result, False
+        result |= first[symbol] - {""}
+        if "" not in first[symbol]:
+            return result, False
+    return result, True
+
+
+def first_sets() -> Dict[str, Set[str]]:
+    # "" in a FIRST set marks a nonterminal that can derive nothing
+    first: Dict[str, Set[str]] = {nonterminal: set() for nonterminal in GRAMMAR}
+    changed = True
+    while changed:
+        changed = False
+        for nonterminal, alternatives in GRAMMAR.items():
+            for alternative in alternatives:
+                symbols, nullable = first_of(alternative, first)
+                if nullable:
+                    symbols.add("")
+                if not symbols <= first[nonterminal]:
+                    first[nonterminal] |= symbols
+                    changed = True
+    return first
+
+
+def follow_sets(first: Dict[str, Set[str]]) -> Dict[str, Set[str]]:
+    follow: Dict[str, Set[str]] = {nonterminal: set() for nonterminal in GRAMMAR}
+    follow[START].add(END)
+    changed = True
+    while changed:
+        changed = False
+        for nonterminal, alternatives in GRAMMAR.items():
+            for alternative in alternatives:
+                for position, symbol in enumerate(alternative):
+                    if is_terminal(symbol):
+                        continue
+                    symbols, nullable = first_of(alternative[position + 1 :], first)
+                    if nullable:
+                        symbols |= follow[nonterminal]
+                    if not symbols <= follow[symbol]:
+                        follow[symbol] |= symbols
+                        changed = True
+    return follow
+
+
+class PredictionTable:
+    def __init__(
+        self,
+        nonterminals: List[str],
+        node_names: List[str | None],
+        errors: List[str],
+        productions: List[Tuple],
+        rows: List[List[int]],
+        first: Dict[str, Set[str]],
+        follow: Dict[str, Set[str]],
+        conflicts: List[Tuple[str, str, int, int]],
+    ) -> None:
+        # Nonterminals are numbered in GRAMMAR order. A production is a tuple
+        # of symbols, a TokenType for a terminal and the number of a
+        # nonterminal otherwise.
+        self.nonterminals = nonterminals
+        self.numbers = {name: number for number, name in enumerate(nonterminals)}
+        # None for an inline nonterminal
+        self.node_names = node_names
+        self.errors = errors
+        self.productions = productions
+        # rows[nonterminal][token_type.value] is the number of the production
+        # to expand, or -1 for a syntax error
+        self.rows = rows
+        self.first = first
+        self.follow = follow
+        # (nonterminal, terminal, chosen alternative, dropped alternative)
+        self.conflicts = conflicts
+
+
+
+def build_table() -> PredictionTable:
+    check_grammar()
+    first = first_sets()
+    follow = follow_sets(first)
+
+    nonterminals = list(GRAMMAR)
+    numbers = {name: number for number, name in enumerate(nonterminals)}
+    width = max(token_type.value for token_type in tt) + 1
+    productions: List[Tuple] = []
+    rows: List[List[int]] = []
+    conflicts: List[Tuple[str, str, int, int]] = []
+    for nonterminal, alternatives in GRAMMAR.items():
+        row = [-1] * width
+        chosen: Dict[str, int] = {}
+        for index, alternative in enumerate(alternatives):
+            production = len(productions)
+            productions.append(
+                tuple(
+                    tt[symbol] if is_terminal(symbol) else numbers[symbol]
+                    for symbol in alternative
+                )
+            )
+            symbols, nullable = first_of(alternative, first)
+            if nullable:
+                symbols |= follow[nonterminal]
+            for symbol in sorted(symbols):
+                if symbol in chosen:
+                    conflicts.append((nonterminal, symbol, chosen[symbol], index))
+                    continue
+                chosen[symbol] = index
+                row[tt[symbol].value] = production
+        rows.append(row)
+
+    return PredictionTable(
+        nonterminals,
+        [
+            None if name in INLINE else NODE_NAMES.get(name, name)
+            for name in nonterminals
+        ],
+        [ERRORS.get(name, "") for name in nonterminals],
+        productions,
+        rows,
+        first,
+        follow,
+        conflicts,
+    )
+
+
+def load_table(cache_dir: str = CACHE_DIR) -> PredictionTable:
+    path = os.path.join(
+        cache_dir, f"ll1_table-{grammar_fingerprint()}-v{TABLE_VERSION}.pickle"
+    )
+    return load_pickled(path, build_table)
@@ -0,0 +1,144 @@
+from parser.grammar import START, PredictionTable, expected_terminal, load_table
+from parser.parser import Parser
+from parser.tree import TreeNode
+from lexer.interner import Interner
+from lexer.line_index import LineIndex
+from lexer.token import Token
+from lexer.token_type import TokenType as tt
+from semantics.utils import DefinitionTableEntry
+
+
+class ParserHooks:
+    # Semantic actions for LL1Parser, called as nonterminals are expanded and
+    # finished and as tokens are matched. `node` is the node the nonterminal
+    # builds, or the one the token is added to. A hook that finds an error
+    # reports it with parser.display_semantic_error and returns False, which
+    # stops the parse.
+    def enter(self, parser: "LL1Parser", nonterminal: str, node: TreeNode):
+        pass
+
+    def exit(self, parser: "LL1Parser", nonterminal: str, node: TreeNode):
+        pass
+
+    def shift(self, parser: "LL1Parser", token: Token, node: TreeNode):
+        pass
+
+
+class DefinitionHooks(ParserHooks):
+    # Fills the definition table with the program's classes, structs and
+    # interfaces, at the point Parser inserts them: after the inherits and
+    # implements clauses, before the body.
+    def __init__(self) -> None:
+        self.entry: DefinitionTableEntry | None = None
+
+    def enter(self, parser, nonterminal, node):
+        if nonterminal == "class_int_struct_def":
+            self.entry = DefinitionTableEntry()
+
+    def shift(self, parser, token, node):
+        entry = self.entry
+        if entry is None:
+            return
+        if node.node_type == "access_mod_optional":
+            entry.access_modifier = token.value
+        elif token.token_type in {tt.CLASS, tt.STRUCT, tt.INTERFACE}:
+            entry.type = token.value
+        elif token.token_type == tt.IDENTIFIER:
+            if node.node_type in {"class_def", "struct_def", "interface_def"}:
+                entry.name = token.value
+            elif node.node_type == "inherit":
+                entry.parent_class = token.value
+            elif node.node_type == "implement":
+                entry.interface_list.append(token.value)
+
+    def exit(self, parser, nonterminal, node):
+        entry = self.entry
+        if entry is None:
+            return
+        if nonterminal == "inherit_implement" or (
+            nonterminal == "inherit" and entry.type == "interface"
+        ):
+            self.entry = None
+            if not parser.st_manager.insert_into_definition_table(entry):
+                parser.display_semantic_error("Definition Redeclaration error")
+                return False
+            parser.st_manager.current_def_name = entry.name
+
+
+class LL1Parser(Parser):
+    # Parses with the grammar in parser.grammar and its prediction table,
+    # using an explicit stack instead of one method per nonterminal. It
+    # builds the same tree as Parser with its default options and reports
+    # syntax errors in the same words. Semantic checks are left to hooks.
+    def __init__(
+        self,
+        tokens,
+        interner: Interner | None = None,
+        line_index: LineIndex | None = None,
+        hooks: ParserHooks | None = None,
+        table: PredictionTable | None = None,
+    ) -> None:
+        super().__init__(tokens, interner, line_index)
+        self.hooks = hooks
+        self.table = table if table is not None else load_table()
+        # productions reversed, in the order their symbols are pushed
+        self.expansions = [
+            tuple(reversed(production)) for production in self.table.productions
+        ]
+
+    def parse_program(self):
+        table = self.table
+        rows = table.rows
+        node_names = table.node_names
+        expansions = self.expansions
+        hooks = self.hooks
+        tokens = self.tokens
+
+        # Stack entries are (symbol, node the symbol adds to). A nonterminal
+        # is its number; ~number marks where it ends, for the exit hook.
+        root = TreeNode(START)
+        stack = [(table.numbers[START], root)]
+        while stack:
+            symbol, parent = stack.pop()
+            token = tokens[self.curr_index]
+
+            if symbol.__class__ is int:
+                if symbol < 0:
+                    if hooks.exit(self, table.nonterminals[~symbol], parent) is False:
+                        return
+                    continue
+
+                number = rows[symbol][token.token_type.value]
+                if number == -1:
+                    self.display_error(table.errors[symbol])
+                    return
+
+                name = node_names[symbol]
+                if name is None:
+                    node = parent
+                else:
+                    node = TreeNode(name)
+                    parent.add_child(node)
+                expansion = expansions[number]
+                if not expansion:
+                    node.add_child(TreeNode("null"))
+
+                if hooks is not None:
+                    nonterminal = table.nonterminals[symbol]
+                    if hooks.enter(self, nonterminal, node) is False:
+                        return
+                    stack.append((~symbol, node))
+                for child in expansion:
+                    stack.append((child, node))
+
+            elif token.token_type is symbol:
+                parent.add_child(TreeNode(symbol.name, token.value))
+                if hooks is not None and hooks.shift(self, token, parent) is False:
+                    return
+                self.curr_index += 1
+
+            else:
+                self.display_error(expected_terminal(symbol.name))
+                return
+
+        return root.children[0]
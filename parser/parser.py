@@ -1,4 +1,44 @@
-from parser.tree import TreeNode
+from parser.ast_nodes import build_ast
+from parser.tree import NO_NODE, TreeNode
+from parser.tree_arena import TreeArena
+from parser.token_sets import (
+    ASSIGNMENT_OPERATORS,
+    DOT_ARROW,
+    EXPRESSION_END,
+    FIRST_ARRAY_ELEMENT,
+    FIRST_ASSIGNMENT,
+    FIRST_CLASS_STRUCT_MEMBER,
+    FIRST_DEFINITION,
+    FIRST_EXPRESSION,
+    FIRST_EXPRESSION_OR_OBJECT,
+    FIRST_FIELD_OR_METHOD,
+    FIRST_FUNCTION_CALL,
+    FIRST_INHERIT_IMPLEMENT,
+    FIRST_MULTIPLE_STATEMENTS,
+    FIRST_PROGRAM,
+    FIRST_RETURN_TYPE,
+    FIRST_STATEMENT,
+    FIRST_TYPE,
+    FIRST_VALUE,
+    FOLLOW_ACCESS_MOD,
+    FOLLOW_AND_EXPRESSION,
+    FOLLOW_ELSE,
+    FOLLOW_FACTOR,
+    FOLLOW_INDEXING,
+    FOLLOW_INHERIT,
+    FOLLOW_INIT,
+    FOLLOW_MUL_DIV_MOD_EXP,
+    FOLLOW_PLUS_MINUS_EXP,
+    FOLLOW_RELATIONAL_EXPRESSION,
+    FOLLOW_STATIC,
+    FOLLOW_TYPE,
+    KIND_BITS,
+    LITERALS,
+    MUL_DIV_MOD_OPERATORS,
+    SYNC_DEFINITION,
+)
+from lexer.interner import Interner
+from lexer.line_index import LineIndex
 from lexer.token import Token
 from lexer.token_type import TokenType as tt
 from semantics.symbol_table_manager import SymbolTableManager
@@ -8,35 +48,190 @@ from semantics.utils import (
     MemberTableEntry,
     TypeInfo,
 )
-from typing import List, Union
+from typing import Dict, List, Union
+
+EXPRESSION_ENGINES = ["descent", "precedence"]
+PARSE_MODES = ["cst", "ast", "check", "arena"]
+
+# binding power of the binary operators, for the precedence engine
+BINARY_PRECEDENCE = {
+    tt.LOGICAL_OR: 1,
+    tt.LOGICAL_AND: 2,
+    tt.RELATIONAL_OPERATOR: 3,
+    tt.PLUS_MINUS: 4,
+    tt.POINTER_MULTIPLY: 5,
+    tt.DIVIDE_MODULUS: 5,
+}
+MAX_PRECEDENCE = max(BINARY_PRECEDENCE.values())
+
+
+def array_of(element_type: TypeInfo) -> TypeInfo:
+    # a new type, as the element type may belong to a variable or a node
+    array_type = TypeInfo(element_type.data_type)
+    array_type.dimensions = element_type.dimensions + 1
+    array_type.is_pointer = element_type.is_pointer
+    return array_type
 
 
 class Parser:
-    def __init__(self, tokens) -> None:
+    def __init__(
+        self,
+        tokens,
+        interner: Interner | None = None,
+        line_index: LineIndex | None = None,
+        flatten_lists: bool = False,
+        expressions: str = "descent",
+        mode: str = "cst",
+        recover_errors: bool = False,
+    ) -> None:
+        if expressions not in EXPRESSION_ENGINES:
+            raise ValueError(
+                f"unknown expression engine '{expressions}', "
+                f"expected one of {EXPRESSION_ENGINES}"
+            )
+        if mode not in PARSE_MODES:
+            raise ValueError(
+                f"unknown parse mode '{mode}', expected one of {PARSE_MODES}"
+            )
         self.tokens: List[Token] = tokens
+        # each token's kind bit, for testing it against the token sets
+        self.kind_bits = [KIND_BITS[token.token_type.value] for token in tokens]
         self.curr_index = 0
         self.parse_tree: Union[TreeNode, None] = None
-        self.st_manager = SymbolTableManager()
+        self.st_manager = SymbolTableManager(interner)
+        # tokens' symbol IDs are only valid in the symbol tables when they
+        # share the lexer's interner
+        self.shares_interner = interner is not None
+        # with a line index, errors report the column of the token too
+        self.line_index = line_index
+        # List productions are parsed with loops. By default they still build
+        # the grammar's right-nested chain of list nodes; flatten_lists puts
+        # every element of a list directly under its first node instead.
+        self.flatten_lists = flatten_lists
+        # "precedence" parses binary operators by precedence climbing into
+        # binary_expression nodes instead of the grammar's expression levels
+        self.expressions = expressions
+        # "ast" is a post-pass: the full parse tree is built as in "cst" mode,
+        # then parse() converts it into the typed nodes of parser.ast_nodes,
+        # using the types recorded here while parsing, and drops it
+        self.mode = mode
+        self.node_types: Dict[TreeNode, TypeInfo] | None = (
+            {} if mode == "ast" else None
+        )
+        # "check" runs every check but builds no tree: all nodes are NO_NODE
+        # and parse() returns None. "arena" builds the parse tree in a
+        # TreeArena and returns a handle to its root.
+        self.arena: TreeArena | None = None
+        if mode == "check":
+            self.new_node = self.no_node
+        elif mode == "arena":
+            self.arena = TreeArena()
+            self.new_node = self.arena.new_node
+        else:
+            self.new_node = TreeNode
+        # With recover_errors, a statement, member or definition that fails
+        # to parse is skipped up to the next ';', '}' or class, struct or
+        # interface keyword and left in the tree as an "error" node, so one
+        # parse reports every error instead of stopping at the first.
+        self.recover_errors = recover_errors
+        self.error_count = 0
 
     @property
     def curr_token(self) -> Token:
         return self.tokens[self.curr_index]
 
+    @property
+    def curr_symbol_id(self) -> int | None:
+        if not self.shares_interner:
+            return None
+        token = self.curr_token
+        # a TokenStream keeps no symbol IDs, so its identifiers are interned
+        # here, into the same interner the lexer would have used
+        if token.symbol_id is None:
+            return self.st_manager.interner.intern(token.value)
+        return token.symbol_id
+
+    @property
+    def curr_bit(self) -> int:
+        return self.kind_bits[self.curr_index]
+
     def advance(self):
         self.curr_index += 1
 
+    @property
+    def curr_location(self) -> str:
+        if self.line_index is None or self.curr_token.start is None:
+            return f"line# {self.curr_token.line_number}"
+        line, column = self.line_index.position(self.curr_token.start)
+        return f"line# {line}, column# {column}"
+
     def display_error(self, msg):
+        self.error_count += 1
         print(
-            f"Syntax error at line# {self.curr_token.line_number} :\n  error parsing '{self.curr_token.value}', {msg}"
+            f"Syntax error at {self.curr_location} :\n  error parsing '{self.curr_token.value}', {msg}"
         )
         print("-" * 70)
 
     def display_semantic_error(self, msg, show_line_num=True):
+        self.error_count += 1
         print(
-            f"Semantic error {f'at line# {self.curr_token.line_number}' if show_line_num else ''} :\n  {msg}"
+            f"Semantic error {f'at {self.curr_location}' if show_line_num else ''} :\n  {msg}"
         )
         print("-" * 70)
 
+    def record_type(self, node: TreeNode, type: TypeInfo | None) -> None:
+        if self.node_types is not None:
+            self.node_types[node] = type
+
+    def no_node(self, node_type: str, value: str | None = None) -> TreeNode:
+        return NO_NODE
+
+    def list_tail(self, node: TreeNode) -> TreeNode:
+        # the node the next element of a list is added to
+        if self.flatten_lists or node is NO_NODE:
+            return node
+        tail = self.new_node(node.node_type)
+        node.add_child(tail)
+        return tail
+
+    def recover(self, scope_depth: int) -> TreeNode | None:
+        # Panic mode for a statement or member that failed to parse: skips
+        # past the next ';' or block, or up to the '}' that ends the enclosing
+        # block, and returns the "error" node that takes its place. Reaching
+        # a top-level keyword or the end gives up the whole definition.
+        if not self.recover_errors:
+            return
+        del self.st_manager.scope_stack[scope_depth:]
+        depth = 0
+        while not self.curr_bit & SYNC_DEFINITION:
+            token_type = self.curr_token.token_type
+            if token_type == tt.CURLY_BRACKET_OPEN:
+                depth += 1
+            elif token_type == tt.CURLY_BRACKET_CLOSE:
+                if depth == 0:
+                    return self.new_node("error")
+                depth -= 1
+                if depth == 0:
+                    self.advance()
+                    return self.new_node("error")
+            elif token_type == tt.SEMICOLON and depth == 0:
+                self.advance()
+                return self.new_node("error")
+            self.advance()
+
+    def recover_definition(self, start_index: int) -> TreeNode | None:
+        # panic mode for a definition: skips to the next top-level keyword
+        if not self.recover_errors:
+            return
+        self.st_manager.scope_stack.clear()
+        self.st_manager.current_def_name = None
+        self.st_manager.curr_func_return_type = None
+        if self.curr_index == start_index:
+            self.advance()
+        while not self.curr_bit & SYNC_DEFINITION:
+            self.advance()
+        return self.new_node("error")
+
     def get_all_symbol_tables(self):
         symbol_tables_str = ""
         symbol_tables_str += self.st_manager.get_def_table()
@@ -46,10 +241,18 @@ class Parser:
 
     def parse(self):
         node = self.parse_program()
+        if node is not None and self.mode == "ast":
+            node = build_ast(node, self.node_types)
+            # the recorded types are keyed by the parse tree, let it go
+            self.node_types.clear()
+        elif self.mode == "check":
+            node = None
         self.parse_tree = node
 
         if self.curr_token.token_type != tt.EOF_MARKER:
             print("All tokens were not parsed :(")
+        elif self.recover_errors and self.error_count:
+            print(f"All tokens parsed with {self.error_count} error(s) :(")
         else:
             print("All tokens parsed successfully :)")
 
@@ -57,14 +260,8 @@ class Parser:
 
 
     def parse_program(self):
-        node = TreeNode("program")
-        if self.curr_token.token_type in {
-            tt.ACCESS_MODIFIER,
-            tt.CLASS,
-            tt.STRUCT,
-            tt.INTERFACE,
-            tt.EOF_MARKER,
-        }:
+        node = self.new_node("program")
+        if self.curr_bit & FIRST_PROGRAM:
             child = self.parse_class_int_struct_def_list()
             if child is None:
                 return
@@ -80,45 +277,32 @@ class Parser:
         # return TreeNode("error")
 
     def parse_class_int_struct_def_list(self):
-        node = TreeNode("class_int_struct_def_list")
+        head = node = self.new_node("class_int_struct_def_list")
 
-        if self.curr_token.token_type in {
-            tt.ACCESS_MODIFIER,
-            tt.CLASS,
-            tt.STRUCT,
-            tt.INTERFACE,
-        }:
-            child = self.parse_class_int_struct_def()
-            if child is None:
-                return
-            node.add_child(child)
-
-            child = self.parse_class_int_struct_def_list()
+        while self.curr_token.token_type != tt.EOF_MARKER:
+            start_index = self.curr_index
+            if self.curr_bit & FIRST_DEFINITION:
+                child = self.parse_class_int_struct_def()
+            else:
+                self.display_error("expected a class, struct or interface declaration")
+                child = None
             if child is None:
-                return
+                child = self.recover_definition(start_index)
+                if child is None:
+                    return
             node.add_child(child)
 
-            return node
+            node = self.list_tail(node)
 
-        elif self.curr_token.token_type in {tt.EOF_MARKER}:
-            node.add_child(TreeNode("null"))
-            return node
-
-        self.display_error("expected a class, struct or interface declaration")
-        # self.advance()
-        # return TreeNode("error")
+        node.add_child(self.new_node("null"))
+        return head
 
     def parse_class_int_struct_def(self):
-        node = TreeNode("class_int_struct_def")
+        node = self.new_node("class_int_struct_def")
 
         def_table_entry = DefinitionTableEntry()
 
-        if self.curr_token.token_type in {
-            tt.ACCESS_MODIFIER,
-            tt.CLASS,
-            tt.STRUCT,
-            tt.INTERFACE,
-        }:
+        if self.curr_bit & FIRST_DEFINITION:
             child = self.parse_access_mod_optional(def_table_entry)
             if child is None:
                 return
@@ -138,25 +322,18 @@ class Parser:
     def parse_access_mod_optional(
         self, table_entry: DefinitionTableEntry | MemberTableEntry
     ):
-        node = TreeNode("access_mod_optional")
+        node = self.new_node("access_mod_optional")
         if self.curr_token.token_type == tt.ACCESS_MODIFIER:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             table_entry.access_modifier = self.curr_token.value
             self.advance()
             return node
 
-        elif self.curr_token.token_type in {
-            tt.CLASS,
-            tt.STRUCT,
-            tt.INTERFACE,
-            tt.STATIC,
-            tt.DATA_TYPE,
-            tt.VOID_TYPE,
-            tt.IDENTIFIER,
-            tt.DECLARE,
-        }:
-            node.add_child(TreeNode("null"))
+        elif self.curr_bit & FOLLOW_ACCESS_MOD:
+            node.add_child(self.new_node("null"))
             table_entry.access_modifier = "public"
             return node
 
@@ -167,22 +344,22 @@ class Parser:
         # return TreeNode("error")
 
     def parse_class_int_struct_def_2(self, def_table_entry: DefinitionTableEntry):
-        node = TreeNode("class_int_struct_def_2")
-        if self.curr_token.token_type in {tt.CLASS}:
+        node = self.new_node("class_int_struct_def_2")
+        if self.curr_token.token_type == tt.CLASS:
             child = self.parse_class_def(def_table_entry)
             if child is None:
                 return
             node.add_child(child)
             return node
 
-        elif self.curr_token.token_type in {tt.STRUCT}:
+        elif self.curr_token.token_type == tt.STRUCT:
             child = self.parse_struct_def(def_table_entry)
             if child is None:
                 return
             node.add_child(child)
             return node
 
-        elif self.curr_token.token_type in {tt.INTERFACE}:
+        elif self.curr_token.token_type == tt.INTERFACE:
             child = self.parse_interface_def(def_table_entry)
             if child is None:
                 return
@@ -194,10 +371,12 @@ class Parser:
         # return TreeNode("error")
 
     def parse_class_def(self, def_table_entry: DefinitionTableEntry):
-        node = TreeNode("class_def")
+        node = self.new_node("class_def")
 
         if self.curr_token.token_type == tt.CLASS:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             def_table_entry.type = "class"
             self.advance()
@@ -208,9 +387,12 @@ class Parser:
             return
 
         if self.curr_token.token_type == tt.IDENTIFIER:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             def_table_entry.name = self.curr_token.value
+            name_id = self.curr_symbol_id
             self.advance()
         else:
             self.display_error("expected an identifier")
@@ -223,7 +405,7 @@ class Parser:
             return
         node.add_child(child)
 
-        if not self.st_manager.insert_into_definition_table(def_table_entry):
+        if not self.st_manager.insert_into_definition_table(def_table_entry, name_id):
             self.display_semantic_error(f"Definition Redeclaration error")
             return
         self.st_manager.current_def_name = def_table_entry.name
@@ -252,9 +434,11 @@ class Parser:
         return node
 
     def parse_struct_def(self, def_table_entry):
-        node = TreeNode("struct_def")
+        node = self.new_node("struct_def")
         if self.curr_token.token_type == tt.STRUCT:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             def_table_entry.type = "struct"
             self.advance()
@@ -265,9 +449,12 @@ class Parser:
             return
 
         if self.curr_token.token_type == tt.IDENTIFIER:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             def_table_entry.name = self.curr_token.value
+            name_id = self.curr_symbol_id
             self.advance()
         else:
             self.display_error("expected an identifier")
@@ -280,7 +467,7 @@ class Parser:
             return
         node.add_child(child)
 
-        if not self.st_manager.insert_into_definition_table(def_table_entry):
+        if not self.st_manager.insert_into_definition_table(def_table_entry, name_id):
             self.display_semantic_error(f"Definition Redeclaration error")
             return
 
@@ -310,9 +497,11 @@ class Parser:
         return node
 
     def parse_interface_def(self, def_table_entry):
-        node = TreeNode("interface_def")
+        node = self.new_node("interface_def")
         if self.curr_token.token_type == tt.INTERFACE:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             def_table_entry.type = "interface"
             self.advance()
@@ -323,9 +512,12 @@ class Parser:
             return
 
         if self.curr_token.token_type == tt.IDENTIFIER:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             def_table_entry.name = self.curr_token.value
+            name_id = self.curr_symbol_id
             self.advance()
         else:
             self.display_error("expected an identifier")
@@ -338,7 +530,7 @@ class Parser:
             return
         node.add_child(child)
 
-        if not self.st_manager.insert_into_definition_table(def_table_entry):
+        if not self.st_manager.insert_into_definition_table(def_table_entry, name_id):
             self.display_semantic_error(f"Definition Redeclaration error")
             return
 
@@ -354,12 +546,8 @@ class Parser:
         return node
 
     def parse_inherit_implement(self, def_table_entry: DefinitionTableEntry):
-        node = TreeNode("inherit_implement")
-        if self.curr_token.token_type in {
-            tt.INHERITS,
-            tt.IMPLEMENTS,
-            tt.CURLY_BRACKET_OPEN,
-        }:
+        node = self.new_node("inherit_implement")
+        if self.curr_bit & FIRST_INHERIT_IMPLEMENT:
             child = self.parse_inherit(def_table_entry)
             if child is None:
                 return
@@ -377,21 +565,23 @@ class Parser:
         # return TreeNode("error")
 
     def parse_inherit(self, def_table_entry: DefinitionTableEntry):
-        node = TreeNode("inherit")
+        node = self.new_node("inherit")
         if self.curr_token.token_type == tt.INHERITS:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             self.advance()
 
             if self.curr_token.token_type == tt.IDENTIFIER:
-                child = TreeNode(
-                    self.curr_token.token_type.name,
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
                 )
                 node.add_child(child)
 
                 parent_class_name = self.curr_token.value
                 parent_class_def_table = self.st_manager.lookup_definition_table(
-                    parent_class_name
+                    parent_class_name, self.curr_symbol_id
                 )
                 if parent_class_def_table is None:
                     self.display_semantic_error(
@@ -419,8 +609,8 @@ class Parser:
 
             return node
 
-        elif self.curr_token.token_type in {tt.CURLY_BRACKET_OPEN, tt.IMPLEMENTS}:
-            node.add_child(TreeNode("null"))
+        elif self.curr_bit & FOLLOW_INHERIT:
+            node.add_child(self.new_node("null"))
             return node
 
         self.display_error("expected 'inherits' or 'implements' or '{'")
@@ -428,18 +618,22 @@ class Parser:
         # return TreeNode("error")
 
     def parse_implement(self, def_table_entry: DefinitionTableEntry):
-        node = TreeNode("implement")
+        node = self.new_node("implement")
         if self.curr_token.token_type == tt.IMPLEMENTS:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             self.advance()
 
             if self.curr_token.token_type == tt.IDENTIFIER:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 interface_name = self.curr_token.value
                 interface_def_table = self.st_manager.lookup_definition_table(
-                    interface_name
+                    interface_name, self.curr_symbol_id
                 )
                 if interface_def_table is None:
                     self.display_semantic_error(
@@ -472,8 +666,8 @@ class Parser:
 
             return node
 
-        elif self.curr_token.token_type in {tt.CURLY_BRACKET_OPEN}:
-            node.add_child(TreeNode("null"))
+        elif self.curr_token.token_type == tt.CURLY_BRACKET_OPEN:
+            node.add_child(self.new_node("null"))
             return node
 
         self.display_error("expected 'implements' or '{'")
@@ -481,18 +675,22 @@ class Parser:
         # return TreeNode("error")
 
     def parse_implement_list(self, def_table_entry: DefinitionTableEntry):
-        node = TreeNode("implement")
+        node = self.new_node("implement")
         if self.curr_token.token_type == tt.COMMA:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             self.advance()
 
             if self.curr_token.token_type == tt.IDENTIFIER:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 interface_name = self.curr_token.value
                 interface_def_table = self.st_manager.lookup_definition_table(
-                    interface_name
+                    interface_name, self.curr_symbol_id
                 )
                 if interface_def_table is None:
                     self.display_semantic_error(
@@ -524,8 +722,8 @@ class Parser:
 
             return node
 
-        elif self.curr_token.token_type in {tt.CURLY_BRACKET_OPEN}:
-            node.add_child(TreeNode("null"))
+        elif self.curr_token.token_type == tt.CURLY_BRACKET_OPEN:
+            node.add_child(self.new_node("null"))
             return node
 
         self.display_error("expected ',' or '{'")
@@ -533,9 +731,11 @@ class Parser:
         # return TreeNode("error")
 
     def parse_class_struct_body(self):
-        node = TreeNode("class_struct_body")
+        node = self.new_node("class_struct_body")
         if self.curr_token.token_type == tt.CURLY_BRACKET_OPEN:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             self.advance()
 
@@ -545,7 +745,9 @@ class Parser:
             node.add_child(child)
 
             if self.curr_token.token_type == tt.CURLY_BRACKET_CLOSE:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 self.advance()
             else:
@@ -561,62 +763,43 @@ class Parser:
         # return TreeNode("error")
 
     def parse_class_struct_members(self):
-        node = TreeNode("class_struct_members")
-        if self.curr_token.token_type in {
-            tt.CONSTRUCTOR,
-            tt.MAIN,
-            tt.ACCESS_MODIFIER,
-            tt.STATIC,
-            tt.DATA_TYPE,
-            tt.VOID_TYPE,
-            tt.IDENTIFIER,
-            tt.DECLARE,
-        }:
-            child = self.parse_class_struct_member()
-            if child is None:
-                return
-            node.add_child(child)
-
-            child = self.parse_class_struct_members()
+        head = node = self.new_node("class_struct_members")
+        while self.curr_token.token_type != tt.CURLY_BRACKET_CLOSE:
+            scope_depth = len(self.st_manager.scope_stack)
+            if self.curr_bit & FIRST_CLASS_STRUCT_MEMBER:
+                child = self.parse_class_struct_member()
+            else:
+                self.display_error("expected a class and struct member or '}'")
+                child = None
             if child is None:
-                return
+                child = self.recover(scope_depth)
+                if child is None:
+                    return
             node.add_child(child)
 
-            return node
-
-        elif self.curr_token.token_type in {tt.CURLY_BRACKET_CLOSE}:
-            node.add_child(TreeNode("null"))
-            return node
+            node = self.list_tail(node)
 
-        self.display_error("expected a class and struct member or '}'")
-        # self.advance()
-        # return TreeNode("error")
+        node.add_child(self.new_node("null"))
+        return head
 
     def parse_class_struct_member(self):
-        node = TreeNode("class_struct_member")
+        node = self.new_node("class_struct_member")
         member_table_entry = MemberTableEntry()
-        if self.curr_token.token_type in {
-            tt.ACCESS_MODIFIER,
-            tt.STATIC,
-            tt.DATA_TYPE,
-            tt.VOID_TYPE,
-            tt.IDENTIFIER,
-            tt.DECLARE,
-        }:
+        if self.curr_bit & FIRST_FIELD_OR_METHOD:
             child = self.parse_field_declaration_method_def(member_table_entry)
             if child is None:
                 return
             node.add_child(child)
             return node
 
-        elif self.curr_token.token_type in {tt.CONSTRUCTOR}:
+        elif self.curr_token.token_type == tt.CONSTRUCTOR:
             child = self.parse_constructor_def(member_table_entry)
             if child is None:
                 return
             node.add_child(child)
             return node
 
-        elif self.curr_token.token_type in {tt.MAIN}:
+        elif self.curr_token.token_type == tt.MAIN:
             if (
                 self.st_manager.lookup_definition_table(
                     self.st_manager.current_def_name
@@ -642,15 +825,8 @@ class Parser:
         # return TreeNode("error")
 
     def parse_field_declaration_method_def(self, member_table_entry: MemberTableEntry):
-        node = TreeNode("field_declaration_method_def")
-        if self.curr_token.token_type in {
-            tt.ACCESS_MODIFIER,
-            tt.STATIC,
-            tt.DATA_TYPE,
-            tt.VOID_TYPE,
-            tt.IDENTIFIER,
-            tt.DECLARE,
-        }:
+        node = self.new_node("field_declaration_method_def")
+        if self.curr_bit & FIRST_FIELD_OR_METHOD:
             child = self.parse_access_mod_optional(member_table_entry)
             if child is None:
                 return
@@ -675,15 +851,17 @@ class Parser:
     def parse_field_declaration_method_def_2(
         self, member_table_entry: MemberTableEntry
     ):
-        node = TreeNode("field_declaration_method_def_2")
-        if self.curr_token.token_type in {tt.DECLARE}:
+        node = self.new_node("field_declaration_method_def_2")
+        if self.curr_token.token_type == tt.DECLARE:
             child = self.parse_variable_declaration(member_table_entry, is_member=True)
             if child is None:
                 return
             node.add_child(child)
 
             if self.curr_token.token_type == tt.SEMICOLON:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 self.advance()
             else:
@@ -694,7 +872,7 @@ class Parser:
 
             return node
 
-        elif self.curr_token.token_type in {tt.DATA_TYPE, tt.IDENTIFIER, tt.VOID_TYPE}:
+        elif self.curr_bit & FIRST_RETURN_TYPE:
             child = self.parse_function_def(member_table_entry)
             if child is None:
                 return
@@ -707,21 +885,18 @@ class Parser:
         # return TreeNode("error")
 
     def parse_static_optional(self, member_table_entry: MemberTableEntry):
-        node = TreeNode("static_optional")
+        node = self.new_node("static_optional")
         if self.curr_token.token_type == tt.STATIC:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             member_table_entry.is_static = True
             self.advance()
             return node
 
-        elif self.curr_token.token_type in {
-            tt.DATA_TYPE,
-            tt.VOID_TYPE,
-            tt.IDENTIFIER,
-            tt.DECLARE,
-        }:
-            node.add_child(TreeNode("null"))
+        elif self.curr_bit & FOLLOW_STATIC:
+            node.add_child(self.new_node("null"))
             return node
 
         self.display_error("expected a type or 'static' keyword")
@@ -729,9 +904,11 @@ class Parser:
         # return TreeNode("error")
 
     def parse_constructor_def(self, member_table_entry: MemberTableEntry):
-        node = TreeNode("constructor_def")
+        node = self.new_node("constructor_def")
         if self.curr_token.token_type == tt.CONSTRUCTOR:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             member_table_entry.name = "constructor"
             member_table_entry.type.is_function = True
@@ -741,7 +918,9 @@ class Parser:
             self.advance()
 
             if self.curr_token.token_type == tt.ROUND_BRACKET_OPEN:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 self.st_manager.create_scope()
                 self.advance()
@@ -757,7 +936,9 @@ class Parser:
             node.add_child(child)
 
             if self.curr_token.token_type == tt.ROUND_BRACKET_CLOSE:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 self.advance()
             else:
@@ -771,7 +952,9 @@ class Parser:
                 return
 
             if self.curr_token.token_type == tt.CURLY_BRACKET_OPEN:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 self.advance()
             else:
@@ -786,7 +969,9 @@ class Parser:
             node.add_child(child)
 
             if self.curr_token.token_type == tt.CURLY_BRACKET_CLOSE:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 self.advance()
             else:
@@ -804,9 +989,11 @@ class Parser:
         # return TreeNode("error")
 
     def parse_main_method(self, member_table_entry: MemberTableEntry):
-        node = TreeNode("constructor_def")
+        node = self.new_node("constructor_def")
         if self.curr_token.token_type == tt.MAIN:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             member_table_entry.name = "mainEntry"
             member_table_entry.type.is_function = True
@@ -816,7 +1003,9 @@ class Parser:
             self.advance()
 
             if self.curr_token.token_type == tt.ROUND_BRACKET_OPEN:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 self.st_manager.create_scope()
                 self.advance()
@@ -827,7 +1016,9 @@ class Parser:
                 return
 
             if self.curr_token.token_type == tt.ROUND_BRACKET_CLOSE:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 self.advance()
             else:
@@ -841,7 +1032,9 @@ class Parser:
                 return
 
             if self.curr_token.token_type == tt.CURLY_BRACKET_OPEN:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 self.advance()
             else:
@@ -856,7 +1049,9 @@ class Parser:
             node.add_child(child)
 
             if self.curr_token.token_type == tt.CURLY_BRACKET_CLOSE:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 self.advance()
             else:
@@ -874,15 +1069,17 @@ class Parser:
         # return TreeNode("error")
 
     def parse_function_def(self, member_table_entry: MemberTableEntry):
-        node = TreeNode("function_def")
-        if self.curr_token.token_type in {tt.DATA_TYPE, tt.IDENTIFIER, tt.VOID_TYPE}:
+        node = self.new_node("function_def")
+        if self.curr_bit & FIRST_RETURN_TYPE:
             child = self.parse_function_declaration(member_table_entry)
             if child is None:
                 return
             node.add_child(child)
 
             if self.curr_token.token_type == tt.CURLY_BRACKET_OPEN:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 self.advance()
             else:
@@ -897,7 +1094,9 @@ class Parser:
             node.add_child(child)
 
             if self.curr_token.token_type == tt.CURLY_BRACKET_CLOSE:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 self.advance()
             else:
@@ -916,9 +1115,9 @@ class Parser:
         # return TreeNode("error")
 
     def parse_function_declaration(self, member_table_entry: MemberTableEntry):
-        node = TreeNode("function_declaration")
+        node = self.new_node("function_declaration")
 
-        if self.curr_token.token_type in {tt.DATA_TYPE, tt.IDENTIFIER, tt.VOID_TYPE}:
+        if self.curr_bit & FIRST_RETURN_TYPE:
             type = TypeInfo()
             child = self.parse_return_type(type)
             if child is None:
@@ -930,7 +1129,9 @@ class Parser:
             self.st_manager.curr_func_return_type = type
 
             if self.curr_token.token_type == tt.FUNCTION:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 self.advance()
             else:
@@ -940,9 +1141,12 @@ class Parser:
                 return
 
             if self.curr_token.token_type == tt.IDENTIFIER:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 member_table_entry.name = self.curr_token.value
+                name_id = self.curr_symbol_id
                 self.advance()
             else:
                 self.display_error("expected an identifier")
@@ -951,7 +1155,9 @@ class Parser:
                 return
 
             if self.curr_token.token_type == tt.ROUND_BRACKET_OPEN:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 self.st_manager.create_scope()
                 self.advance()
@@ -967,7 +1173,9 @@ class Parser:
             node.add_child(child)
 
             if self.curr_token.token_type == tt.ROUND_BRACKET_CLOSE:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 self.advance()
             else:
@@ -976,7 +1184,9 @@ class Parser:
                 # return TreeNode("error")
                 return
 
-            if not self.st_manager.insert_into_member_table(member_table_entry):
+            if not self.st_manager.insert_into_member_table(
+                member_table_entry, name_id
+            ):
                 self.display_semantic_error("Redeclaration error")
                 return
 
@@ -987,8 +1197,8 @@ class Parser:
         # return TreeNode("error")
 
     def parse_parameter_list(self, member_table_entry: MemberTableEntry):
-        node = TreeNode("parameter_list")
-        if self.curr_token.token_type in {tt.DATA_TYPE, tt.IDENTIFIER}:
+        node = self.new_node("parameter_list")
+        if self.curr_bit & FIRST_TYPE:
             child = self.parse_parameter(member_table_entry)
             if child is None:
                 return
@@ -1001,8 +1211,8 @@ class Parser:
 
             return node
 
-        elif self.curr_token.token_type in {tt.ROUND_BRACKET_CLOSE}:
-            node.add_child(TreeNode("null"))
+        elif self.curr_token.token_type == tt.ROUND_BRACKET_CLOSE:
+            node.add_child(self.new_node("null"))
             return node
 
         self.display_error("expected a variable type or ')'")
@@ -1010,8 +1220,8 @@ class Parser:
         # return TreeNode("error")
 
     def parse_parameter(self, member_table_entry: MemberTableEntry):
-        node = TreeNode("parameter")
-        if self.curr_token.token_type in {tt.DATA_TYPE, tt.IDENTIFIER}:
+        node = self.new_node("parameter")
+        if self.curr_bit & FIRST_TYPE:
             scope_table_entry = ScopeTableEntry()
             type = TypeInfo()
             child = self.parse_type(type)
@@ -1022,9 +1232,12 @@ class Parser:
             member_table_entry.type.func_param_type_list.append(type)
 
             if self.curr_token.token_type == tt.IDENTIFIER:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 scope_table_entry.name = self.curr_token.value
+                name_id = self.curr_symbol_id
                 self.advance()
             else:
                 self.display_error("expected an identifier")
@@ -1032,7 +1245,7 @@ class Parser:
                 # return TreeNode("error")
                 return
 
-            if not self.st_manager.insert_into_scope_table(scope_table_entry):
+            if not self.st_manager.insert_into_scope_table(scope_table_entry, name_id):
                 self.display_semantic_error("Redeclaration error")
                 return
 
@@ -1043,9 +1256,11 @@ class Parser:
         # return TreeNode("error")
 
     def parse_parameter_list_2(self, member_table_entry: MemberTableEntry):
-        node = TreeNode("parameter_list_2")
-        if self.curr_token.token_type == tt.COMMA:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+        head = node = self.new_node("parameter_list_2")
+        while self.curr_token.token_type == tt.COMMA:
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             self.advance()
 
@@ -1054,25 +1269,22 @@ class Parser:
                 return
             node.add_child(child)
 
-            child = self.parse_parameter_list_2(member_table_entry)
-            if child is None:
-                return
-            node.add_child(child)
-
-            return node
+            node = self.list_tail(node)
 
-        elif self.curr_token.token_type in {tt.ROUND_BRACKET_CLOSE}:
-            node.add_child(TreeNode("null"))
-            return node
+        if self.curr_token.token_type == tt.ROUND_BRACKET_CLOSE:
+            node.add_child(self.new_node("null"))
+            return head
 
         self.display_error("expected ',' or ')'")
         # self.advance()
         # return TreeNode("error")
 
     def parse_interface_body(self):
-        node = TreeNode("interface_body")
+        node = self.new_node("interface_body")
         if self.curr_token.token_type == tt.CURLY_BRACKET_OPEN:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             self.advance()
 
@@ -1082,7 +1294,9 @@ class Parser:
             node.add_child(child)
 
             if self.curr_token.token_type == tt.CURLY_BRACKET_CLOSE:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 self.advance()
             else:
@@ -1098,40 +1312,40 @@ class Parser:
         # return TreeNode("error")
 
     def parse_interface_members(self):
-        node = TreeNode("interface_members")
+        head = node = self.new_node("interface_members")
 
-        if self.curr_token.token_type in {tt.DATA_TYPE, tt.IDENTIFIER, tt.VOID_TYPE}:
-            child = self.parse_interface_member()
-            if child is None:
-                return
-            node.add_child(child)
-
-            child = self.parse_interface_members()
+        while self.curr_token.token_type != tt.CURLY_BRACKET_CLOSE:
+            scope_depth = len(self.st_manager.scope_stack)
+            if self.curr_bit & FIRST_RETURN_TYPE:
+                child = self.parse_interface_member()
+            else:
+                self.display_error("expected a type or '}'")
+                child = None
             if child is None:
-                return
+                child = self.recover(scope_depth)
+                if child is None:
+                    return
             node.add_child(child)
 
-            return node
-        elif self.curr_token.token_type in {tt.CURLY_BRACKET_CLOSE}:
-            node.add_child(TreeNode("null"))
-            return node
+            node = self.list_tail(node)
 
-        self.display_error("expected a type or '}'")
-        # self.advance()
-        # return TreeNode("error")
+        node.add_child(self.new_node("null"))
+        return head
 
     def parse_interface_member(self):
-        node = TreeNode("interface_member")
+        node = self.new_node("interface_member")
         member_table_entry = MemberTableEntry()
         member_table_entry.access_modifier = None
-        if self.curr_token.token_type in {tt.DATA_TYPE, tt.IDENTIFIER, tt.VOID_TYPE}:
+        if self.curr_bit & FIRST_RETURN_TYPE:
             child = self.parse_function_declaration(member_table_entry)
             if child is None:
                 return
             node.add_child(child)
 
             if self.curr_token.token_type == tt.SEMICOLON:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 self.advance()
             else:
@@ -1149,44 +1363,31 @@ class Parser:
         # return TreeNode("error")
 
     def parse_multiple_statements(self):
-        node = TreeNode("multiple_statements")
-        if self.curr_token.token_type in {
-            tt.BR_CONT,
-            tt.RETURN,
-            tt.FOR,
-            tt.WHILE,
-            tt.IF,
-            tt.DECLARE,
-            tt.IDENTIFIER,
-            tt.THIS,
-            tt.SUPER,
-            tt.POINTER_MULTIPLY,
-            tt.CALL,
-        }:
-            child = self.parse_statement()
-            if child is None:
-                return
-            node.add_child(child)
-
-            child = self.parse_multiple_statements()
+        head = node = self.new_node("multiple_statements")
+        while self.curr_token.token_type != tt.CURLY_BRACKET_CLOSE:
+            scope_depth = len(self.st_manager.scope_stack)
+            if self.curr_bit & FIRST_MULTIPLE_STATEMENTS:
+                child = self.parse_statement()
+            else:
+                self.display_error("expected a valid statement")
+                child = None
             if child is None:
-                return
+                child = self.recover(scope_depth)
+                if child is None:
+                    return
             node.add_child(child)
 
-            return node
+            node = self.list_tail(node)
 
-        elif self.curr_token.token_type in {tt.CURLY_BRACKET_CLOSE}:
-            node.add_child(TreeNode("null"))
-            return node
-
-        self.display_error("expected a valid statement")
-        # self.advance()
-        # return TreeNode("error")
+        node.add_child(self.new_node("null"))
+        return head
 
     def parse_statement(self):
-        node = TreeNode("statement")
+        node = self.new_node("statement")
         if self.curr_token.token_type == tt.BR_CONT:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             if not self.st_manager.check_inside_loop():
                 self.display_semantic_error(
@@ -1196,7 +1397,9 @@ class Parser:
             self.advance()
 
             if self.curr_token.token_type == tt.SEMICOLON:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 self.advance()
             else:
@@ -1207,14 +1410,16 @@ class Parser:
 
             return node
 
-        elif self.curr_token.token_type in {tt.RETURN}:
+        elif self.curr_token.token_type == tt.RETURN:
             child = self.parse_return_statement()
             if child is None:
                 return
             node.add_child(child)
 
             if self.curr_token.token_type == tt.SEMICOLON:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 self.advance()
             else:
@@ -1225,21 +1430,21 @@ class Parser:
 
             return node
 
-        elif self.curr_token.token_type in {tt.IF}:
+        elif self.curr_token.token_type == tt.IF:
             child = self.parse_if_else_statement()
             if child is None:
                 return
             node.add_child(child)
 
             return node
-        elif self.curr_token.token_type in {tt.WHILE}:
+        elif self.curr_token.token_type == tt.WHILE:
             child = self.parse_while_statement()
             if child is None:
                 return
             node.add_child(child)
 
             return node
-        elif self.curr_token.token_type in {tt.FOR}:
+        elif self.curr_token.token_type == tt.FOR:
             child = self.parse_for_loop_statement()
             if child is None:
                 return
@@ -1247,14 +1452,16 @@ class Parser:
 
             return node
 
-        elif self.curr_token.token_type in {tt.DECLARE}:
+        elif self.curr_token.token_type == tt.DECLARE:
             child = self.parse_variable_declaration()
             if child is None:
                 return
             node.add_child(child)
 
             if self.curr_token.token_type == tt.SEMICOLON:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 self.advance()
             else:
@@ -1264,19 +1471,16 @@ class Parser:
                 return
 
             return node
-        elif self.curr_token.token_type in {
-            tt.THIS,
-            tt.SUPER,
-            tt.IDENTIFIER,
-            tt.POINTER_MULTIPLY,
-        }:
+        elif self.curr_bit & FIRST_ASSIGNMENT:
             child = self.parse_assignment_statement()
             if child is None:
                 return
             node.add_child(child)
 
             if self.curr_token.token_type == tt.SEMICOLON:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 self.advance()
             else:
@@ -1292,9 +1496,11 @@ class Parser:
         # return TreeNode("error")
 
     def parse_return_statement(self):
-        node = TreeNode("return_statement")
+        node = self.new_node("return_statement")
         if self.curr_token.token_type == tt.RETURN:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             self.advance()
 
@@ -1309,23 +1515,8 @@ class Parser:
         # return TreeNode("error")
 
     def parse_return_statement_2(self):
-        node = TreeNode("return_statement_2")
-        if self.curr_token.token_type in {
-            tt.REF_OPERATOR,
-            tt.THIS,
-            tt.SUPER,
-            tt.IDENTIFIER,
-            tt.INTEGER_LITERAL,
-            tt.FLOAT_LITERAL,
-            tt.BOOL_LITERAL,
-            tt.CHAR_LITERAL,
-            tt.STRING_LITERAL,
-            tt.ROUND_BRACKET_OPEN,
-            tt.NOT_OPERATOR,
-            tt.POINTER_MULTIPLY,
-            tt.OBJ_CREATOR,
-            tt.SQUARE_BRACKET_OPEN,
-        }:
+        node = self.new_node("return_statement_2")
+        if self.curr_bit & FIRST_VALUE:
             child = self.parse_value()
             if child is None:
                 return
@@ -1350,8 +1541,8 @@ class Parser:
                 return
 
             return node
-        elif self.curr_token.token_type in {tt.SEMICOLON}:
-            node.add_child(TreeNode("null"))
+        elif self.curr_token.token_type == tt.SEMICOLON:
+            node.add_child(self.new_node("null"))
 
             if (
                 self.st_manager.curr_func_return_type is not None
@@ -1369,54 +1560,44 @@ class Parser:
         # return TreeNode("error")
 
     def parse_value(self):
-        node = TreeNode("value")
-        if self.curr_token.token_type in {tt.REF_OPERATOR}:
+        node = self.new_node("value")
+        if self.curr_token.token_type == tt.REF_OPERATOR:
             child = self.parse_pointer_initialization()
             if child is None:
                 return
             child, type = child
             node.add_child(child)
+            self.record_type(node, type)
             return node, type
 
-        elif self.curr_token.token_type in {
-            tt.THIS,
-            tt.SUPER,
-            tt.IDENTIFIER,
-            tt.INTEGER_LITERAL,
-            tt.FLOAT_LITERAL,
-            tt.BOOL_LITERAL,
-            tt.CHAR_LITERAL,
-            tt.STRING_LITERAL,
-            tt.ROUND_BRACKET_OPEN,
-            tt.NOT_OPERATOR,
-            tt.POINTER_MULTIPLY,
-            # tt.OBJ_CREATOR,
-            # tt.SQUARE_BRACKET_OPEN,
-        }:
+        elif self.curr_bit & FIRST_EXPRESSION:
             child = self.parse_expression()
             if child is None:
                 return
             child, result_type = child
             node.add_child(child)
 
+            self.record_type(node, result_type)
             return node, result_type
 
-        elif self.curr_token.token_type in {tt.SQUARE_BRACKET_OPEN}:
+        elif self.curr_token.token_type == tt.SQUARE_BRACKET_OPEN:
             child = self.parse_array_initialization()
             if child is None:
                 return
             child, result_type = child
             node.add_child(child)
 
+            self.record_type(node, result_type)
             return node, result_type
 
-        elif self.curr_token.token_type in {tt.OBJ_CREATOR}:
+        elif self.curr_token.token_type == tt.OBJ_CREATOR:
             child = self.parse_object_creation()
             if child is None:
                 return
             child, type = child
             node.add_child(child)
 
+            self.record_type(node, type)
             return node, type
 
         self.display_error("expected a valid value (an expression or pointer init or object)")
@@ -1426,11 +1607,13 @@ class Parser:
     def parse_variable_declaration(
         self, table_entry: MemberTableEntry | ScopeTableEntry = None, is_member=False
     ):
-        node = TreeNode("variable_declaration")
+        node = self.new_node("variable_declaration")
         if table_entry is None:
             table_entry = ScopeTableEntry()
         if self.curr_token.token_type == tt.DECLARE:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             self.advance()
 
@@ -1446,9 +1629,12 @@ class Parser:
                 table_entry.type = type
 
             if self.curr_token.token_type == tt.IDENTIFIER:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 table_entry.name = self.curr_token.value
+                name_id = self.curr_symbol_id
                 self.advance()
             else:
                 self.display_error("expected an identifier")
@@ -1457,11 +1643,11 @@ class Parser:
                 return
 
             if is_member:
-                if not self.st_manager.insert_into_member_table(table_entry):
+                if not self.st_manager.insert_into_member_table(table_entry, name_id):
                     self.display_semantic_error("Redeclaration error")
                     return
             else:
-                if not self.st_manager.insert_into_scope_table(table_entry):
+                if not self.st_manager.insert_into_scope_table(table_entry, name_id):
                     self.display_semantic_error("Redeclaration error")
                     return
 
@@ -1482,9 +1668,11 @@ class Parser:
         # return TreeNode("error")
 
     def parse_init(self, left_operand_type: TypeInfo):
-        node = TreeNode("init")
+        node = self.new_node("init")
         if self.curr_token.token_type == tt.ASSIGNMENT_OPERATOR:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             self.advance()
 
@@ -1507,8 +1695,8 @@ class Parser:
 
             return node
 
-        elif self.curr_token.token_type in {tt.COMMA, tt.SEMICOLON}:
-            node.add_child(TreeNode("null"))
+        elif self.curr_bit & FOLLOW_INIT:
+            node.add_child(self.new_node("null"))
             return node
 
         self.display_error("expected '=' , ',' or ';'")
@@ -1518,26 +1706,31 @@ class Parser:
     def parse_list(
         self, prev_table_entry: MemberTableEntry | ScopeTableEntry, is_member: bool
     ):
-        node = TreeNode("list")
+        head = node = self.new_node("list")
 
-        if is_member:
-            table_entry = MemberTableEntry()
-            table_entry.type = prev_table_entry.type
-            table_entry.access_modifier = prev_table_entry.access_modifier
-            table_entry.is_static = prev_table_entry.is_static
-        else:
-            table_entry = ScopeTableEntry()
-            table_entry.type = prev_table_entry.type
+        while self.curr_token.token_type == tt.COMMA:
+            if is_member:
+                table_entry = MemberTableEntry()
+                table_entry.type = prev_table_entry.type
+                table_entry.access_modifier = prev_table_entry.access_modifier
+                table_entry.is_static = prev_table_entry.is_static
+            else:
+                table_entry = ScopeTableEntry()
+                table_entry.type = prev_table_entry.type
 
-        if self.curr_token.token_type == tt.COMMA:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             self.advance()
 
             if self.curr_token.token_type == tt.IDENTIFIER:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 table_entry.name = self.curr_token.value
+                name_id = self.curr_symbol_id
                 self.advance()
             else:
                 self.display_error("expected an identifier")
@@ -1546,38 +1739,37 @@ class Parser:
                 return
 
             if is_member:
-                if not self.st_manager.insert_into_member_table(table_entry):
+                if not self.st_manager.insert_into_member_table(table_entry, name_id):
                     self.display_semantic_error("Redeclaration error")
                     return
             else:
-                if not self.st_manager.insert_into_scope_table(table_entry):
+                if not self.st_manager.insert_into_scope_table(table_entry, name_id):
                     self.display_semantic_error("Redeclaration error")
                     return
 
-            child = self.parse_init()
-            if child is None:
-                return
-            node.add_child(child)
-
-            child = self.parse_list(prev_table_entry, is_member)
+            child = self.parse_init(
+                table_entry.type.var_type if is_member else table_entry.type
+            )
             if child is None:
                 return
             node.add_child(child)
 
-            return node
+            node = self.list_tail(node)
 
-        elif self.curr_token.token_type in {tt.SEMICOLON}:
-            node.add_child(TreeNode("null"))
-            return node
+        if self.curr_token.token_type == tt.SEMICOLON:
+            node.add_child(self.new_node("null"))
+            return head
 
         self.display_error("expected ',' or ';'")
         # self.advance()
         # return TreeNode("error")
 
     def parse_pointer_initialization(self):
-        node = TreeNode("pointer_initialization")
+        node = self.new_node("pointer_initialization")
         if self.curr_token.token_type == tt.REF_OPERATOR:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             self.advance()
 
@@ -1597,7 +1789,7 @@ class Parser:
             child, operand_type = child
             node.add_child(child)
 
-            result_type = self.st_manager.check_compatibility_binary_op(
+            result_type = self.st_manager.check_compatibility_unirary_op(
                 operand_type, "&"
             )
             if result_type is None:
@@ -1613,14 +1805,18 @@ class Parser:
         # return TreeNode("error")
 
     def parse_if_else_statement(self):
-        node = TreeNode("if_else_statement")
+        node = self.new_node("if_else_statement")
         if self.curr_token.token_type == tt.IF:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             self.advance()
 
             if self.curr_token.token_type == tt.ROUND_BRACKET_OPEN:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 self.advance()
             else:
@@ -1639,7 +1835,9 @@ class Parser:
                 self.display_semantic_error("expression should return a bool value")
 
             if self.curr_token.token_type == tt.ROUND_BRACKET_CLOSE:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 self.advance()
             else:
@@ -1669,9 +1867,11 @@ class Parser:
         # return TreeNode("error")
 
     def parse_else(self):
-        node = TreeNode("else")
+        node = self.new_node("else")
         if self.curr_token.token_type == tt.ELSE:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             self.advance()
 
@@ -1686,20 +1886,8 @@ class Parser:
 
             return node
 
-        elif self.curr_token.token_type in {
-            tt.BR_CONT,
-            tt.RETURN,
-            tt.FOR,
-            tt.WHILE,
-            tt.IF,
-            tt.DECLARE,
-            tt.IDENTIFIER,
-            tt.THIS,
-            tt.SUPER,
-            tt.POINTER_MULTIPLY,
-            tt.CURLY_BRACKET_CLOSE,
-        }:
-            node.add_child(TreeNode("null"))
+        elif self.curr_bit & FOLLOW_ELSE:
+            node.add_child(self.new_node("null"))
             return node
 
         self.display_error("expected 'else' keyword or a statement")
@@ -1707,19 +1895,8 @@ class Parser:
         # return TreeNode("error")
 
     def parse_body(self):
-        node = TreeNode("body")
-        if self.curr_token.token_type in {
-            tt.BR_CONT,
-            tt.RETURN,
-            tt.FOR,
-            tt.WHILE,
-            tt.IF,
-            tt.DECLARE,
-            tt.IDENTIFIER,
-            tt.THIS,
-            tt.SUPER,
-            tt.POINTER_MULTIPLY,
-        }:
+        node = self.new_node("body")
+        if self.curr_bit & FIRST_STATEMENT:
             child = self.parse_statement()
             if child is None:
                 return
@@ -1727,7 +1904,9 @@ class Parser:
 
             return node
         elif self.curr_token.token_type == tt.CURLY_BRACKET_OPEN:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             self.advance()
 
@@ -1737,7 +1916,9 @@ class Parser:
             node.add_child(child)
 
             if self.curr_token.token_type == tt.CURLY_BRACKET_CLOSE:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 self.advance()
             else:
@@ -1753,14 +1934,18 @@ class Parser:
         # return TreeNode("error")
 
     def parse_for_loop_statement(self):
-        node = TreeNode("for_loop_statement")
+        node = self.new_node("for_loop_statement")
         if self.curr_token.token_type == tt.FOR:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             self.advance()
 
             if self.curr_token.token_type == tt.ROUND_BRACKET_OPEN:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 self.advance()
             else:
@@ -1777,7 +1962,9 @@ class Parser:
             node.add_child(child)
 
             if self.curr_token.token_type == tt.SEMICOLON:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 self.advance()
             else:
@@ -1792,7 +1979,9 @@ class Parser:
             node.add_child(child)
 
             if self.curr_token.token_type == tt.SEMICOLON:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 self.advance()
             else:
@@ -1807,7 +1996,9 @@ class Parser:
             node.add_child(child)
 
             if self.curr_token.token_type == tt.ROUND_BRACKET_CLOSE:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 self.advance()
             else:
@@ -1830,20 +2021,15 @@ class Parser:
         # return TreeNode("error")
 
     def parse_c1(self):
-        node = TreeNode("c1")
-        if self.curr_token.token_type in {tt.DECLARE}:
+        node = self.new_node("c1")
+        if self.curr_token.token_type == tt.DECLARE:
             child = self.parse_variable_declaration()
             if child is None:
                 return
             node.add_child(child)
 
             return node
-        elif self.curr_token.token_type in {
-            tt.THIS,
-            tt.SUPER,
-            tt.IDENTIFIER,
-            tt.POINTER_MULTIPLY,
-        }:
+        elif self.curr_bit & FIRST_ASSIGNMENT:
             child = self.parse_assignment_statement()
             if child is None:
                 return
@@ -1856,22 +2042,8 @@ class Parser:
         # return TreeNode("error")
 
     def parse_c2(self):
-        node = TreeNode("c2")
-        if self.curr_token.token_type in {
-            tt.THIS,
-            tt.SUPER,
-            tt.IDENTIFIER,
-            tt.INTEGER_LITERAL,
-            tt.FLOAT_LITERAL,
-            tt.BOOL_LITERAL,
-            tt.CHAR_LITERAL,
-            tt.STRING_LITERAL,
-            tt.ROUND_BRACKET_OPEN,
-            tt.NOT_OPERATOR,
-            tt.POINTER_MULTIPLY,
-            # tt.OBJ_CREATOR,
-            # tt.SQUARE_BRACKET_OPEN,
-        }:
+        node = self.new_node("c2")
+        if self.curr_bit & FIRST_EXPRESSION:
             child = self.parse_expression()
             if child is None:
                 return
@@ -1888,13 +2060,8 @@ class Parser:
         # return TreeNode("error")
 
     def parse_c3(self):
-        node = TreeNode("c3")
-        if self.curr_token.token_type in {
-            tt.THIS,
-            tt.SUPER,
-            tt.IDENTIFIER,
-            tt.POINTER_MULTIPLY,
-        }:
+        node = self.new_node("c3")
+        if self.curr_bit & FIRST_ASSIGNMENT:
             child = self.parse_assignment_statement()
             if child is None:
                 return
@@ -1907,14 +2074,18 @@ class Parser:
         # return TreeNode("error")
 
     def parse_while_statement(self):
-        node = TreeNode("while_statement")
+        node = self.new_node("while_statement")
         if self.curr_token.token_type == tt.WHILE:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             self.advance()
 
             if self.curr_token.token_type == tt.ROUND_BRACKET_OPEN:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 self.advance()
             else:
@@ -1933,7 +2104,9 @@ class Parser:
                 self.display_semantic_error("expression should return a bool value")
 
             if self.curr_token.token_type == tt.ROUND_BRACKET_CLOSE:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 self.advance()
             else:
@@ -1958,16 +2131,13 @@ class Parser:
         # return TreeNode("error")
 
     def parse_assignment_statement(self):
-        node = TreeNode("assignment_statement")
-        if self.curr_token.token_type in {
-            tt.THIS,
-            tt.SUPER,
-            tt.IDENTIFIER,
-            tt.POINTER_MULTIPLY,
-        }:
+        node = self.new_node("assignment_statement")
+        if self.curr_bit & FIRST_ASSIGNMENT:
             is_pointer = False
             if self.curr_token.token_type == tt.POINTER_MULTIPLY:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 is_pointer = True
                 self.advance()
@@ -1979,9 +2149,12 @@ class Parser:
             node.add_child(child)
 
             if self.curr_token.token_type == tt.IDENTIFIER:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 name = self.curr_token.value
+                name_id = self.curr_symbol_id
                 self.advance()
             else:
                 self.display_error("expected an identifier")
@@ -2000,7 +2173,9 @@ class Parser:
                     self.display_semantic_error("No parent class exists")
                     return
 
-            child = self.parse_assignment_statement_2(name, class_name, is_pointer)
+            child = self.parse_assignment_statement_2(
+                name, name_id, class_name, is_pointer
+            )
             if child is None:
                 return
             node.add_child(child)
@@ -2017,15 +2192,17 @@ class Parser:
         # return TreeNode("error")
 
     def parse_assignment_statement_2(
-        self, name, class_name, is_pointer, is_static = False
+        self, name, name_id, class_name, is_pointer, is_static = False
     ):
-        node = TreeNode("assignment_statement_2")
-        if self.curr_token.token_type in {tt.DOT, tt.ARROW}:
+        node = self.new_node("assignment_statement_2")
+        if self.curr_bit & DOT_ARROW:
             static_class_name = None
             if class_name is None:
-                var_type = self.st_manager.lookup_scope_table(name)
+                var_type = self.st_manager.lookup_scope_table(name, name_id)
                 if var_type is None:
-                    def_table_entry = self.st_manager.lookup_definition_table(name)
+                    def_table_entry = self.st_manager.lookup_definition_table(
+                        name, name_id
+                    )
                     if def_table_entry is None:
                         self.display_semantic_error(f"Undeclared variable {name}")
                         return
@@ -2043,7 +2220,7 @@ class Parser:
                 return
             else:
                 member_table_entry = self.st_manager.lookup_member_table(
-                    name, class_name
+                    name, class_name, name_id
                 )
                 if member_table_entry is None:
                     self.display_semantic_error(
@@ -2080,9 +2257,12 @@ class Parser:
             node.add_child(child)
 
             if self.curr_token.token_type == tt.IDENTIFIER:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 name = self.curr_token.value
+                name_id = self.curr_symbol_id
                 self.advance()
             else:
                 self.display_error("expected an identifier")
@@ -2091,16 +2271,18 @@ class Parser:
                 return
 
             class_name = static_class_name if is_static else var_type.data_type
-            child = self.parse_assignment_statement_2(name, class_name, is_pointer, is_static)
+            child = self.parse_assignment_statement_2(
+                name, name_id, class_name, is_pointer, is_static
+            )
             if child is None:
                 return
             node.add_child(child)
 
             return node
 
-        elif self.curr_token.token_type in {tt.SQUARE_BRACKET_OPEN}:
+        elif self.curr_token.token_type == tt.SQUARE_BRACKET_OPEN:
             if class_name is None:
-                var_type = self.st_manager.lookup_scope_table(name)
+                var_type = self.st_manager.lookup_scope_table(name, name_id)
                 if var_type is None:
                     self.display_semantic_error(f"Undeclared variable {name}")
                     return
@@ -2112,7 +2294,7 @@ class Parser:
                 return
             else:
                 member_table_entry = self.st_manager.lookup_member_table(
-                    name, class_name
+                    name, class_name, name_id
                 )
                 if member_table_entry is None:
                     self.display_semantic_error(
@@ -2162,7 +2344,7 @@ class Parser:
             node.add_child(child)
 
             return node
-        elif self.curr_token.token_type in {tt.ROUND_BRACKET_OPEN}:
+        elif self.curr_token.token_type == tt.ROUND_BRACKET_OPEN:
             param_type_list = []
             child = self.parse_func_args(param_type_list)
             if child is None:
@@ -2173,11 +2355,12 @@ class Parser:
                 class_name = self.st_manager.current_def_name
 
             member_table_entry = self.st_manager.lookup_member_table_func(
-                name, param_type_list, class_name
+                name, param_type_list, class_name, name_id
             )
             if member_table_entry is None:
                 self.display_semantic_error("Undeclared method error")
                 return
+            self.record_type(child, member_table_entry.type.func_return_type)
 
             child = self.parse_assignment_statement_3(
                 member_table_entry.type.func_return_type, is_pointer
@@ -2188,13 +2371,10 @@ class Parser:
 
             return node
 
-        elif self.curr_token.token_type in {
-            tt.ASSIGNMENT_OPERATOR,
-            tt.COMP_ASSIGNMENT_OPERATOR,
-        }:
+        elif self.curr_bit & ASSIGNMENT_OPERATORS:
 
             if class_name is None:
-                var_type = self.st_manager.lookup_scope_table(name)
+                var_type = self.st_manager.lookup_scope_table(name, name_id)
                 if var_type is None:
                     self.display_semantic_error(f"Undeclared variable {name}")
                     return
@@ -2203,7 +2383,7 @@ class Parser:
                 return
             else:
                 member_table_entry = self.st_manager.lookup_member_table(
-                    name, class_name
+                    name, class_name, name_id
                 )
                 if member_table_entry is None:
                     self.display_semantic_error(
@@ -2259,17 +2439,20 @@ class Parser:
         # return TreeNode("error")
 
     def parse_assignment_statement_3(self, var_type: TypeInfo, is_pointer):
-        node = TreeNode("assignment_statement_3")
-        if self.curr_token.token_type in {tt.DOT, tt.ARROW}:
+        node = self.new_node("assignment_statement_3")
+        if self.curr_bit & DOT_ARROW:
             child = self.parse_dot_arrow(var_type)
             if child is None:
                 return
             node.add_child(child)
 
             if self.curr_token.token_type == tt.IDENTIFIER:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 name = self.curr_token.value
+                name_id = self.curr_symbol_id
                 self.advance()
             else:
                 self.display_error("expected an identifier")
@@ -2278,7 +2461,7 @@ class Parser:
                 return
 
             child = self.parse_assignment_statement_2(
-                name, var_type.data_type, is_pointer
+                name, name_id, var_type.data_type, is_pointer
             )
             if child is None:
                 return
@@ -2286,7 +2469,7 @@ class Parser:
 
             return node
 
-        elif self.curr_token.token_type in {tt.SQUARE_BRACKET_OPEN}:
+        elif self.curr_token.token_type == tt.SQUARE_BRACKET_OPEN:
             if not var_type.is_array:
                 self.display_semantic_error(f"function does not returns an array")
                 return
@@ -2305,8 +2488,8 @@ class Parser:
 
             return node
 
-        elif self.curr_token.token_type in {tt.SEMICOLON}:
-            node.add_child(TreeNode("null"))
+        elif self.curr_token.token_type == tt.SEMICOLON:
+            node.add_child(self.new_node("null"))
             return node
 
         self.display_error("expected '->', '.' , '[' or ';'")
@@ -2316,9 +2499,11 @@ class Parser:
     def parse_assignment_statement_4(
         self, var_type: TypeInfo, dimensions_indexed, is_pointer
     ):
-        node = TreeNode("assignment_statement_4")
-        if self.curr_token.token_type in {tt.DOT}:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+        node = self.new_node("assignment_statement_4")
+        if self.curr_token.token_type == tt.DOT:
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             if var_type.is_pointer:
                 self.display_semantic_error("'.' cannot be used with pointer type")
@@ -2335,9 +2520,12 @@ class Parser:
             self.advance()
 
             if self.curr_token.token_type == tt.IDENTIFIER:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 name = self.curr_token.value
+                name_id = self.curr_symbol_id
                 self.advance()
             else:
                 self.display_error("expected an identifier")
@@ -2346,7 +2534,9 @@ class Parser:
                 return
 
             class_name = var_type.data_type
-            child = self.parse_assignment_statement_2(name, class_name, is_pointer)
+            child = self.parse_assignment_statement_2(
+                name, name_id, class_name, is_pointer
+            )
             if child is None:
                 return
             child, type = child
@@ -2354,14 +2544,11 @@ class Parser:
 
             return node, type
 
-        elif self.curr_token.token_type in {
-            tt.ASSIGNMENT_OPERATOR,
-            tt.COMP_ASSIGNMENT_OPERATOR,
-        }:
+        elif self.curr_bit & ASSIGNMENT_OPERATORS:
             # <assignment> here
             new_type = TypeInfo(var_type.data_type)
             new_type.dimensions = var_type.dimensions - dimensions_indexed
-            node.add_child(TreeNode("null"))
+            node.add_child(self.new_node("null"))
 
             if is_pointer:
                 result_type = self.st_manager.check_compatibility_unirary_op(
@@ -2385,12 +2572,11 @@ class Parser:
         self.display_error("expected '.', '=' or a compound assignment ")
 
     def parse_assignment(self, left_operand_type: TypeInfo):
-        node = TreeNode("assignment")
-        if self.curr_token.token_type in {
-            tt.ASSIGNMENT_OPERATOR,
-            tt.COMP_ASSIGNMENT_OPERATOR,
-        }:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+        node = self.new_node("assignment")
+        if self.curr_bit & ASSIGNMENT_OPERATORS:
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             operator = self.curr_token.value
             self.advance()
@@ -2417,14 +2603,18 @@ class Parser:
         # return TreeNode("error")
 
     def parse_this_super_optional(self):
-        node = TreeNode("this_super_optional")
+        node = self.new_node("this_super_optional")
         if self.curr_token.token_type == tt.THIS:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             self.advance()
 
             if self.curr_token.token_type == tt.ARROW:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 self.advance()
             else:
@@ -2435,12 +2625,16 @@ class Parser:
 
             return node, "this"
         elif self.curr_token.token_type == tt.SUPER:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             self.advance()
 
             if self.curr_token.token_type == tt.ARROW:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 self.advance()
             else:
@@ -2450,8 +2644,8 @@ class Parser:
                 return
 
             return node, "super"
-        elif self.curr_token.token_type in {tt.IDENTIFIER}:
-            node.add_child(TreeNode("null"))
+        elif self.curr_token.token_type == tt.IDENTIFIER:
+            node.add_child(self.new_node("null"))
             return node, None
 
         self.display_error("expected 'this', 'super' or an identifier")
@@ -2459,9 +2653,11 @@ class Parser:
         # return TreeNode("error")
 
     def parse_dot_arrow(self, type: TypeInfo, is_static=False):
-        node = TreeNode("dot_arrow")
+        node = self.new_node("dot_arrow")
         if self.curr_token.token_type == tt.DOT:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             if type.is_pointer:
                 self.display_semantic_error("'.' cannot be used with pointer type")
@@ -2479,7 +2675,9 @@ class Parser:
 
             return node
         elif self.curr_token.token_type == tt.ARROW:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             if is_static:
                 self.display_semantic_error("static variables can only be accessed using (.) operator")
@@ -2505,9 +2703,11 @@ class Parser:
         # return TreeNode("error")
 
     def parse_func_args(self, param_type_list: List):
-        node = TreeNode("func_args")
+        node = self.new_node("func_args")
         if self.curr_token.token_type == tt.ROUND_BRACKET_OPEN:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             self.advance()
 
@@ -2517,7 +2717,9 @@ class Parser:
             node.add_child(child)
 
             if self.curr_token.token_type == tt.ROUND_BRACKET_CLOSE:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 self.advance()
             else:
@@ -2533,23 +2735,8 @@ class Parser:
         # return TreeNode("error")
 
     def parse_arguments(self, param_type_list: List):
-        node = TreeNode("arguments")
-        if self.curr_token.token_type in {
-            tt.REF_OPERATOR,
-            tt.THIS,
-            tt.SUPER,
-            tt.IDENTIFIER,
-            tt.INTEGER_LITERAL,
-            tt.FLOAT_LITERAL,
-            tt.BOOL_LITERAL,
-            tt.CHAR_LITERAL,
-            tt.STRING_LITERAL,
-            tt.ROUND_BRACKET_OPEN,
-            tt.NOT_OPERATOR,
-            tt.POINTER_MULTIPLY,
-            tt.OBJ_CREATOR,
-            tt.SQUARE_BRACKET_OPEN,
-        }:
+        node = self.new_node("arguments")
+        if self.curr_bit & FIRST_VALUE:
             child = self.parse_value()
             if child is None:
                 return
@@ -2565,8 +2752,8 @@ class Parser:
 
             return node
 
-        elif self.curr_token.token_type in {tt.ROUND_BRACKET_CLOSE}:
-            node.add_child(TreeNode("null"))
+        elif self.curr_token.token_type == tt.ROUND_BRACKET_CLOSE:
+            node.add_child(self.new_node("null"))
             return node
 
         self.display_error("expected a value or expression or ')'")
@@ -2574,9 +2761,11 @@ class Parser:
         # return TreeNode("error")
 
     def parse_argument_list(self, param_type_list: List):
-        node = TreeNode("arguments_list")
-        if self.curr_token.token_type == tt.COMMA:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+        head = node = self.new_node("arguments_list")
+        while self.curr_token.token_type == tt.COMMA:
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             self.advance()
 
@@ -2588,25 +2777,22 @@ class Parser:
 
             param_type_list.append(param_type)
 
-            child = self.parse_argument_list(param_type_list)
-            if child is None:
-                return
-            node.add_child(child)
-
-            return node
+            node = self.list_tail(node)
 
-        elif self.curr_token.token_type in {tt.ROUND_BRACKET_CLOSE}:
-            node.add_child(TreeNode("null"))
-            return node
+        if self.curr_token.token_type == tt.ROUND_BRACKET_CLOSE:
+            node.add_child(self.new_node("null"))
+            return head
 
         self.display_error("expected ',' or ')'")
         # self.advance()
         # return TreeNode("error")
 
     def parse_array_indexing_slicing(self):
-        node = TreeNode("array_indexing_slicing")
+        node = self.new_node("array_indexing_slicing")
         if self.curr_token.token_type == tt.SQUARE_BRACKET_OPEN:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             self.advance()
 
@@ -2626,7 +2812,9 @@ class Parser:
             # node.add_child(child)
 
             if self.curr_token.token_type == tt.SQUARE_BRACKET_CLOSE:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 self.advance()
             else:
@@ -2642,9 +2830,11 @@ class Parser:
         # return TreeNode("error")
 
     def parse_array_slicing(self):
-        node = TreeNode("array_slicing")
+        node = self.new_node("array_slicing")
         if self.curr_token.token_type == tt.COLON:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             self.advance()
 
@@ -2653,8 +2843,8 @@ class Parser:
                 return
             node.add_child(child)
 
-        elif self.curr_token.token_type in {tt.SQUARE_BRACKET_CLOSE}:
-            node.add_child(TreeNode("null"))
+        elif self.curr_token.token_type == tt.SQUARE_BRACKET_CLOSE:
+            node.add_child(self.new_node("null"))
             return node
 
         self.display_error("expected ':' or ']'")
@@ -2662,23 +2852,12 @@ class Parser:
         # return TreeNode("error")
 
     def parse_expression(self):
-        node = TreeNode("expression")
-        if self.curr_token.token_type in {
-            tt.THIS,
-            tt.SUPER,
-            tt.IDENTIFIER,
-            tt.INTEGER_LITERAL,
-            tt.FLOAT_LITERAL,
-            tt.BOOL_LITERAL,
-            tt.CHAR_LITERAL,
-            tt.STRING_LITERAL,
-            tt.ROUND_BRACKET_OPEN,
-            tt.NOT_OPERATOR,
-            tt.POINTER_MULTIPLY,
-            # tt.OBJ_CREATOR,
-            # tt.SQUARE_BRACKET_OPEN,
-        }:
-            child = self.parse_or_expression()
+        node = self.new_node("expression")
+        if self.curr_bit & FIRST_EXPRESSION:
+            if self.expressions == "precedence":
+                child = self.parse_binary_expression(1)
+            else:
+                child = self.parse_or_expression()
             if child is None:
                 return
             child, result_type = child
@@ -2689,29 +2868,64 @@ class Parser:
             #     result_type,
             # )
 
+            self.record_type(node, result_type)
             return node, result_type
 
         self.display_error("expected an expression")
         # self.advance()
         # return TreeNode("error")
 
+    def parse_binary_expression(self, min_precedence: int):
+        # Precedence climbing: one binary_expression node and one
+        # compatibility check per operator. Checks and errors come in the same
+        # order as from the or/and/relational/plus_minus/mul_div_mod levels.
+        child = self.parse_factor()
+        if child is None:
+            return
+        node, left_operand_type = child
+
+        while True:
+            precedence = BINARY_PRECEDENCE.get(self.curr_token.token_type)
+            if precedence is None:
+                if not self.curr_bit & EXPRESSION_END:
+                    self.display_error(
+                        "expected '*', '/', '%' or expected mul div mod expression to end"
+                    )
+                    return
+                return node, left_operand_type
+            if precedence < min_precedence:
+                return node, left_operand_type
+
+            operator = self.curr_token.value
+            self.advance()
+
+            if precedence == MAX_PRECEDENCE:
+                child = self.parse_factor()
+            else:
+                child = self.parse_binary_expression(precedence + 1)
+            if child is None:
+                return
+            right_node, right_operand_type = child
+
+            result_type = self.st_manager.check_compatibility_binary_op(
+                left_operand_type, right_operand_type, operator
+            )
+            if result_type is None:
+                self.display_semantic_error(
+                    f"Unsupported operator({operator}) for operands of type {left_operand_type} and {right_operand_type}"
+                )
+                return
+
+            child = self.new_node("binary_expression", operator)
+            child.add_child(node)
+            child.add_child(right_node)
+            self.record_type(child, result_type)
+            node = child
+            left_operand_type = result_type
+
     def parse_or_expression(self):
-        node = TreeNode("or-expression")
-        if self.curr_token.token_type in {
-            tt.THIS,
-            tt.SUPER,
-            tt.IDENTIFIER,
-            tt.INTEGER_LITERAL,
-            tt.FLOAT_LITERAL,
-            tt.BOOL_LITERAL,
-            tt.CHAR_LITERAL,
-            tt.STRING_LITERAL,
-            tt.ROUND_BRACKET_OPEN,
-            tt.NOT_OPERATOR,
-            tt.POINTER_MULTIPLY,
-            # tt.OBJ_CREATOR,
-            # tt.SQUARE_BRACKET_OPEN,
-        }:
+        node = self.new_node("or-expression")
+        if self.curr_bit & FIRST_EXPRESSION:
             child = self.parse_and_expression()
             if child is None:
                 return
@@ -2731,10 +2945,12 @@ class Parser:
         # return TreeNode("error")
 
     def parse_or_expression_2(self, left_operand_type: TypeInfo):
-        node = TreeNode("or_expression_2")
-        if self.curr_token.token_type == tt.LOGICAL_OR:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
-            node.add_child(child)
+        head = node = self.new_node("or_expression_2")
+        while self.curr_token.token_type == tt.LOGICAL_OR:
+            operator_node = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
+            node.add_child(operator_node)
             self.advance()
 
             child = self.parse_and_expression()
@@ -2751,31 +2967,21 @@ class Parser:
                     f"Unsupported operator(||) for operands of type {left_operand_type} and {right_operand_type}"
                 )
                 return
+            self.record_type(operator_node, result_type)
+            left_operand_type = result_type
 
-            child = self.parse_or_expression_2(result_type)
-            if child is None:
-                return
-            child, result_type = child
-            node.add_child(child)
-
-            return node, result_type
+            node = self.list_tail(node)
 
-        elif self.curr_token.token_type in {
-            tt.SEMICOLON,
-            tt.COMMA,
-            tt.ROUND_BRACKET_CLOSE,
-            tt.SQUARE_BRACKET_CLOSE,
-            tt.COLON,
-        }:
-            node.add_child(TreeNode("null"))
-            return node, left_operand_type
+        if self.curr_bit & EXPRESSION_END:
+            node.add_child(self.new_node("null"))
+            return head, left_operand_type
 
         self.display_error("expected '||' or expected OR expression to end")
         # self.advance()
         # return TreeNode("error")
 
     def parse_and_expression(self):
-        node = TreeNode("and_expression")
+        node = self.new_node("and_expression")
 
         child = self.parse_relational_expression()
         if child is None:
@@ -2792,10 +2998,12 @@ class Parser:
         return node, result_type
 
     def parse_and_expression_2(self, left_operand_type: TypeInfo):
-        node = TreeNode("and_expression_2")
-        if self.curr_token.token_type == tt.LOGICAL_AND:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
-            node.add_child(child)
+        head = node = self.new_node("and_expression_2")
+        while self.curr_token.token_type == tt.LOGICAL_AND:
+            operator_node = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
+            node.add_child(operator_node)
             self.advance()
 
             child = self.parse_relational_expression()
@@ -2812,31 +3020,21 @@ class Parser:
                     f"Unsupported operator(&&) for operands of type {left_operand_type} and {right_operand_type}"
                 )
                 return
+            self.record_type(operator_node, result_type)
+            left_operand_type = result_type
 
-            child = self.parse_and_expression_2(result_type)
-            if child is None:
-                return
-            child, result_type = child
-            node.add_child(child)
+            node = self.list_tail(node)
 
-            return node, result_type
-        elif self.curr_token.token_type in {
-            tt.SEMICOLON,
-            tt.COMMA,
-            tt.ROUND_BRACKET_CLOSE,
-            tt.SQUARE_BRACKET_CLOSE,
-            tt.COLON,
-            tt.LOGICAL_OR,
-        }:
-            node.add_child(TreeNode("null"))
-            return node, left_operand_type
+        if self.curr_bit & FOLLOW_AND_EXPRESSION:
+            node.add_child(self.new_node("null"))
+            return head, left_operand_type
 
         self.display_error("expected '&&' or expected AND expression to end")
         # self.advance()
         # return TreeNode("error")
 
     def parse_relational_expression(self):
-        node = TreeNode("relational_expression")
+        node = self.new_node("relational_expression")
 
         child = self.parse_plus_minus_exp()
         if child is None:
@@ -2853,10 +3051,12 @@ class Parser:
         return node, result_type
 
     def parse_relational_expression_2(self, left_operand_type: TypeInfo):
-        node = TreeNode("relational_expression_2")
-        if self.curr_token.token_type == tt.RELATIONAL_OPERATOR:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
-            node.add_child(child)
+        head = node = self.new_node("relational_expression_2")
+        while self.curr_token.token_type == tt.RELATIONAL_OPERATOR:
+            operator_node = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
+            node.add_child(operator_node)
             operator = self.curr_token.value
             self.advance()
 
@@ -2874,25 +3074,14 @@ class Parser:
                     f"Unsupported operator({operator}) for operands of type {left_operand_type} and {right_operand_type}"
                 )
                 return
+            self.record_type(operator_node, result_type)
+            left_operand_type = result_type
 
-            child = self.parse_relational_expression_2(result_type)
-            if child is None:
-                return
-            child, result_type = child
-            node.add_child(child)
+            node = self.list_tail(node)
 
-            return node, result_type
-        elif self.curr_token.token_type in {
-            tt.SEMICOLON,
-            tt.COMMA,
-            tt.ROUND_BRACKET_CLOSE,
-            tt.SQUARE_BRACKET_CLOSE,
-            tt.COLON,
-            tt.LOGICAL_AND,
-            tt.LOGICAL_OR,
-        }:
-            node.add_child(TreeNode("null"))
-            return node, left_operand_type
+        if self.curr_bit & FOLLOW_RELATIONAL_EXPRESSION:
+            node.add_child(self.new_node("null"))
+            return head, left_operand_type
 
         self.display_error(
             "expected a rel. operator or expected relational expression to end"
@@ -2901,7 +3090,7 @@ class Parser:
         # return TreeNode("error")
 
     def parse_plus_minus_exp(self):
-        node = TreeNode("plus_minus_exp")
+        node = self.new_node("plus_minus_exp")
 
         child = self.parse_mul_div_mod_exp()
         if child is None:
@@ -2918,10 +3107,12 @@ class Parser:
         return node, result_type
 
     def parse_plus_minus_exp_2(self, left_operand_type: TypeInfo):
-        node = TreeNode("plus_minus_exp_2")
-        if self.curr_token.token_type == tt.PLUS_MINUS:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
-            node.add_child(child)
+        head = node = self.new_node("plus_minus_exp_2")
+        while self.curr_token.token_type == tt.PLUS_MINUS:
+            operator_node = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
+            node.add_child(operator_node)
             operator = self.curr_token.value
             self.advance()
 
@@ -2939,33 +3130,21 @@ class Parser:
                     f"Unsupported operator({operator}) for operands of type {left_operand_type} and {right_operand_type}"
                 )
                 return
+            self.record_type(operator_node, result_type)
+            left_operand_type = result_type
 
-            child = self.parse_plus_minus_exp_2(result_type)
-            if child is None:
-                return
-            child, result_type = child
-            node.add_child(child)
+            node = self.list_tail(node)
 
-            return node, result_type
-        elif self.curr_token.token_type in {
-            tt.SEMICOLON,
-            tt.COMMA,
-            tt.ROUND_BRACKET_CLOSE,
-            tt.SQUARE_BRACKET_CLOSE,
-            tt.COLON,
-            tt.RELATIONAL_OPERATOR,
-            tt.LOGICAL_AND,
-            tt.LOGICAL_OR,
-        }:
-            node.add_child(TreeNode("null"))
-            return node, left_operand_type
+        if self.curr_bit & FOLLOW_PLUS_MINUS_EXP:
+            node.add_child(self.new_node("null"))
+            return head, left_operand_type
 
         self.display_error("expected '+', '-' or expected plus minus expression to end")
         # self.advance()
         # return TreeNode("error")
 
     def parse_mul_div_mod_exp(self):
-        node = TreeNode("mul_div_mod_exp")
+        node = self.new_node("mul_div_mod_exp")
 
         child = self.parse_factor()
         if child is None:
@@ -2982,10 +3161,12 @@ class Parser:
         return node, result_type
 
     def parse_mul_div_mod_exp_2(self, left_operand_type: TypeInfo):
-        node = TreeNode("mul_div_mod_exp_2")
-        if self.curr_token.token_type in {tt.POINTER_MULTIPLY, tt.DIVIDE_MODULUS}:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
-            node.add_child(child)
+        head = node = self.new_node("mul_div_mod_exp_2")
+        while self.curr_bit & MUL_DIV_MOD_OPERATORS:
+            operator_node = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
+            node.add_child(operator_node)
             operator = self.curr_token.value
             self.advance()
 
@@ -3003,27 +3184,14 @@ class Parser:
                     f"Unsupported operator({operator}) for operands of type {left_operand_type} and {right_operand_type}"
                 )
                 return
+            self.record_type(operator_node, result_type)
+            left_operand_type = result_type
 
-            child = self.parse_mul_div_mod_exp_2(result_type)
-            if child is None:
-                return
-            child, result_type = child
-            node.add_child(child)
+            node = self.list_tail(node)
 
-            return node, result_type
-        elif self.curr_token.token_type in {
-            tt.SEMICOLON,
-            tt.COMMA,
-            tt.ROUND_BRACKET_CLOSE,
-            tt.SQUARE_BRACKET_CLOSE,
-            tt.COLON,
-            tt.PLUS_MINUS,
-            tt.RELATIONAL_OPERATOR,
-            tt.LOGICAL_AND,
-            tt.LOGICAL_OR,
-        }:
-            node.add_child(TreeNode("null"))
-            return node, left_operand_type
+        if self.curr_bit & FOLLOW_MUL_DIV_MOD_EXP:
+            node.add_child(self.new_node("null"))
+            return head, left_operand_type
 
         self.display_error(
             "expected '*', '/', '%' or expected mul div mod expression to end"
@@ -3032,23 +3200,20 @@ class Parser:
         # return TreeNode("error")
 
     def parse_factor(self):
-        node = TreeNode("factor")
-        if self.curr_token.token_type in {tt.THIS, tt.SUPER, tt.IDENTIFIER}:
+        node = self.new_node("factor")
+        if self.curr_bit & FIRST_FUNCTION_CALL:
             child = self.parse_function_call()
             if child is None:
                 return
             child, result_type = child
             node.add_child(child)
 
+            self.record_type(node, result_type)
             return node, result_type
-        elif self.curr_token.token_type in {
-            tt.INTEGER_LITERAL,
-            tt.FLOAT_LITERAL,
-            tt.CHAR_LITERAL,
-            tt.STRING_LITERAL,
-            tt.BOOL_LITERAL,
-        }:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+        elif self.curr_bit & LITERALS:
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             if self.curr_token.token_type == tt.INTEGER_LITERAL:
                 result_type = TypeInfo("int")
@@ -3062,10 +3227,13 @@ class Parser:
                 result_type = TypeInfo("bool")
             self.advance()
 
+            self.record_type(node, result_type)
             return node, result_type
 
         elif self.curr_token.token_type == tt.ROUND_BRACKET_OPEN:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             self.advance()
 
@@ -3076,7 +3244,9 @@ class Parser:
             node.add_child(child)
 
             if self.curr_token.token_type == tt.ROUND_BRACKET_CLOSE:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 self.advance()
             else:
@@ -3085,10 +3255,13 @@ class Parser:
                 # return TreeNode("error")
                 return
 
+            self.record_type(node, result_type)
             return node, result_type
 
         elif self.curr_token.token_type == tt.NOT_OPERATOR:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             self.advance()
 
@@ -3107,23 +3280,25 @@ class Parser:
                 )
                 return
 
+            self.record_type(node, result_type)
             return node, result_type
-        elif self.curr_token.token_type in {tt.POINTER_MULTIPLY}:
+        elif self.curr_token.token_type == tt.POINTER_MULTIPLY:
             child = self.parse_pointer_dereferencing()
             if child is None:
                 return
             child, result_type = child
             node.add_child(child)
 
+            self.record_type(node, result_type)
             return node, result_type
-        # elif self.curr_token.token_type in {tt.OBJ_CREATOR}:
+        # elif self.curr_token.token_type == tt.OBJ_CREATOR:
         #     child = self.parse_object_creation()
         #     if child is None:
         #         return
         #     node.add_child(child)
 
         # return node
-        # elif self.curr_token.token_type in {tt.SQUARE_BRACKET_OPEN}:
+        # elif self.curr_token.token_type == tt.SQUARE_BRACKET_OPEN:
         #     child = self.parse_array_initialization()
         #     if child is None:
         #         return
@@ -3136,8 +3311,8 @@ class Parser:
         # return TreeNode("error")
 
     def parse_function_call(self):
-        node = TreeNode("function_call")
-        if self.curr_token.token_type in {tt.THIS, tt.SUPER, tt.IDENTIFIER}:
+        node = self.new_node("function_call")
+        if self.curr_bit & FIRST_FUNCTION_CALL:
             child = self.parse_this_super_optional()
             if child is None:
                 return
@@ -3145,9 +3320,12 @@ class Parser:
             node.add_child(child)
 
             if self.curr_token.token_type == tt.IDENTIFIER:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 name = self.curr_token.value
+                name_id = self.curr_symbol_id
                 self.advance()
             else:
                 self.display_error("expected an identifier")
@@ -3182,12 +3360,12 @@ class Parser:
                 #     return
                 # type = table_entry.type.var_type
             # else:
-            #     type = self.st_manager.lookup_scope_table(name)
+            #     type = self.st_manager.lookup_scope_table(name, name_id)
             #     if type is None:
             #         self.display_semantic_error(f"Undeclared variable {name}")
             #         return
 
-            child = self.parse_chaining(name, ref)
+            child = self.parse_chaining(name, name_id, ref)
             if child is None:
                 return
             child, type = child
@@ -3199,14 +3377,16 @@ class Parser:
         # self.advance()
         # return TreeNode("error")
 
-    def parse_chaining(self, name, class_name, is_static = False):
-        node = TreeNode("chaining")
-        if self.curr_token.token_type in {tt.DOT, tt.ARROW}:
+    def parse_chaining(self, name, name_id, class_name, is_static = False):
+        node = self.new_node("chaining")
+        if self.curr_bit & DOT_ARROW:
             static_class_name = None
             if class_name is None:
-                var_type = self.st_manager.lookup_scope_table(name)
+                var_type = self.st_manager.lookup_scope_table(name, name_id)
                 if var_type is None:
-                    def_table_entry = self.st_manager.lookup_definition_table(name)
+                    def_table_entry = self.st_manager.lookup_definition_table(
+                        name, name_id
+                    )
                     if def_table_entry is None:
                         self.display_semantic_error(f"Undeclared variable {name}")
                         return
@@ -3224,7 +3404,7 @@ class Parser:
                 return
             else:
                 member_table_entry = self.st_manager.lookup_member_table(
-                    name, class_name
+                    name, class_name, name_id
                 )
                 if member_table_entry is None:
                     self.display_semantic_error(
@@ -3263,9 +3443,12 @@ class Parser:
             node.add_child(child)
 
             if self.curr_token.token_type == tt.IDENTIFIER:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 name = self.curr_token.value
+                name_id = self.curr_symbol_id
                 self.advance()
             else:
                 self.display_error("expected an identifier")
@@ -3274,7 +3457,7 @@ class Parser:
                 return
 
             class_name = static_class_name if is_static else var_type.data_type
-            child = self.parse_chaining(name, class_name, is_static)
+            child = self.parse_chaining(name, name_id, class_name, is_static)
             if child is None:
                 return
             child, type = child
@@ -3282,9 +3465,9 @@ class Parser:
 
             return node, type
 
-        elif self.curr_token.token_type in {tt.SQUARE_BRACKET_OPEN}:
+        elif self.curr_token.token_type == tt.SQUARE_BRACKET_OPEN:
             if class_name is None:
-                var_type = self.st_manager.lookup_scope_table(name)
+                var_type = self.st_manager.lookup_scope_table(name, name_id)
                 if var_type is None:
                     self.display_semantic_error(f"Undeclared variable {name}")
                     return
@@ -3296,7 +3479,7 @@ class Parser:
                 return
             else:
                 member_table_entry = self.st_manager.lookup_member_table(
-                    name, class_name
+                    name, class_name, name_id
                 )
                 if member_table_entry is None:
                     self.display_semantic_error(
@@ -3347,7 +3530,7 @@ class Parser:
             node.add_child(child)
 
             return node, type
-        elif self.curr_token.token_type in {tt.ROUND_BRACKET_OPEN}:
+        elif self.curr_token.token_type == tt.ROUND_BRACKET_OPEN:
             param_type_list = []
             child = self.parse_func_args(param_type_list)
             if child is None:
@@ -3358,11 +3541,12 @@ class Parser:
                 class_name = self.st_manager.current_def_name
 
             member_table_entry = self.st_manager.lookup_member_table_func(
-                name, param_type_list, class_name
+                name, param_type_list, class_name, name_id
             )
             if member_table_entry is None:
                 self.display_semantic_error("Undeclared method error")
                 return
+            self.record_type(child, member_table_entry.type.func_return_type)
 
             child = self.parse_chaining_2(member_table_entry.type.func_return_type)
             if child is None:
@@ -3371,21 +3555,9 @@ class Parser:
             node.add_child(child)
 
             return node, type
-        elif self.curr_token.token_type in {
-            tt.POINTER_MULTIPLY,
-            tt.DIVIDE_MODULUS,
-            tt.PLUS_MINUS,
-            tt.RELATIONAL_OPERATOR,
-            tt.LOGICAL_AND,
-            tt.LOGICAL_OR,
-            tt.SEMICOLON,
-            tt.COMMA,
-            tt.ROUND_BRACKET_CLOSE,
-            tt.SQUARE_BRACKET_CLOSE,
-            tt.COLON,
-        }:
+        elif self.curr_bit & FOLLOW_FACTOR:
             if class_name is None:
-                var_type = self.st_manager.lookup_scope_table(name)
+                var_type = self.st_manager.lookup_scope_table(name, name_id)
                 if var_type is None:
                     self.display_semantic_error(f"Undeclared variable {name}")
                     return
@@ -3394,7 +3566,7 @@ class Parser:
                 return
             else:
                 member_table_entry = self.st_manager.lookup_member_table(
-                    name, class_name
+                    name, class_name, name_id
                 )
                 if member_table_entry is None:
                     self.display_semantic_error(
@@ -3426,7 +3598,7 @@ class Parser:
                 is_static = False
                 var_type = member_table_entry.type.var_type
 
-            node.add_child(TreeNode("null"))
+            node.add_child(self.new_node("null"))
             return node, var_type
 
         self.display_error("expected '->', '.', '[', '(' or expected expression to end")
@@ -3434,17 +3606,20 @@ class Parser:
         # return TreeNode("error")
 
     def parse_chaining_2(self, var_type: TypeInfo):
-        node = TreeNode("chaining_2")
-        if self.curr_token.token_type in {tt.DOT, tt.ARROW}:
+        node = self.new_node("chaining_2")
+        if self.curr_bit & DOT_ARROW:
             child = self.parse_dot_arrow(var_type)
             if child is None:
                 return
             node.add_child(child)
 
             if self.curr_token.token_type == tt.IDENTIFIER:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 name = self.curr_token.value
+                name_id = self.curr_symbol_id
                 self.advance()
             else:
                 self.display_error("expected an identifier")
@@ -3452,7 +3627,7 @@ class Parser:
                 # return TreeNode("error")
                 return
 
-            child = self.parse_chaining(name, var_type.data_type)
+            child = self.parse_chaining(name, name_id, var_type.data_type)
             if child is None:
                 return
             child, type = child
@@ -3460,7 +3635,7 @@ class Parser:
 
             return node, type
 
-        elif self.curr_token.token_type in {tt.SQUARE_BRACKET_OPEN}:
+        elif self.curr_token.token_type == tt.SQUARE_BRACKET_OPEN:
             if not var_type.is_array:
                 self.display_semantic_error(f"function does not returns an array")
                 return
@@ -3480,28 +3655,18 @@ class Parser:
 
             return node, type
 
-        elif self.curr_token.token_type in {
-            tt.POINTER_MULTIPLY,
-            tt.DIVIDE_MODULUS,
-            tt.PLUS_MINUS,
-            tt.RELATIONAL_OPERATOR,
-            tt.LOGICAL_AND,
-            tt.LOGICAL_OR,
-            tt.SEMICOLON,
-            tt.COMMA,
-            tt.ROUND_BRACKET_CLOSE,
-            tt.SQUARE_BRACKET_CLOSE,
-            tt.COLON,
-        }:
-            node.add_child(TreeNode("null"))
+        elif self.curr_bit & FOLLOW_FACTOR:
+            node.add_child(self.new_node("null"))
             return node, var_type
 
         self.display_error("expected '->', '.', '[', '(' or expected expression to end")
 
     def parse_chaining_3(self, var_type: TypeInfo, dimensions_indexed):
-        node = TreeNode("chaining_3")
-        if self.curr_token.token_type in {tt.DOT}:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+        node = self.new_node("chaining_3")
+        if self.curr_token.token_type == tt.DOT:
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             if var_type.is_pointer:
                 self.display_semantic_error("'.' cannot be used with pointer type")
@@ -3518,9 +3683,12 @@ class Parser:
             self.advance()
 
             if self.curr_token.token_type == tt.IDENTIFIER:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 name = self.curr_token.value
+                name_id = self.curr_symbol_id
                 self.advance()
             else:
                 self.display_error("expected an identifier")
@@ -3529,7 +3697,7 @@ class Parser:
                 return
 
             class_name = var_type.data_type
-            child = self.parse_chaining(name, class_name)
+            child = self.parse_chaining(name, name_id, class_name)
             if child is None:
                 return
             child, type = child
@@ -3537,34 +3705,24 @@ class Parser:
 
             return node, type
 
-        elif self.curr_token.token_type in {
-            tt.POINTER_MULTIPLY,
-            tt.DIVIDE_MODULUS,
-            tt.PLUS_MINUS,
-            tt.RELATIONAL_OPERATOR,
-            tt.LOGICAL_AND,
-            tt.LOGICAL_OR,
-            tt.SEMICOLON,
-            tt.COMMA,
-            tt.ROUND_BRACKET_CLOSE,
-            tt.SQUARE_BRACKET_CLOSE,
-            tt.COLON,
-        }:
+        elif self.curr_bit & FOLLOW_FACTOR:
             new_type = TypeInfo(var_type.data_type)
             new_type.dimensions = var_type.dimensions - dimensions_indexed
-            node.add_child(TreeNode("null"))
+            node.add_child(self.new_node("null"))
             return node, new_type
 
         self.display_error("expected '->', '.', '[', '(' or expected expression to end")
 
     def parse_array_indexing_1d(self, var_type: TypeInfo):
-        node = TreeNode("array_indexing_1d")
+        node = self.new_node("array_indexing_1d")
         if self.curr_token.token_type == tt.SQUARE_BRACKET_OPEN:
             if var_type.dimensions < 1:
                 self.display_semantic_error("cannot subscript array further")
                 return
 
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             self.advance()
 
@@ -3579,7 +3737,9 @@ class Parser:
                 return
 
             if self.curr_token.token_type == tt.SQUARE_BRACKET_CLOSE:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 self.advance()
             else:
@@ -3601,12 +3761,14 @@ class Parser:
         # return TreeNode("error")
 
     def parse_array_indexing_2d(self, var_type: TypeInfo):
-        node = TreeNode("array_indexing_2d")
+        node = self.new_node("array_indexing_2d")
         if self.curr_token.token_type == tt.SQUARE_BRACKET_OPEN:
             if var_type.dimensions < 2:
                 self.display_semantic_error("cannot subscript array further")
                 return
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             self.advance()
 
@@ -3621,7 +3783,9 @@ class Parser:
                 return
 
             if self.curr_token.token_type == tt.SQUARE_BRACKET_CLOSE:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 self.advance()
             else:
@@ -3638,22 +3802,8 @@ class Parser:
 
             return node, dimensions_indexed
 
-        elif self.curr_token.token_type in {
-            tt.DOT,
-            tt.ARROW,
-            tt.POINTER_MULTIPLY,
-            tt.DIVIDE_MODULUS,
-            tt.PLUS_MINUS,
-            tt.RELATIONAL_OPERATOR,
-            tt.LOGICAL_AND,
-            tt.LOGICAL_OR,
-            tt.SEMICOLON,
-            tt.COMMA,
-            tt.ROUND_BRACKET_CLOSE,
-            tt.SQUARE_BRACKET_CLOSE,
-            tt.COLON,
-        }:
-            node.add_child(TreeNode("null"))
+        elif self.curr_bit & FOLLOW_INDEXING:
+            node.add_child(self.new_node("null"))
             return node, 1
 
         self.display_error(
@@ -3663,12 +3813,14 @@ class Parser:
         # return TreeNode("error")
 
     def parse_array_indexing_3d(self, var_type: TypeInfo):
-        node = TreeNode("parse_array_indexing_3d")
+        node = self.new_node("parse_array_indexing_3d")
         if self.curr_token.token_type == tt.SQUARE_BRACKET_OPEN:
             if var_type.dimensions < 3:
                 self.display_semantic_error("cannot subscript array further")
                 return
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             self.advance()
 
@@ -3683,7 +3835,9 @@ class Parser:
                 return
 
             if self.curr_token.token_type == tt.SQUARE_BRACKET_CLOSE:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 self.advance()
             else:
@@ -3694,32 +3848,20 @@ class Parser:
 
             return node, 3
 
-        elif self.curr_token.token_type in {
-            tt.DOT,
-            tt.ARROW,
-            tt.POINTER_MULTIPLY,
-            tt.DIVIDE_MODULUS,
-            tt.PLUS_MINUS,
-            tt.RELATIONAL_OPERATOR,
-            tt.LOGICAL_AND,
-            tt.LOGICAL_OR,
-            tt.SEMICOLON,
-            tt.COMMA,
-            tt.ROUND_BRACKET_CLOSE,
-            tt.SQUARE_BRACKET_CLOSE,
-            tt.COLON,
-        }:
-            node.add_child(TreeNode("null"))
+        elif self.curr_bit & FOLLOW_INDEXING:
+            node.add_child(self.new_node("null"))
             return node, 2
 
         self.display_error(
             "expected '[' , '.' , an operator or an expression termination"
         )
 
-    def parse_pointer_dereferencing(self, result_type: TypeInfo):
-        node = TreeNode("pointer_dereferencing")
+    def parse_pointer_dereferencing(self):
+        node = self.new_node("pointer_dereferencing")
         if self.curr_token.token_type == tt.POINTER_MULTIPLY:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             self.advance()
 
@@ -3745,17 +3887,23 @@ class Parser:
         # return TreeNode("error")
 
     def parse_object_creation(self):
-        node = TreeNode("object_creation")
+        node = self.new_node("object_creation")
         if self.curr_token.token_type == tt.OBJ_CREATOR:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             self.advance()
 
             if self.curr_token.token_type == tt.IDENTIFIER:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 class_name = self.curr_token.value
-                def_table_entry = self.st_manager.lookup_definition_table(class_name)
+                def_table_entry = self.st_manager.lookup_definition_table(
+                    class_name, self.curr_symbol_id
+                )
                 if def_table_entry is None:
                     self.display_semantic_error(f"Undeclared definition {class_name}")
                     return
@@ -3797,20 +3945,8 @@ class Parser:
         # return TreeNode("error")
 
     def parse_expression_or_object_creation(self):
-        node = TreeNode("expression_or_object_creation")
-        if self.curr_token.token_type in {
-            tt.THIS,
-            tt.SUPER,
-            tt.IDENTIFIER,
-            tt.INTEGER_LITERAL,
-            tt.FLOAT_LITERAL,
-            tt.BOOL_LITERAL,
-            tt.CHAR_LITERAL,
-            tt.STRING_LITERAL,
-            tt.ROUND_BRACKET_OPEN,
-            tt.NOT_OPERATOR,
-            tt.POINTER_MULTIPLY,
-        }:
+        node = self.new_node("expression_or_object_creation")
+        if self.curr_bit & FIRST_EXPRESSION:
             child = self.parse_expression()
             if child is None:
                 return
@@ -3819,7 +3955,7 @@ class Parser:
 
             return node, result_type
         
-        elif self.curr_token.token_type in {tt.OBJ_CREATOR}:
+        elif self.curr_token.token_type == tt.OBJ_CREATOR:
             child = self.parse_object_creation()
             if child is None:
                 return
@@ -3830,9 +3966,11 @@ class Parser:
         self.display_error("expected expression or object creation")
 
     def parse_array_initialization(self):
-        node = TreeNode("array_initialization")
+        node = self.new_node("array_initialization")
         if self.curr_token.token_type == tt.SQUARE_BRACKET_OPEN:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             self.advance()
 
@@ -3847,7 +3985,9 @@ class Parser:
             # arr_type.dimensions += 1
 
             if self.curr_token.token_type == tt.SQUARE_BRACKET_CLOSE:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 self.advance()
             else:
@@ -3863,22 +4003,8 @@ class Parser:
         # return TreeNode("error")
 
     def parse_1d_array_elements(self):
-        node = TreeNode("1d_array_elements")
-        if self.curr_token.token_type in {
-            tt.THIS,
-            tt.SUPER,
-            tt.IDENTIFIER,
-            tt.INTEGER_LITERAL,
-            tt.FLOAT_LITERAL,
-            tt.BOOL_LITERAL,
-            tt.CHAR_LITERAL,
-            tt.STRING_LITERAL,
-            tt.ROUND_BRACKET_OPEN,
-            tt.NOT_OPERATOR,
-            tt.POINTER_MULTIPLY,
-            tt.OBJ_CREATOR,
-            tt.SQUARE_BRACKET_OPEN,
-        }:
+        node = self.new_node("1d_array_elements")
+        if self.curr_bit & FIRST_ARRAY_ELEMENT:
             child = self.parse_1d_array_element()
             if child is None:
                 return
@@ -3891,11 +4017,9 @@ class Parser:
                 return
             node.add_child(child)
 
-            arr_type_1d.dimensions +=1
-
-            return node, arr_type_1d
-        elif self.curr_token.token_type in {tt.SQUARE_BRACKET_CLOSE}:
-            node.add_child(TreeNode("null"))
+            return node, array_of(arr_type_1d)
+        elif self.curr_token.token_type == tt.SQUARE_BRACKET_CLOSE:
+            node.add_child(self.new_node("null"))
             arr_type_1d = TypeInfo()
             arr_type_1d.dimensions +=1
             return node, arr_type_1d
@@ -3905,21 +4029,8 @@ class Parser:
         # return TreeNode("error")
 
     def parse_1d_array_element(self, arr_type_1d: TypeInfo=None):
-        node = TreeNode("1d_array_element")
-        if self.curr_token.token_type in {
-            tt.THIS,
-            tt.SUPER,
-            tt.IDENTIFIER,
-            tt.INTEGER_LITERAL,
-            tt.FLOAT_LITERAL,
-            tt.BOOL_LITERAL,
-            tt.CHAR_LITERAL,
-            tt.STRING_LITERAL,
-            tt.ROUND_BRACKET_OPEN,
-            tt.NOT_OPERATOR,
-            tt.POINTER_MULTIPLY,
-            tt.OBJ_CREATOR,
-        }:
+        node = self.new_node("1d_array_element")
+        if self.curr_bit & FIRST_EXPRESSION_OR_OBJECT:
             child = self.parse_expression_or_object_creation()
             if child is None:
                 return
@@ -3950,7 +4061,9 @@ class Parser:
             return node, result_type
 
         elif self.curr_token.token_type == tt.SQUARE_BRACKET_OPEN:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             self.advance()
 
@@ -3972,7 +4085,9 @@ class Parser:
 
 
             if self.curr_token.token_type == tt.SQUARE_BRACKET_CLOSE:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 self.advance()
             else:
@@ -3981,6 +4096,7 @@ class Parser:
                 # return TreeNode("error")
                 return
 
+            self.record_type(node, result_type)
             return node, result_type
 
         self.display_error("expected expression or '['")
@@ -3988,9 +4104,11 @@ class Parser:
         # return TreeNode("error")
 
     def parse_1d_array_elements_2(self, arr_type_1d: TypeInfo):
-        node = TreeNode("1d_array_elements_2")
-        if self.curr_token.token_type == tt.COMMA:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+        head = node = self.new_node("1d_array_elements_2")
+        while self.curr_token.token_type == tt.COMMA:
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             self.advance()
 
@@ -4000,37 +4118,18 @@ class Parser:
             child, arr_type_1d = child
             node.add_child(child)
 
-            child = self.parse_1d_array_elements_2(arr_type_1d)
-            if child is None:
-                return
-            node.add_child(child)
-
-            return node
+            node = self.list_tail(node)
 
-        elif self.curr_token.token_type in {tt.SQUARE_BRACKET_CLOSE}:
-            node.add_child(TreeNode("null"))
-            return node
+        if self.curr_token.token_type == tt.SQUARE_BRACKET_CLOSE:
+            node.add_child(self.new_node("null"))
+            return head
         self.display_error("expected expression or '[' or ']'")
         # self.advance()
         # return TreeNode("error")
 
     def parse_2d_array_elements(self):
-        node = TreeNode("2d_array_elements")
-        if self.curr_token.token_type in {
-            tt.THIS,
-            tt.SUPER,
-            tt.IDENTIFIER,
-            tt.INTEGER_LITERAL,
-            tt.FLOAT_LITERAL,
-            tt.BOOL_LITERAL,
-            tt.CHAR_LITERAL,
-            tt.STRING_LITERAL,
-            tt.ROUND_BRACKET_OPEN,
-            tt.NOT_OPERATOR,
-            tt.POINTER_MULTIPLY,
-            tt.OBJ_CREATOR,
-            tt.SQUARE_BRACKET_OPEN,
-        }:
+        node = self.new_node("2d_array_elements")
+        if self.curr_bit & FIRST_ARRAY_ELEMENT:
             child = self.parse_2d_array_element()
             if child is None:
                 return
@@ -4042,11 +4141,9 @@ class Parser:
                 return
             node.add_child(child)
 
-            arr_type_2d.dimensions +=1
-
-            return node, arr_type_2d
-        elif self.curr_token.token_type in {tt.SQUARE_BRACKET_CLOSE}:
-            node.add_child(TreeNode("null"))
+            return node, array_of(arr_type_2d)
+        elif self.curr_token.token_type == tt.SQUARE_BRACKET_CLOSE:
+            node.add_child(self.new_node("null"))
             arr_type_2d = TypeInfo()
             arr_type_2d.dimensions +=1
             return node, arr_type_2d
@@ -4056,21 +4153,8 @@ class Parser:
         # return TreeNode("error")
 
     def parse_2d_array_element(self, arr_type_2d: TypeInfo=None):
-        node = TreeNode("2d_array_element")
-        if self.curr_token.token_type in {
-            tt.THIS,
-            tt.SUPER,
-            tt.IDENTIFIER,
-            tt.INTEGER_LITERAL,
-            tt.FLOAT_LITERAL,
-            tt.BOOL_LITERAL,
-            tt.CHAR_LITERAL,
-            tt.STRING_LITERAL,
-            tt.ROUND_BRACKET_OPEN,
-            tt.NOT_OPERATOR,
-            tt.POINTER_MULTIPLY,
-            tt.OBJ_CREATOR,
-        }:
+        node = self.new_node("2d_array_element")
+        if self.curr_bit & FIRST_EXPRESSION_OR_OBJECT:
             child = self.parse_expression_or_object_creation()
             if child is None:
                 return
@@ -4101,7 +4185,9 @@ class Parser:
             return node, result_type
 
         elif self.curr_token.token_type == tt.SQUARE_BRACKET_OPEN:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             self.advance()
 
@@ -4123,7 +4209,9 @@ class Parser:
             #     arr_type.dimensions += 1
 
             if self.curr_token.token_type == tt.SQUARE_BRACKET_CLOSE:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 self.advance()
             else:
@@ -4132,6 +4220,7 @@ class Parser:
                 # return TreeNode("error")
                 return
 
+            self.record_type(node, result_type)
             return node, result_type
 
         self.display_error("expected expression or '['")
@@ -4139,9 +4228,11 @@ class Parser:
         # return TreeNode("error")
 
     def parse_2d_array_elements_2(self, arr_type_2d: TypeInfo):
-        node = TreeNode("2d_array_elements_2")
-        if self.curr_token.token_type == tt.COMMA:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+        head = node = self.new_node("2d_array_elements_2")
+        while self.curr_token.token_type == tt.COMMA:
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             self.advance()
 
@@ -4151,36 +4242,18 @@ class Parser:
             child, arr_type_2d = child
             node.add_child(child)
 
-            child = self.parse_2d_array_elements_2(arr_type_2d)
-            if child is None:
-                return
-            node.add_child(child)
+            node = self.list_tail(node)
 
-            return node
-
-        elif self.curr_token.token_type in {tt.SQUARE_BRACKET_CLOSE}:
-            node.add_child(TreeNode("null"))
-            return node
+        if self.curr_token.token_type == tt.SQUARE_BRACKET_CLOSE:
+            node.add_child(self.new_node("null"))
+            return head
         self.display_error("expected expression or '[' or ']'")
         # self.advance()
         # return TreeNode("error")
 
     def parse_3d_array_elements(self):
-        node = TreeNode("3d_array_elements")
-        if self.curr_token.token_type in {
-            tt.THIS,
-            tt.SUPER,
-            tt.IDENTIFIER,
-            tt.INTEGER_LITERAL,
-            tt.FLOAT_LITERAL,
-            tt.BOOL_LITERAL,
-            tt.CHAR_LITERAL,
-            tt.STRING_LITERAL,
-            tt.ROUND_BRACKET_OPEN,
-            tt.NOT_OPERATOR,
-            tt.POINTER_MULTIPLY,
-            tt.OBJ_CREATOR,
-        }:
+        node = self.new_node("3d_array_elements")
+        if self.curr_bit & FIRST_EXPRESSION_OR_OBJECT:
             child = self.parse_3d_array_element()
             if child is None:
                 return
@@ -4193,11 +4266,9 @@ class Parser:
                 return
             node.add_child(child)
 
-            arr_type_3d.dimensions +=1
-
-            return node, arr_type_3d
-        elif self.curr_token.token_type in {tt.SQUARE_BRACKET_CLOSE}:
-            node.add_child(TreeNode("null"))
+            return node, array_of(arr_type_3d)
+        elif self.curr_token.token_type == tt.SQUARE_BRACKET_CLOSE:
+            node.add_child(self.new_node("null"))
             arr_type_3d = TypeInfo()
             arr_type_3d.dimensions +=1
             return node, arr_type_3d
@@ -4207,21 +4278,8 @@ class Parser:
         # return TreeNode("error")
 
     def parse_3d_array_element(self, arr_type_3d: TypeInfo=None):
-        node = TreeNode("2d_array_element")
-        if self.curr_token.token_type in {
-            tt.THIS,
-            tt.SUPER,
-            tt.IDENTIFIER,
-            tt.INTEGER_LITERAL,
-            tt.FLOAT_LITERAL,
-            tt.BOOL_LITERAL,
-            tt.CHAR_LITERAL,
-            tt.STRING_LITERAL,
-            tt.ROUND_BRACKET_OPEN,
-            tt.NOT_OPERATOR,
-            tt.POINTER_MULTIPLY,
-            tt.OBJ_CREATOR,
-        }:
+        node = self.new_node("2d_array_element")
+        if self.curr_bit & FIRST_EXPRESSION_OR_OBJECT:
             child = self.parse_expression_or_object_creation()
             if child is None:
                 return
@@ -4257,48 +4315,32 @@ class Parser:
         # return TreeNode("error")
 
     def parse_3d_array_elements_2(self, arr_type_3d: TypeInfo):
-        node = TreeNode("3d_array_elements_2")
-        if self.curr_token.token_type == tt.COMMA:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+        head = node = self.new_node("3d_array_elements_2")
+        while self.curr_token.token_type == tt.COMMA:
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             self.advance()
 
             child = self.parse_3d_array_element(arr_type_3d)
             if child is None:
                 return
+            child, arr_type_3d = child
             node.add_child(child)
 
-            child = self.parse_3d_array_elements_2(arr_type_3d)
-            if child is None:
-                return
-            node.add_child(child)
-
-            return node
+            node = self.list_tail(node)
 
-        elif self.curr_token.token_type in {tt.SQUARE_BRACKET_CLOSE}:
-            node.add_child(TreeNode("null"))
-            return node
+        if self.curr_token.token_type == tt.SQUARE_BRACKET_CLOSE:
+            node.add_child(self.new_node("null"))
+            return head
         self.display_error("expected expression or '[' or ']'")
         # self.advance()
         # return TreeNode("error")
 
     def parse_array_elements(self):
-        node = TreeNode("array_elements")
-        if self.curr_token.token_type in {
-            tt.THIS,
-            tt.SUPER,
-            tt.IDENTIFIER,
-            tt.INTEGER_LITERAL,
-            tt.FLOAT_LITERAL,
-            tt.BOOL_LITERAL,
-            tt.CHAR_LITERAL,
-            tt.STRING_LITERAL,
-            tt.ROUND_BRACKET_OPEN,
-            tt.NOT_OPERATOR,
-            tt.POINTER_MULTIPLY,
-            # tt.OBJ_CREATOR,
-            # tt.SQUARE_BRACKET_OPEN,
-        }:
+        node = self.new_node("array_elements")
+        if self.curr_bit & FIRST_EXPRESSION:
             child = self.parse_expression()
             if child is None:
                 return
@@ -4311,8 +4353,8 @@ class Parser:
 
             return node
 
-        elif self.curr_token.token_type in {tt.SQUARE_BRACKET_CLOSE}:
-            node.add_child(TreeNode("null"))
+        elif self.curr_token.token_type == tt.SQUARE_BRACKET_CLOSE:
+            node.add_child(self.new_node("null"))
             return node
 
         self.display_error("expected an expression or ']'")
@@ -4320,9 +4362,11 @@ class Parser:
         # return TreeNode("error")
 
     def parse_array_element_list(self):
-        node = TreeNode("array_element_list")
+        node = self.new_node("array_element_list")
         if self.curr_token.token_type == tt.COMMA:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             self.advance()
 
@@ -4338,8 +4382,8 @@ class Parser:
 
             return node
 
-        elif self.curr_token.token_type in {tt.SQUARE_BRACKET_CLOSE}:
-            node.add_child(TreeNode("null"))
+        elif self.curr_token.token_type == tt.SQUARE_BRACKET_CLOSE:
+            node.add_child(self.new_node("null"))
             return node
 
         self.display_error("expected ',' or ']'")
@@ -4347,21 +4391,25 @@ class Parser:
         # return TreeNode("error")
 
     def parse_return_type(self, type: TypeInfo):
-        node = TreeNode("return_type")
-        if self.curr_token.token_type in {tt.DATA_TYPE, tt.IDENTIFIER}:
+        node = self.new_node("return_type")
+        if self.curr_bit & FIRST_TYPE:
             child = self.parse_type(type)
             if child is None:
                 return
             node.add_child(child)
 
+            self.record_type(node, type)
             return node
 
         elif self.curr_token.token_type == tt.VOID_TYPE:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             type.data_type = "void"
             self.advance()
 
+            self.record_type(node, type)
             return node
 
         self.display_error("expected a return type")
@@ -4369,13 +4417,20 @@ class Parser:
         # return TreeNode("error")
 
     def parse_type(self, type: TypeInfo):
-        node = TreeNode("type")
-        if self.curr_token.token_type in {tt.DATA_TYPE, tt.IDENTIFIER}:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+        node = self.new_node("type")
+        if self.curr_bit & FIRST_TYPE:
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             if self.curr_token.token_type == tt.IDENTIFIER:
                 class_name = self.curr_token.value
-                if self.st_manager.lookup_definition_table(class_name) is None:
+                if (
+                    self.st_manager.lookup_definition_table(
+                        class_name, self.curr_symbol_id
+                    )
+                    is None
+                ):
                     self.display_semantic_error(f"Undeclared definition {class_name}")
                     return
             type.data_type = self.curr_token.value
@@ -4386,6 +4441,7 @@ class Parser:
                 return
             node.add_child(child)
 
+            self.record_type(node, type)
             return node
 
         self.display_error("expected a type")
@@ -4393,16 +4449,18 @@ class Parser:
         # return TreeNode("error")
 
     def parse_type_2(self, type: TypeInfo):
-        node = TreeNode("type_2")
+        node = self.new_node("type_2")
         if self.curr_token.token_type == tt.POINTER_MULTIPLY:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             type.is_pointer = True
             self.advance()
 
             return node
 
-        elif self.curr_token.token_type in {tt.SQUARE_BRACKET_OPEN}:
+        elif self.curr_token.token_type == tt.SQUARE_BRACKET_OPEN:
             child = self.parse_array_type(type)
             if child is None:
                 return
@@ -4410,8 +4468,8 @@ class Parser:
 
             return node
 
-        elif self.curr_token.token_type in {tt.FUNCTION, tt.IDENTIFIER}:
-            node.add_child(TreeNode("null"))
+        elif self.curr_bit & FOLLOW_TYPE:
+            node.add_child(self.new_node("null"))
             return node
 
         self.display_error(
@@ -4421,9 +4479,11 @@ class Parser:
         # return TreeNode("error")
 
     def parse_array_type(self, type: TypeInfo):
-        node = TreeNode("array_type")
+        node = self.new_node("array_type")
         if self.curr_token.token_type == tt.SQUARE_BRACKET_OPEN:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             self.advance()
 
@@ -4433,7 +4493,9 @@ class Parser:
             node.add_child(child)
 
             if self.curr_token.token_type == tt.SQUARE_BRACKET_CLOSE:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 type.dimensions += 1
                 self.advance()
@@ -4455,9 +4517,11 @@ class Parser:
         # return TreeNode("error")
 
     def parse_array_dimension_list(self, type: TypeInfo):
-        node = TreeNode("array_dimension_list")
+        node = self.new_node("array_dimension_list")
         if self.curr_token.token_type == tt.SQUARE_BRACKET_OPEN:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             self.advance()
 
@@ -4467,7 +4531,9 @@ class Parser:
             node.add_child(child)
 
             if self.curr_token.token_type == tt.SQUARE_BRACKET_CLOSE:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 type.dimensions += 1
                 self.advance()
@@ -4484,8 +4550,8 @@ class Parser:
 
             return node
 
-        elif self.curr_token.token_type in {tt.FUNCTION, tt.IDENTIFIER}:
-            node.add_child(TreeNode("null"))
+        elif self.curr_bit & FOLLOW_TYPE:
+            node.add_child(self.new_node("null"))
             return node
 
         self.display_error("expected '[' or 'function' or an identifier")
@@ -4493,9 +4559,11 @@ class Parser:
         # return TreeNode("error")
 
     def parse_array_dimension_list_2(self, type: TypeInfo):
-        node = TreeNode("array_dimension_list_2")
+        node = self.new_node("array_dimension_list_2")
         if self.curr_token.token_type == tt.SQUARE_BRACKET_OPEN:
-            child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+            child = self.new_node(
+                self.curr_token.token_type.name, self.curr_token.value
+            )
             node.add_child(child)
             self.advance()
 
@@ -4505,7 +4573,9 @@ class Parser:
             node.add_child(child)
 
             if self.curr_token.token_type == tt.SQUARE_BRACKET_CLOSE:
-                child = TreeNode(self.curr_token.token_type.name, self.curr_token.value)
+                child = self.new_node(
+                    self.curr_token.token_type.name, self.curr_token.value
+                )
                 node.add_child(child)
                 type.dimensions += 1
                 self.advance()
@@ -4517,8 +4587,8 @@ class Parser:
 
             return node
 
-        elif self.curr_token.token_type in {tt.FUNCTION, tt.IDENTIFIER}:
-            node.add_child(TreeNode("null"))
+        elif self.curr_bit & FOLLOW_TYPE:
+            node.add_child(self.new_node("null"))
             return node
 
         self.display_error("expected '[' or 'function' or an identifier")
@@ -4526,22 +4596,8 @@ class Parser:
         # return TreeNode("error")
 
     def parse_expression_optional(self):
-        node = TreeNode("expression_optional")
-        if self.curr_token.token_type in {
-            tt.THIS,
-            tt.SUPER,
-            tt.IDENTIFIER,
-            tt.INTEGER_LITERAL,
-            tt.FLOAT_LITERAL,
-            tt.BOOL_LITERAL,
-            tt.CHAR_LITERAL,
-            tt.STRING_LITERAL,
-            tt.ROUND_BRACKET_OPEN,
-            tt.NOT_OPERATOR,
-            tt.POINTER_MULTIPLY,
-            # tt.OBJ_CREATOR,
-            # tt.SQUARE_BRACKET_OPEN,
-        }:
+        node = self.new_node("expression_optional")
+        if self.curr_bit & FIRST_EXPRESSION:
             child = self.parse_expression()
             if child is None:
                 return
@@ -4550,8 +4606,8 @@ class Parser:
 
             return node
 
-        elif self.curr_token.token_type in {tt.SQUARE_BRACKET_CLOSE}:
-            node.add_child(TreeNode("null"))
+        elif self.curr_token.token_type == tt.SQUARE_BRACKET_CLOSE:
+            node.add_child(self.new_node("null"))
             return node
 
         self.display_error("expected an expression or ']'")
@@ -0,0 +1,97 @@
+from lexer.token_type import TokenType as tt
+from parser.grammar import LITERALS as GRAMMAR_LITERALS, first_sets, follow_sets
+from typing import List, Set
+
+# A token type's kind code is its TokenType value, a small dense integer
+# (the same code TokenStream stores). A set of token types is then an int
+# with bit `code` set for each member, and a membership test is one mask
+# against the token's precomputed bit, with nothing allocated.
+KIND_BITS: List[int] = [0] * (max(token_type.value for token_type in tt) + 1)
+for token_type in tt:
+    KIND_BITS[token_type.value] = 1 << token_type.value
+
+
+def token_set(*token_types: tt) -> int:
+    mask = 0
+    for token_type in token_types:
+        mask |= KIND_BITS[token_type.value]
+    return mask
+
+
+def token_types(mask: int) -> List[tt]:
+    return [token_type for token_type in tt if mask & KIND_BITS[token_type.value]]
+
+
+# The prediction sets of the Parser, derived from the FIRST and FOLLOW sets
+# of parser.grammar so the two cannot drift apart.
+
+GRAMMAR_FIRST = first_sets()
+GRAMMAR_FOLLOW = follow_sets(GRAMMAR_FIRST)
+
+
+def names_set(names: Set[str]) -> int:
+    # "" marks a nullable nonterminal, not a token
+    return token_set(*(tt[name] for name in names if name))
+
+
+def first_set(nonterminal: str) -> int:
+    return names_set(GRAMMAR_FIRST[nonterminal])
+
+
+def follow_set(nonterminal: str) -> int:
+    return names_set(GRAMMAR_FOLLOW[nonterminal])
+
+
+def predict_set(nonterminal: str) -> int:
+    # the tokens a nonterminal may start with, or be followed by when it can
+    # derive nothing
+    mask = first_set(nonterminal)
+    if "" in GRAMMAR_FIRST[nonterminal]:
+        mask |= follow_set(nonterminal)
+    return mask
+
+
+FIRST_DEFINITION = first_set("class_int_struct_def")
+FIRST_PROGRAM = predict_set("program")
+FOLLOW_ACCESS_MOD = follow_set("access_mod_optional")
+FIRST_INHERIT_IMPLEMENT = predict_set("inherit_implement")
+FOLLOW_INHERIT = follow_set("inherit")
+
+FIRST_TYPE = first_set("type")
+FIRST_RETURN_TYPE = first_set("return_type")
+FOLLOW_STATIC = follow_set("static_optional")
+FIRST_FIELD_OR_METHOD = first_set("field_declaration_method_def")
+FIRST_CLASS_STRUCT_MEMBER = first_set("class_struct_member")
+FOLLOW_TYPE = follow_set("type")
+
+FIRST_ASSIGNMENT = first_set("assignment_statement")
+FIRST_STATEMENT = first_set("statement")
+FIRST_MULTIPLE_STATEMENTS = first_set("multiple_statements")
+# an else binds to the nearest if, so ELSE never ends the empty branch
+FOLLOW_ELSE = follow_set("else") & ~token_set(tt.ELSE)
+FOLLOW_INIT = follow_set("init")
+ASSIGNMENT_OPERATORS = first_set("assignment")
+DOT_ARROW = first_set("dot_arrow")
+
+LITERALS = names_set(set(GRAMMAR_LITERALS))
+FIRST_FUNCTION_CALL = first_set("function_call")
+FIRST_EXPRESSION = first_set("expression")
+FIRST_EXPRESSION_OR_OBJECT = first_set("expression_or_object_creation")
+FIRST_ARRAY_ELEMENT = first_set("1d_array_element")
+FIRST_VALUE = first_set("value")
+
+# what may follow each expression level, from the loosest binding
+EXPRESSION_END = follow_set("expression")
+FOLLOW_AND_EXPRESSION = follow_set("and_expression")
+FOLLOW_RELATIONAL_EXPRESSION = follow_set("relational_expression")
+FOLLOW_PLUS_MINUS_EXP = follow_set("plus_minus_exp")
+FOLLOW_MUL_DIV_MOD_EXP = follow_set("mul_div_mod_exp")
+MUL_DIV_MOD_OPERATORS = first_set("mul_div_mod_exp_2")
+FOLLOW_FACTOR = follow_set("factor")
+# Parser ends an index where a factor ends or at a member access. Unlike
+# the grammar's array_indexing_2d it does not end one at an assignment
+# operator, so this is not a FOLLOW set.
+FOLLOW_INDEXING = FOLLOW_FACTOR | DOT_ARROW
+
+# where error recovery gives up the definition it is in
+SYNC_DEFINITION = first_set("class_int_struct_def_2") | token_set(tt.EOF_MARKER)
@@ -18,3 +18,15 @@ class TreeNode:
         if self.children:
             node_dict["children"] = [child.jsonify() for child in self.children]
         return node_dict
+
+
+class NoNode:
+    # The one node Parser(mode="check") hands out in place of every tree
+    # node: adding children to it does nothing, so no tree is built.
+    __slots__ = ()
+
+    def add_child(self, child_node):
+        pass
+
+
+NO_NODE = NoNode()
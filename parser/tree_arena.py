@@ -0,0 +1,141 @@
+from lexer.interner import Interner
+from parser.tree import TreeNode
+from array import array
+from typing import Iterator, List
+
+# A parse tree kept in parallel arrays, one slot per node: the interned node
+# type, the interned value (-1 for none), and the first child, next sibling
+# and last child as node indexes (-1 for none). A node costs 18 bytes of
+# arrays instead of a TreeNode with its dict and children list.
+
+
+class ArenaNode:
+    # A handle to one node of a TreeArena, with the TreeNode interface.
+    # Handles are made on demand; two handles to one node are equal.
+    __slots__ = ("arena", "index")
+
+    def __init__(self, arena: "TreeArena", index: int) -> None:
+        self.arena = arena
+        self.index = index
+
+    @property
+    def node_type(self) -> str:
+        return self.arena.node_type_at(self.index)
+
+    @property
+    def value(self) -> str | None:
+        return self.arena.value_at(self.index)
+
+    @property
+    def children(self) -> List["ArenaNode"]:
+        return list(self.iter_children())
+
+    def iter_children(self) -> Iterator["ArenaNode"]:
+        arena = self.arena
+        for index in arena.child_indexes(self.index):
+            yield ArenaNode(arena, index)
+
+    def add_child(self, child_node: "ArenaNode"):
+        self.arena.add_child(self.index, child_node.index)
+
+    def jsonify(self):
+        return self.arena.jsonify(self.index)
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, ArenaNode)
+            and self.arena is other.arena
+            and self.index == other.index
+        )
+
+    def __hash__(self) -> int:
+        return hash((id(self.arena), self.index))
+
+    def __repr__(self) -> str:
+        return f"ArenaNode(node_type={self.node_type!r}, value={self.value!r})"
+
+
+class TreeArena:
+    def __init__(self) -> None:
+        self.node_types = Interner()
+        self.values = Interner()
+        self.kinds = array("H")
+        self.value_ids = array("i")
+        self.first_children = array("i")
+        self.next_siblings = array("i")
+        self.last_children = array("i")
+
+    @classmethod
+    def from_tree(cls, root: TreeNode) -> ArenaNode:
+        arena = cls()
+        root_index = arena.add(root.node_type, root.value)
+        stack = [(root, root_index)]
+        while stack:
+            node, index = stack.pop()
+            for child in node.children:
+                child_index = arena.add(child.node_type, child.value)
+                arena.add_child(index, child_index)
+                stack.append((child, child_index))
+        return ArenaNode(arena, root_index)
+
+    def add(self, node_type: str, value: str | None = None) -> int:
+        index = len(self.kinds)
+        self.kinds.append(self.node_types.intern(node_type))
+        self.value_ids.append(-1 if value is None else self.values.intern(value))
+        self.first_children.append(-1)
+        self.next_siblings.append(-1)
+        self.last_children.append(-1)
+        return index
+
+    def new_node(self, node_type: str, value: str | None = None) -> ArenaNode:
+        return ArenaNode(self, self.add(node_type, value))
+
+    def add_child(self, parent: int, child: int):
+        last_child = self.last_children[parent]
+        if last_child == -1:
+            self.first_children[parent] = child
+        else:
+            self.next_siblings[last_child] = child
+        self.last_children[parent] = child
+
+    def node_type_at(self, index: int) -> str:
+        return self.node_types.name_of(self.kinds[index])
+
+    def value_at(self, index: int) -> str | None:
+        value_id = self.value_ids[index]
+        return None if value_id == -1 else self.values.name_of(value_id)
+
+    def child_indexes(self, index: int) -> Iterator[int]:
+        next_siblings = self.next_siblings
+        child = self.first_children[index]
+        while child != -1:
+            yield child
+            child = next_siblings[child]
+
+    def jsonify(self, index: int):
+        node_dict = {
+            "node_type": self.node_type_at(index),
+        }
+        value = self.value_at(index)
+        if value is not None:
+            node_dict["value"] = value
+        if self.first_children[index] != -1:
+            node_dict["children"] = [
+                self.jsonify(child) for child in self.child_indexes(index)
+            ]
+        return node_dict
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def nbytes(self) -> int:
+        return sum(
+            column.itemsize * len(column)
+            for column in [
+                self.kinds,
+                self.value_ids,
+                self.first_children,
+                self.next_siblings,
+                self.last_children,
+            ]
+        )
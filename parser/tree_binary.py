@@ -0,0 +1,247 @@
+from parser.tree import TreeNode
+from array import array
+from typing import BinaryIO, Dict, Iterator, List
+import mmap
+import struct
+
+FORMAT_VERSION = 1
+MAGIC = b"PTB"
+# magic, format version, string count, node count, string table bytes
+HEADER = struct.Struct("<3sBIII")
+# bytes gathered before each write to the file
+WRITE_BATCH = 1 << 16
+
+# A binary parse tree file is the header, the string table and then the
+# nodes in preorder. The string table holds every node type and value once,
+# each as a varint byte length and its UTF-8 bytes. A node is four varints:
+# its type as a string number, its value as a string number + 1 (0 for
+# none), its child count and the byte size of its children, which follow
+# it. The byte size lets a reader step over a whole subtree.
+
+
+def encode_varint(value: int, out: bytearray):
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def varint_size(value: int) -> int:
+    size = 1
+    while value > 0x7F:
+        value >>= 7
+        size += 1
+    return size
+
+
+def decode_varint(data, position: int):
+    # the value at position and the position after it
+    value = shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+def write_binary(root: TreeNode, file: BinaryIO):
+    # Works out every node's fields and children size in one walk, keeping
+    # them in preorder arrays, then writes those out.
+    string_numbers: Dict[str, int] = {}
+
+    def string_number(string: str) -> int:
+        number = string_numbers.get(string)
+        if number is None:
+            number = string_numbers[string] = len(string_numbers)
+        return number
+
+    kinds = array("I")
+    values = array("I")
+    child_counts = array("I")
+    children_sizes = array("Q")
+
+    def add(node) -> int:
+        kinds.append(string_number(node.node_type))
+        values.append(0 if node.value is None else string_number(node.value) + 1)
+        child_counts.append(0)
+        children_sizes.append(0)
+        return len(kinds) - 1
+
+    # entries are (node index, iterator over its children)
+    stack = [(add(root), iter(root.children))]
+    while stack:
+        index, children = stack[-1]
+        child = next(children, None)
+        if child is not None:
+            stack.append((add(child), iter(child.children)))
+            continue
+        stack.pop()
+        if stack:
+            parent = stack[-1][0]
+            child_counts[parent] += 1
+            children_sizes[parent] += (
+                varint_size(kinds[index])
+                + varint_size(values[index])
+                + varint_size(child_counts[index])
+                + varint_size(children_sizes[index])
+                + children_sizes[index]
+            )
+
+    strings = bytearray()
+    for string in string_numbers:
+        encoded = string.encode("utf-8")
+        encode_varint(len(encoded), strings)
+        strings += encoded
+    file.write(
+        HEADER.pack(MAGIC, FORMAT_VERSION, len(string_numbers), len(kinds), len(strings))
+    )
+    file.write(strings)
+
+    out = bytearray()
+    for index in range(len(kinds)):
+        encode_varint(kinds[index], out)
+        encode_varint(values[index], out)
+        encode_varint(child_counts[index], out)
+        encode_varint(children_sizes[index], out)
+        if len(out) >= WRITE_BATCH:
+            file.write(out)
+            out.clear()
+    file.write(out)
+
+
+class BinaryNode:
+    # A node of a BinaryTree, with the TreeNode interface. Only the node's
+    # own four varints are decoded; children are found by stepping over
+    # their siblings' subtrees.
+    __slots__ = (
+        "tree",
+        "offset",
+        "kind",
+        "value_number",
+        "child_count",
+        "children_start",
+        "end",
+    )
+
+    def __init__(self, tree: "BinaryTree", offset: int) -> None:
+        data = tree.data
+        self.tree = tree
+        self.offset = offset
+        self.kind, position = decode_varint(data, offset)
+        self.value_number, position = decode_varint(data, position)
+        self.child_count, position = decode_varint(data, position)
+        children_size, position = decode_varint(data, position)
+        self.children_start = position
+        # where the subtree ends and the next sibling starts
+        self.end = position + children_size
+
+    @property
+    def node_type(self) -> str:
+        return self.tree.string(self.kind)
+
+    @property
+    def value(self) -> str | None:
+        if self.value_number == 0:
+            return None
+        return self.tree.string(self.value_number - 1)
+
+    @property
+    def children(self) -> List["BinaryNode"]:
+        return list(self.iter_children())
+
+    def iter_children(self) -> Iterator["BinaryNode"]:
+        offset = self.children_start
+        for _ in range(self.child_count):
+            child = BinaryNode(self.tree, offset)
+            yield child
+            offset = child.end
+
+    def child(self, index: int) -> "BinaryNode":
+        if not 0 <= index < self.child_count:
+            raise IndexError("child index out of range")
+        child = BinaryNode(self.tree, self.children_start)
+        for _ in range(index):
+            child = BinaryNode(self.tree, child.end)
+        return child
+
+    def jsonify(self):
+        node_dict = {
+            "node_type": self.node_type,
+        }
+        if self.value is not None:
+            node_dict["value"] = self.value
+        if self.child_count:
+            node_dict["children"] = [child.jsonify() for child in self.iter_children()]
+        return node_dict
+
+    def __repr__(self) -> str:
+        return f"BinaryNode(node_type={self.node_type!r}, value={self.value!r})"
+
+
+class BinaryTree:
+    # Reads a file from write_binary through mmap. Nothing is decoded up
+    # front: strings are decoded the first time they are asked for and
+    # nodes as they are visited.
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as file:
+            try:
+                self.data: bytes | mmap.mmap = mmap.mmap(
+                    file.fileno(), 0, access=mmap.ACCESS_READ
+                )
+            except ValueError:
+                # empty files cannot be mapped
+                self.data = b""
+
+        if len(self.data) < HEADER.size:
+            self.close()
+            raise ValueError(f"'{path}' is not a binary parse tree file")
+        magic, version, string_count, node_count, strings_size = (
+            HEADER.unpack_from(self.data)
+        )
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self.close()
+            raise ValueError(
+                f"'{path}' is not a binary parse tree file of version {FORMAT_VERSION}"
+            )
+        self.string_count = string_count
+        self.node_count = node_count
+        self.nodes_start = HEADER.size + strings_size
+        self.string_offsets: List[int] | None = None
+        self.strings: List[str | None] = [None] * string_count
+
+    @property
+    def root(self) -> BinaryNode:
+        return BinaryNode(self, self.nodes_start)
+
+    def string(self, number: int) -> str:
+        string = self.strings[number]
+        if string is None:
+            if self.string_offsets is None:
+                self.string_offsets = self.find_strings()
+            start = self.string_offsets[number]
+            length, start = decode_varint(self.data, start)
+            string = self.strings[number] = str(
+                self.data[start : start + length], "utf-8"
+            )
+        return string
+
+    def find_strings(self) -> List[int]:
+        offsets = []
+        position = HEADER.size
+        for _ in range(self.string_count):
+            offsets.append(position)
+            length, position = decode_varint(self.data, position)
+            position += length
+        return offsets
+
+    def close(self):
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+
+    def __enter__(self) -> "BinaryTree":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
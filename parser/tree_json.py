@@ -0,0 +1,66 @@
+from parser.tree import TreeNode
+from json.encoder import encode_basestring_ascii
+from typing import IO
+
+# pieces of JSON gathered before each write to the file
+WRITE_BATCH = 4096
+
+
+def write_json(root: TreeNode, file: IO[str], indent: int | None = None):
+    # Writes root.jsonify() to file as json.dump(..., indent=indent) would,
+    # without building the dicts or the string. The walk keeps a stack of
+    # child iterators, one per open node, so deep trees need no recursion.
+    separator = ", " if indent is None else ","
+
+    def newline(depth: int) -> str:
+        if indent is None:
+            return ""
+        return "\n" + " " * (indent * depth)
+
+    parts = []
+    stack = []
+    node, depth = root, 0
+    while node is not None:
+        parts.append(
+            "{"
+            + newline(depth + 1)
+            + '"node_type": '
+            + encode_basestring_ascii(node.node_type)
+        )
+        if node.value is not None:
+            parts.append(
+                separator
+                + newline(depth + 1)
+                + '"value": '
+                + encode_basestring_ascii(node.value)
+            )
+
+        children = iter(node.children)
+        child = next(children, None)
+        if child is not None:
+            parts.append(separator + newline(depth + 1) + '"children": [')
+            stack.append((children, depth))
+            depth += 2
+        else:
+            parts.append(newline(depth) + "}")
+            # close every node whose children are all written, up to the
+            # first one with a child left
+            while stack:
+                children, depth = stack[-1]
+                child = next(children, None)
+                if child is not None:
+                    parts.append(separator)
+                    depth += 2
+                    break
+                stack.pop()
+                parts.append(newline(depth + 1) + "]" + newline(depth) + "}")
+
+        if child is not None:
+            parts.append(newline(depth))
+        node = child
+
+        if len(parts) >= WRITE_BATCH:
+            file.write("".join(parts))
+            parts.clear()
+
+    file.write("".join(parts))
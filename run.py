@@ -1,8 +1,11 @@
 from lexer.lexer import Lexer
+from lexer.token_cache import TokenCache
 from lexer.token_type import TokenType as tt
 from parser.parser import Parser
+from parser.tree_binary import write_binary
+from parser.tree_json import write_json
 from tabulate import tabulate
-import json
+import os
 
 source_code = ""
 with open("./tests/test7.txt") as file:
@@ -10,7 +13,12 @@ with open("./tests/test7.txt") as file:
 
 
 lexer = Lexer(source_code)
-tokens = lexer.tokenize()
+# set LEXER_CACHE_DIR to reuse the tokens of unchanged sources across runs
+cache_dir = os.environ.get("LEXER_CACHE_DIR")
+if cache_dir:
+    tokens = lexer.tokenize_cached(TokenCache(cache_dir))
+else:
+    tokens = lexer.tokenize()
 
 token_tuples = []
 for token_obj in tokens:
@@ -35,12 +43,14 @@ with open("./output/tokenization.txt", "w") as file:
 
 print()
 
-parser = Parser(tokens)
+parser = Parser(tokens, lexer.interner, lexer.line_index, recover_errors=True)
 parse_tree = parser.parse()
 
 if parse_tree is not None:
     with open("./output/parse_tree.json", "w") as file:
-        file.write(json.dumps(parse_tree.jsonify(), indent=3))
+        write_json(parse_tree, file, indent=3)
+    with open("./output/parse_tree.bin", "wb") as file:
+        write_binary(parse_tree, file)
 
 
 with open("./output/symbol_tables.txt", "w") as file:
@@ -1,4 +1,5 @@
 from typing import List, Dict, Tuple
+from lexer.interner import Interner
 from semantics.utils import (
     DefinitionTableEntry,
     MemberTableEntry,
@@ -9,11 +10,17 @@ from tabulate import tabulate
 
 
 class SymbolTableManager:
-    def __init__(self) -> None:
+    def __init__(self, interner: Interner | None = None) -> None:
         self.last_scope_num = 0
         self.scope_stack: List[int] = []
         self.scope_table: List[ScopeTableEntry] = []
         self.definition_table: List[DefinitionTableEntry] = []
+        # Names are compared by their Interner ID; the lexer's interner can
+        # be shared so identifiers arrive already interned.
+        self.interner = interner if interner is not None else Interner()
+        self.constructor_id = self.interner.intern("constructor")
+        self.scope_index: Dict[Tuple[int, int], ScopeTableEntry] = {}
+        self.definition_index: Dict[int, DefinitionTableEntry] = {}
         self.current_def_name: str | None = None
         self.is_curr_def_class = False
         self.is_main_found = False
@@ -32,13 +39,13 @@ class SymbolTableManager:
     def check_constructor_exist(self):
         def_table = self.lookup_definition_table(self.current_def_name)
         for entry in def_table.member_table:
-            if entry.name == "constructor" and entry.type.is_function:
+            if entry.name_id == self.constructor_id and entry.type.is_function:
                 return True
 
         while def_table.parent_class is not None:
             def_table = self.lookup_definition_table(def_table.parent_class)
             for entry in def_table.member_table:
-                if entry.name == "constructor" and entry.type.is_function:
+                if entry.name_id == self.constructor_id and entry.type.is_function:
                     return True
 
         return False
@@ -63,32 +70,48 @@ class SymbolTableManager:
                     break
         return True, None
 
-    def insert_into_scope_table(self, scope_table_entry: ScopeTableEntry) -> bool:
+    def name_id_of(self, name: str, name_id: int | None) -> int | None:
+        # name_id is the lexer's Token.symbol_id, passed when the tables
+        # share its interner; otherwise the name is looked up
+        return name_id if name_id is not None else self.interner.lookup(name)
+
+    def insert_into_scope_table(
+        self, scope_table_entry: ScopeTableEntry, name_id: int | None = None
+    ) -> bool:
         scope_table_entry.scope, _ = self.scope_stack[-1]
-        for entry in self.scope_table:
-            if (
-                entry.name == scope_table_entry.name
-                and entry.scope == scope_table_entry.scope
-            ):
-                return False
+        if name_id is None:
+            name_id = self.interner.intern(scope_table_entry.name)
+        scope_table_entry.name_id = name_id
+        key = (scope_table_entry.name_id, scope_table_entry.scope)
+        if key in self.scope_index:
+            return False
 
         self.scope_table.append(scope_table_entry)
+        self.scope_index[key] = scope_table_entry
         return True
 
     def insert_into_definition_table(
-        self, def_table_entry: DefinitionTableEntry
+        self, def_table_entry: DefinitionTableEntry, name_id: int | None = None
     ) -> bool:
-        for entry in self.definition_table:
-            if entry.name == def_table_entry.name:
-                return False
+        if name_id is None:
+            name_id = self.interner.intern(def_table_entry.name)
+        def_table_entry.name_id = name_id
+        if def_table_entry.name_id in self.definition_index:
+            return False
 
         self.definition_table.append(def_table_entry)
+        self.definition_index[def_table_entry.name_id] = def_table_entry
         return True
 
-    def insert_into_member_table(self, member_table_entry: MemberTableEntry) -> bool:
+    def insert_into_member_table(
+        self, member_table_entry: MemberTableEntry, name_id: int | None = None
+    ) -> bool:
         member_table = self.lookup_definition_table(self.current_def_name).member_table
+        if name_id is None:
+            name_id = self.interner.intern(member_table_entry.name)
+        member_table_entry.name_id = name_id
         for entry in member_table:
-            if entry.name == member_table_entry.name:
+            if entry.name_id == member_table_entry.name_id:
                 if (
                     not entry.type.is_function
                     or not member_table_entry.type.is_function
@@ -109,37 +132,42 @@ class SymbolTableManager:
                 return True
         return False
 
-    def lookup_scope_table(self, name) -> TypeInfo:
+    def lookup_scope_table(self, name, name_id: int | None = None) -> TypeInfo:
+        name_id = self.name_id_of(name, name_id)
         for scope, _ in self.scope_stack[::-1]:
-            for entry in self.scope_table:
-                if entry.name == name and entry.scope == scope:
-                    return entry.type
+            entry = self.scope_index.get((name_id, scope))
+            if entry is not None:
+                return entry.type
 
-    def lookup_definition_table(self, name) -> DefinitionTableEntry:
-        for entry in self.definition_table:
-            if entry.name == name:
-                return entry
+    def lookup_definition_table(
+        self, name, name_id: int | None = None
+    ) -> DefinitionTableEntry:
+        return self.definition_index.get(self.name_id_of(name, name_id))
 
-    def lookup_member_table(self, name, def_ref) -> MemberTableEntry:
+    def lookup_member_table(
+        self, name, def_ref, name_id: int | None = None
+    ) -> MemberTableEntry:
+        name_id = self.name_id_of(name, name_id)
         def_table = self.lookup_definition_table(def_ref)
         for entry in def_table.member_table:
-            if entry.name == name:
+            if entry.name_id == name_id:
                 if not entry.type.is_function:
                     return entry
 
         while def_table.parent_class is not None:
             def_table = self.lookup_definition_table(def_table.parent_class)
             for entry in def_table.member_table:
-                if entry.name == name:
+                if entry.name_id == name_id:
                     if not entry.type.is_function:
                         return entry
 
     def lookup_member_table_func(
-        self, name, param_type_list, def_ref
+        self, name, param_type_list, def_ref, name_id: int | None = None
     ) -> MemberTableEntry:
+        name_id = self.name_id_of(name, name_id)
         def_table = self.lookup_definition_table(def_ref)
         for entry in def_table.member_table:
-            if entry.name == name:
+            if entry.name_id == name_id:
                 if (
                     entry.type.is_function
                     and entry.type.func_param_type_list == param_type_list
@@ -149,7 +177,7 @@ class SymbolTableManager:
         while def_table.parent_class is not None:
             def_table = self.lookup_definition_table(def_table.parent_class)
             for entry in def_table.member_table:
-                if entry.name == name:
+                if entry.name_id == name_id:
                     if (
                         entry.type.is_function
                         and entry.type.func_param_type_list == param_type_list
@@ -55,12 +55,14 @@ class MemberType:
 
 class ScopeTableEntry:
     name: str
+    name_id: int
     type: TypeInfo
     scope: int
 
 
 class MemberTableEntry:
     name: str
+    name_id: int
     type: MemberType
     access_modifier: str
     is_static: bool
@@ -73,6 +75,7 @@ class MemberTableEntry:
 
 class DefinitionTableEntry:
     name: str
+    name_id: int
     type: str
     access_modifier: str
     parent_class: str